@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.log_query import create_log_query
+from syslog_manager.query_filter import QueryFilter
+
+# Syslog timestamps are read in the current year
+START = datetime(datetime.now().year, 6, 20)
+END = datetime(datetime.now().year, 7, 1)
+
+
+def chained(process, keyword):
+    # Previous workflow: one query per predicate, the outputs intersected like a grep pipeline
+    def run_queries(path):
+        log_query = create_log_query(Path(path))
+        logs = log_query.query_logs_by_process(process).split('\n')
+        with_words = set(log_query.query_logs_by_words([keyword]).split('\n'))
+        in_range = set(log_query.query_logs_between_timestamps(START, END).split('\n'))
+        return sum(1 for log in logs if log in with_words and log in in_range)
+    return run_queries
+
+
+def composite(process, keyword):
+    def run_query(path):
+        query_filter = QueryFilter(start_timestamp=START, end_timestamp=END, process=process, keywords=[keyword])
+        return sum(1 for _ in create_log_query(Path(path)).query(query_filter))
+    return run_query
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chained single predicate queries versus one composite query")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    parser.add_argument('--process', type=str, default='sshd', help='Process to query')
+    parser.add_argument('--keyword', type=str, default='failure', help='Word to search for')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        chained_time = run('chained', chained(args.process, args.keyword), path, args.lines)
+        composite_time = run('composite', composite(args.process, args.keyword), path, args.lines)
+        print(f"speedup: {chained_time / composite_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.compressed import COMPRESSED_OPENERS
+from syslog_manager.count_event_per_process import count_event_per_process
+from syslog_manager.utility import parse_lines
+
+COMPRESSED_WRITERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def decompress_to_disk(path):
+    # Previous workflow: the log is decompressed to a file, which is then read
+    plain_path = path + '.log'
+    with COMPRESSED_OPENERS[os.path.splitext(path)[1]](path, 'rb') as f_in, open(plain_path, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    try:
+        return sum(count_event_per_process(plain_path).values())
+    finally:
+        os.remove(plain_path)
+
+
+def inline_decompression(path):
+    # Decompression and parsing take turns in one thread
+    with COMPRESSED_OPENERS[os.path.splitext(path)[1]](path, 'rt', encoding='utf-8') as f:
+        return sum(1 for _ in parse_lines(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Counting events of a compressed log, decompressed in several ways")
+    parser.add_argument('--lines', type=int, default=1_000_000, help='Number of lines to generate')
+    parser.add_argument('--formats', nargs='+', default=['.gz', '.bz2', '.xz'], choices=sorted(COMPRESSED_WRITERS),
+                        help='Compressed formats to measure')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+        for suffix in args.formats:
+            compressed_path = path + suffix
+            with open(path, 'rb') as f_in, COMPRESSED_WRITERS[suffix](compressed_path, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            print(suffix)
+            run('  to disk first', decompress_to_disk, compressed_path, args.lines)
+            run('  inline', inline_decompression, compressed_path, args.lines)
+            run('  background thread', lambda p: sum(count_event_per_process(p).values()), compressed_path,
+                args.lines)
+
+
+if __name__ == "__main__":
+    main()
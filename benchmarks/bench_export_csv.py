@@ -0,0 +1,59 @@
+import argparse
+import csv
+import os
+import sys
+import tempfile
+
+from pycsvschema.checker import Validator
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.exporter import CSVSyslogExporter
+
+
+def legacy_export(path):
+    # Export as it was before: write the whole CSV, then re-read it with pycsvschema
+    exporter = CSVSyslogExporter(path, validate='off')
+    output_file = f"{path}.legacy.csv"
+    with open(output_file, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=['timestamp', 'hostname', 'process', 'pid', 'message'])
+        writer.writeheader()
+        writer.writerows(exporter.parsed_data)
+    Validator(csvfile=output_file, schema=exporter._create_schema()).validate()
+    return len(exporter.parsed_data)
+
+
+def inline_export(validate, num_records):
+    def export(path):
+        exporter = CSVSyslogExporter(path, streaming=True, validate=validate)
+        exporter.export(f"{path}.{validate}.csv")
+        return num_records
+    return export
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV export benchmark")
+    parser.add_argument('--lines', type=int, default=200_000, help='Number of lines to generate')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        num_records = sum(1 for _ in CSVSyslogExporter(path, streaming=True)._iter_parsed_syslog())
+
+        legacy = run('write + re-read', legacy_export, path, args.lines)
+        for validate in ('full', 'sample', 'off'):
+            current = run(f'inline {validate}', inline_export(validate, num_records), path, args.lines)
+            print(f"speedup ({validate}): {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file
+from syslog_manager.exporter import JSONArrayWriter, JSONLinesWriter, JSONSyslogExporter, WRITE_BUFFER_SIZE
+
+
+def legacy_dump(records, path):
+    with open(path, 'w') as f:
+        json.dump(records, f, indent=4)
+
+
+def write_with(writer_factory):
+    def write(records, path):
+        with open(path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = writer_factory(f)
+            for start in range(0, len(records), 10000):
+                writer.write_records(records[start:start + 10000])
+            writer.close()
+    return write
+
+
+def raw_copy(source):
+    # Reference: write the same number of bytes with no encoding work at all
+    def write(records, path):
+        with open(source, 'rb') as src, open(path, 'wb') as dst:
+            while True:
+                block = src.read(WRITE_BUFFER_SIZE)
+                if not block:
+                    break
+                dst.write(block)
+    return write
+
+
+def run(name, func, records, path):
+    start = time.perf_counter()
+    func(records, path)
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(path) / (1 << 20)
+    print(f"{name:<20} {size_mb:>10.1f} MB  {elapsed:8.2f} s  {size_mb / elapsed:>10.1f} MB/s  "
+          f"{len(records) / elapsed:>12,.0f} records/s")
+    os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON export writer benchmark")
+    parser.add_argument('--lines', type=int, default=1_000_000, help='Number of lines to generate')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(log_path, args.lines)
+        records = JSONSyslogExporter(log_path).parsed_data
+
+        output = os.path.join(tmp_dir, 'out.json')
+        reference = os.path.join(tmp_dir, 'reference.json')
+        write_with(lambda f: JSONArrayWriter(f, indent=4))(records, reference)
+
+        run('json.dump indent=4', legacy_dump, records, output)
+        run('writer indent=4', write_with(lambda f: JSONArrayWriter(f, indent=4)), records, output)
+        run('writer compact', write_with(lambda f: JSONArrayWriter(f, indent=None)), records, output)
+        run('writer jsonl', write_with(JSONLinesWriter), records, output)
+        run('raw copy', raw_copy(reference), records, output)
+
+
+if __name__ == "__main__":
+    main()
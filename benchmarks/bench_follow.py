@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file
+from syslog_manager.follow import POLL_INTERVAL, follow_query
+from syslog_manager.query_filter import QueryFilter
+
+LINE = "Jun 14 15:16:01 combo sshd(pam_unix)[19939]: bench {number} {written}\n"
+
+
+async def measure(paths, duration, appends):
+    latencies = []
+    caught_up = []
+
+    def emit(logs):
+        now = time.perf_counter()
+        for log in logs:
+            if ' bench ' in log:
+                written = float(log.rsplit(' ', 1)[1])
+                if written:
+                    latencies.append(now - written)
+                else:
+                    caught_up.append(log)
+
+    # The existing lines are read first, the last one of each file tells when they are. The
+    # sample data does not end with a newline.
+    for path in paths:
+        with open(path, 'a') as f:
+            f.write('\n' + LINE.format(number=-1, written=0))
+    task = asyncio.ensure_future(follow_query(paths, QueryFilter(process="sshd"), emit))
+    while len(caught_up) < len(paths):
+        await asyncio.sleep(POLL_INTERVAL)
+    cpu_start = time.process_time()
+    for number in range(appends):
+        await asyncio.sleep(duration / appends)
+        with open(paths[number % len(paths)], 'a') as f:
+            f.write(LINE.format(number=number, written=time.perf_counter()))
+    await asyncio.sleep(2 * POLL_INTERVAL)
+    cpu = time.process_time() - cpu_start
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return latencies, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency and CPU use of following growing files")
+    parser.add_argument('--lines', type=int, default=100_000, help='Number of lines already in each file')
+    parser.add_argument('--files', type=int, default=8, help='Number of files followed at once')
+    parser.add_argument('--duration', type=float, default=5, help='Seconds during which lines are appended')
+    parser.add_argument('--appends', type=int, default=100, help='Number of lines appended')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [os.path.join(tmp_dir, f'bench{number}.log') for number in range(args.files)]
+        for path in paths:
+            generate_log_file(path, args.lines)
+
+        latencies, cpu = asyncio.run(measure(paths, args.duration, args.appends))
+        print(f"files followed        {args.files:>10}")
+        print(f"lines appended        {len(latencies):>10} / {args.appends}")
+        print(f"median latency        {statistics.median(latencies) * 1000:10.1f} ms")
+        print(f"max latency           {max(latencies) * 1000:10.1f} ms")
+        print(f"cpu while following   {cpu / args.duration * 100:10.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import tempfile
+from collections import defaultdict
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.hourly_report import BUCKET_WIDTHS, count_events_per_bucket, count_events_per_hour
+from syslog_manager.mapped_lines import iter_lines
+from syslog_manager.utility import parse_lines
+
+
+def parse_every_line(path):
+    # Previous implementation: full regex parse of every line, then the timestamp is split again
+    hourly_counts = defaultdict(int)
+    for record in parse_lines(iter_lines(path)):
+        hour = int(record.timestamp.split(' ')[2].split(':')[0])
+        if 0 <= hour < 24:
+            hourly_counts[hour] += 1
+    return sum(hourly_counts.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hourly report: parsed lines against the block histogram")
+    parser.add_argument('--lines', type=int, default=2_000_000, help='Number of lines to generate')
+    parser.add_argument('--input_file', type=str, help='Existing syslog file to use instead of a generated one')
+    parser.add_argument('--jobs', type=int, default=1, help='Number of processes of the histogram')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.input_file
+        if path is None:
+            path = os.path.join(tmp_dir, 'bench.log')
+            generate_log_file(path, args.lines)
+        size = os.path.getsize(path)
+
+        run('parse every line', parse_every_line, path, args.lines)
+        elapsed = run('hour of day', lambda p: sum(count_events_per_hour(p, jobs=args.jobs).values()), path,
+                      args.lines)
+        run('per process', lambda p: sum(sum(counts.values()) for counts in
+                                         count_events_per_hour(p, jobs=args.jobs, per_process=True).values()),
+            path, args.lines)
+        for name in ('minute', '5min', 'day'):
+            run(f'{name} buckets', lambda p: sum(count_events_per_bucket(p, BUCKET_WIDTHS[name],
+                                                                         jobs=args.jobs).values()),
+                path, args.lines)
+        print(f"hour of day: {size / elapsed / (1 << 20):,.0f} MB/s, "
+              f"{(10 << 30) / (size / elapsed):,.0f} s for 10 GB")
+
+
+if __name__ == "__main__":
+    main()
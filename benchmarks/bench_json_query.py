@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file
+from syslog_manager.exporter import JSONLinesSyslogExporter, JSONSyslogExporter
+from syslog_manager.log_query import create_log_query
+
+
+def loaded_query(path, process):
+    # Previous implementation: the whole array is decoded before the first match
+    with open(path, 'r') as f:
+        for entry in json.load(f):
+            if entry.get('process', '').startswith(process):
+                yield json.dumps(entry)
+
+
+def measure(name, logs):
+    # Timed without tracing, which slows the many small allocations of the streamed reader
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in logs():
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in logs():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:<12} {count:>10} results  first {first or 0:8.4f} s  total {elapsed:8.2f} s  "
+          f"peak {peak / 1e6:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON query with json.load versus the streaming reader")
+    parser.add_argument('--lines', type=int, default=200_000, help='Number of lines to generate')
+    parser.add_argument('--process', type=str, default='sshd', help='Process to query')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, 'bench.log')
+        json_path = Path(tmp_dir) / 'bench.json'
+        jsonl_path = Path(tmp_dir) / 'bench.jsonl'
+        generate_log_file(log_path, args.lines)
+        JSONSyslogExporter(log_path, streaming=True).export(json_path)
+        JSONLinesSyslogExporter(log_path, streaming=True).export(jsonl_path)
+
+        measure('json.load', lambda: loaded_query(json_path, args.process))
+        measure('streamed', lambda: create_log_query(json_path).iter_logs_by_process(args.process))
+        measure('jsonl', lambda: create_log_query(jsonl_path).iter_logs_by_process(args.process))
+
+
+if __name__ == "__main__":
+    main()
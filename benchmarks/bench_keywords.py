@@ -0,0 +1,60 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.log_query import create_log_query
+from syslog_manager.utility import parse_lines
+
+
+def generate_keywords(count):
+    # IP addresses, mostly absent from the data, plus two that occur
+    rng = random.Random(1)
+    keywords = [f"{rng.randint(1, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}"
+                for _ in range(count - 2)]
+    return keywords + ['218.188.2.4', '192.168.0.2']
+
+
+def any_keyword(keywords):
+    # Previous implementation: every keyword is looked for in every message
+    def scan(path):
+        with open(path, 'r') as f:
+            return sum(1 for record in parse_lines(f) if any(keyword in record.message for keyword in keywords))
+    return scan
+
+
+def query(keywords):
+    def run_query(path):
+        return sum(1 for _ in create_log_query(Path(path)).iter_logs_by_words(keywords))
+    return run_query
+
+
+def main():
+    parser = argparse.ArgumentParser(description="contains_words with a long keyword list")
+    parser.add_argument('--lines', type=int, default=200_000, help='Number of lines to generate')
+    parser.add_argument('--keywords', type=int, default=2000, help='Number of keywords to search for')
+    args = parser.parse_args()
+    keywords = generate_keywords(args.keywords)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        scan = run('any keyword', any_keyword(keywords), path, args.lines)
+        matched = run('matcher', query(keywords), path, args.lines)
+        print(f"speedup: {scan / matched:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
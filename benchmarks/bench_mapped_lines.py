@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.log_query import create_log_query
+from syslog_manager.mapped_lines import iter_lines
+from syslog_manager.utility import SYSLOG_PATTERN
+
+
+def text_scan(keyword):
+    # Previous implementation: every line is decoded and parsed before it is filtered
+    def scan(path):
+        with open(path, 'r') as f:
+            return sum(1 for line in f
+                       if (match := SYSLOG_PATTERN.match(line.strip())) and keyword in match.group('message'))
+    return scan
+
+
+def mapped_scan(keyword):
+    needle = keyword.encode('utf-8')
+
+    def scan(path):
+        return sum(1 for line in iter_lines(path, needles=[needle])
+                   if (match := SYSLOG_PATTERN.match(line.strip())) and keyword in match.group('message'))
+    return scan
+
+
+def query(keyword):
+    def run_query(path):
+        result = create_log_query(Path(path)).query_logs_by_words([keyword])
+        return result.count('\n') + 1 if result else 0
+    return run_query
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Line scan benchmark with and without the byte prefilter")
+    parser.add_argument('--lines', type=int, default=1_000_000, help='Number of lines to generate')
+    parser.add_argument('--keyword', type=str, default='218.188.2.4', help='Word to search for')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        text = run('text scan', text_scan(args.keyword), path, args.lines)
+        mapped = run('mapped scan', mapped_scan(args.keyword), path, args.lines)
+        print(f"speedup: {text / mapped:.2f}x")
+        run('contains_words query', query(args.keyword), path, args.lines)
+
+
+if __name__ == "__main__":
+    main()
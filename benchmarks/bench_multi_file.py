@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.log_query import LogFileQuery, MergedLogFileQuery
+from syslog_manager.multi_file import timed
+from syslog_manager.query_filter import QueryFilter
+
+
+def query_then_sort(paths, query_filter):
+    # Previous workflow: one query per file, the results merged by sorting them all in memory
+    logs = []
+    for path in paths:
+        logs.extend(timed(LogFileQuery(path, jobs=1).query(query_filter)))
+    logs.sort(key=lambda item: item[0])
+    return sum(1 for _ in logs)
+
+
+def merged_query(paths, query_filter, jobs):
+    return sum(1 for _ in MergedLogFileQuery(paths, jobs=jobs).query(query_filter))
+
+
+def peak_memory(func, paths):
+    tracemalloc.start()
+    try:
+        func(paths)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Querying several rotated logs, merged in time order")
+    parser.add_argument('--lines', type=int, default=200_000, help='Number of lines to generate per file')
+    parser.add_argument('--files', type=int, default=7, help='Number of files to generate')
+    parser.add_argument('--process', type=str, default='sshd', help='Process to query')
+    args = parser.parse_args()
+
+    query_filter = QueryFilter(process=args.process)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for number in range(args.files):
+            path = os.path.join(tmp_dir, f'syslog.{number}.log')
+            generate_log_file(path, args.lines)
+            paths.append(path)
+        total_lines = args.lines * args.files
+
+        candidates = [
+            ('query then sort', lambda p: query_then_sort(p, query_filter)),
+            ('heap merge', lambda p: merged_query(p, query_filter, 1)),
+            ('worker per file', lambda p: merged_query(p, query_filter, args.files)),
+        ]
+        for name, func in candidates:
+            run(name, func, paths, total_lines)
+        # The worker processes are not traced, only the memory of the merge is
+        for name, func in candidates:
+            print(f"{name:<20} peak memory {peak_memory(func, paths) / (1 << 20):8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import os
+import sys
+import tempfile
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.count_event_per_process import count_event_per_process
+
+
+def count(jobs):
+    def count_events(path):
+        return sum(count_event_per_process(path, jobs=jobs).values())
+    return count_events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel scan benchmark")
+    parser.add_argument('--lines', type=int, default=2_000_000, help='Number of lines to generate')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1],
+                        help='Numbers of processes to compare')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        sequential = None
+        for jobs in sorted(set(args.jobs)):
+            elapsed = run(f'jobs={jobs}', count(jobs), path, args.lines)
+            sequential = sequential or elapsed
+            print(f"speedup: {sequential / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
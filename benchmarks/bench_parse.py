@@ -0,0 +1,73 @@
+import argparse
+import os
+import re
+import sys
+import tempfile
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, count_lines, run
+from syslog_manager.utility import parse_lines
+
+
+def legacy_parse_syslog_line(line):
+    # Parser as it was before the pattern was compiled once at module level
+    syslog_pattern = re.compile(
+        r'^(?P<timestamp>[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}) '
+        r'(?P<hostname>\S+) '
+        r'(?P<process>\S+?)'
+        r'(?:\[(?P<pid>\d+)\])?: '
+        r'(?P<message>.*)$'
+    )
+
+    match = syslog_pattern.match(line)
+    if match:
+        return match.groupdict()
+    return None
+
+
+def bench_legacy(path):
+    count = 0
+    with open(path, 'r') as f:
+        for line in f:
+            if legacy_parse_syslog_line(line):
+                count += 1
+    return count
+
+
+def bench_parse_lines(path):
+    count = 0
+    with open(path, 'r') as f:
+        for _ in parse_lines(f):
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Syslog parser micro-benchmark")
+    parser.add_argument('--lines', type=int, default=2_000_000, help='Number of lines to generate')
+    parser.add_argument('--input_file', type=str, help='Use an existing syslog file instead of generating one')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.input_file:
+            path = args.input_file
+            num_lines = count_lines(path)
+        else:
+            path = os.path.join(tmp_dir, 'bench.log')
+            num_lines = args.lines
+            generate_log_file(path, num_lines)
+
+        legacy = run('legacy', bench_legacy, path, num_lines)
+        current = run('parse_lines', bench_parse_lines, path, num_lines)
+        print(f"speedup: {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
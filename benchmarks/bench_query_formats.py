@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.exporter import ColumnarSyslogExporter, JSONSyslogExporter, CSVSyslogExporter
+from syslog_manager.log_query import create_log_query
+
+QUERIES = {
+    'from_process': lambda log_query: log_query.query_logs_by_process('sshd'),
+    'contains_words': lambda log_query: log_query.query_logs_by_words(['failure', 'session']),
+}
+
+
+def query(name):
+    def run_query(path):
+        result = QUERIES[name](create_log_query(Path(path)))
+        return result.count('\n') + 1 if result else 0
+    return run_query
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query benchmark over the export formats")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        JSONSyslogExporter(path, streaming=True, validate='off', compact=True).export(f"{path}.json")
+        CSVSyslogExporter(path, streaming=True, validate='off').export(f"{path}.csv")
+        ColumnarSyslogExporter(path, streaming=True).export(f"{path}.slc")
+        for extension in ('log', 'json', 'csv', 'slc'):
+            size = os.path.getsize(path if extension == 'log' else f"{path}.{extension}")
+            print(f"{extension:<5} {size / 1e6:8.1f} MB")
+
+        for name in QUERIES:
+            for extension, input_file in (('log', path), ('json', f"{path}.json"),
+                                          ('csv', f"{path}.csv"), ('slc', f"{path}.slc")):
+                run(f'{name} {extension}', query(name), input_file, args.lines)
+
+
+if __name__ == "__main__":
+    main()
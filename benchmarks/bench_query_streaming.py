@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file
+from syslog_manager.log_query import create_log_query
+
+
+def measure(name, logs):
+    # Time to the first result, total time and peak memory of consuming logs one at a time
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in logs():
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:<12} {count:>10} results  first {first or 0:8.4f} s  total {elapsed:8.2f} s  "
+          f"peak {peak / 1e6:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Accumulated versus streamed query results")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    parser.add_argument('--process', type=str, default='sshd', help='Process to query')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / 'bench.log'
+        generate_log_file(path, args.lines)
+        log_query = create_log_query(path)
+
+        measure('accumulated', lambda: log_query.query_logs_by_process(args.process).split('\n'))
+        measure('streamed', lambda: log_query.iter_logs_by_process(args.process))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.log_query import create_log_query
+from syslog_manager.utility import parse_lines
+
+
+def regex_scan(pattern):
+    # Every line is parsed and its message searched with the regular expression
+    def scan(path):
+        search = re.compile(pattern).search
+        with open(path, 'r') as f:
+            return sum(1 for record in parse_lines(f) if search(record.message))
+    return scan
+
+
+def query(pattern, ignore_case=False):
+    def run_query(path):
+        return sum(1 for _ in create_log_query(Path(path)).iter_logs_by_words([pattern], regex=True,
+                                                                            ignore_case=ignore_case))
+    return run_query
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regular expression queries with and without the literal prefilter")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    parser.add_argument('--pattern', type=str, default=r'connection from (\d+\.){3}\d+ \(\w+',
+                        help='Regular expression to search for')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        scan = run('regex scan', regex_scan(args.pattern), path, args.lines)
+        prefiltered = run('prefiltered', query(args.pattern), path, args.lines)
+        run('ignore case', query(args.pattern, ignore_case=True), path, args.lines)
+        print(f"speedup: {scan / prefiltered:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file
+from syslog_manager.client import query_server
+from syslog_manager.log_query import LogFileQuery
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.server import QueryServer
+
+MAIN_SCRIPT = os.path.join(project_path, 'syslog_manager', 'main.py')
+CLIENT_SCRIPT = os.path.join(project_path, 'syslog_manager', 'client.py')
+
+
+def latency(name, func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = func()
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    print(f"{name:<32} {results:>8} records  {median * 1000:10.1f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query latency of a warm query server against a CLI invocation")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs of each query, the median is printed')
+    args = parser.parse_args()
+
+    # The sample data has no year, its dates are read in the current one
+    year = datetime.now().year
+    day = f'10/07/{year}'
+    queries = {
+        'between': (QueryFilter(start_timestamp=datetime(year, 7, 10), end_timestamp=datetime(year, 7, 10)),
+                    ['between', day, day], ['--start', day, '--end', day]),
+        'from_process': (QueryFilter(process='ftpd'), ['from_process', 'ftpd'], ['--process', 'ftpd']),
+        'contains_words': (QueryFilter(keywords=['218.188.2.4']), ['contains_words', '218.188.2.4'],
+                           ['--words', '218.188.2.4']),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        start = time.perf_counter()
+        server = QueryServer([path], ('127.0.0.1', 0))
+        print(f"loaded in {time.perf_counter() - start:.2f} s")
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+        url = f"http://{host}:{port}"
+
+        try:
+            for name, (query_filter, cli_args, client_args) in queries.items():
+                print(name)
+
+                def cli():
+                    output = subprocess.run([sys.executable, MAIN_SCRIPT, 'query', 'log', path] + cli_args,
+                                            stdout=subprocess.PIPE, check=True).stdout
+                    return output.count(b'\n')
+
+                def client():
+                    output = subprocess.run([sys.executable, CLIENT_SCRIPT, path, '--server', url] + client_args,
+                                            stdout=subprocess.PIPE, check=True).stdout
+                    return output.count(b'\n')
+
+                cli_time = latency('  cli', cli, args.repeat)
+                latency('  file query', lambda: sum(1 for _ in LogFileQuery(Path(path)).query(query_filter)),
+                        args.repeat)
+                latency('  client command', client, args.repeat)
+                server_time = latency('  server request',
+                                      lambda: sum(1 for _ in query_server(url, path, query_filter)), args.repeat)
+                print(f"  speedup: {cli_time / server_time:.1f}x")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
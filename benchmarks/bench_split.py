@@ -0,0 +1,103 @@
+import argparse
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file
+from syslog_manager.split_by_day import split_syslog_by_day
+from syslog_manager.timestamps import TimestampDecoder, epoch_to_date
+from syslog_manager.utility import parse_lines
+
+
+def grouped_split(path, output_dir):
+    # Previous implementation: every line is kept in memory until the end of the file
+    logs_by_day = {}
+    decode_timestamp = TimestampDecoder()
+    with open(path, 'r') as f:
+        for record in parse_lines(f):
+            logs_by_day.setdefault(decode_timestamp.day_start(record.timestamp), []).append(record.line)
+    for day, logs in logs_by_day.items():
+        output_file = os.path.join(output_dir, f"syslog-{epoch_to_date(day).strftime('%Y-%m-%d')}.log")
+        with open(output_file, 'w', encoding='utf-8') as out_file:
+            out_file.writelines(logs)
+
+
+def split_then_gzip(path, output_dir):
+    # Archiving without compressed output: plain daily files compressed one after another
+    split_syslog_by_day(path, output_dir=output_dir)
+    for name in os.listdir(output_dir):
+        if name.endswith('.log'):
+            day_path = os.path.join(output_dir, name)
+            with open(day_path, 'rb') as f_in, gzip.open(day_path + '.gz', 'wb', compresslevel=6) as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.remove(day_path)
+
+
+def output_size(output_dir):
+    return sum(os.path.getsize(os.path.join(output_dir, name)) for name in os.listdir(output_dir))
+
+
+def timed(name, split, path, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    split(path, output_dir)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20} {len(os.listdir(output_dir)):>6} files  {elapsed:8.2f} s  "
+          f"output {output_size(output_dir) / 1e6:8.1f} MB")
+
+
+def measure(name, split, path, output_dir):
+    # Timed without tracing, then traced for the peak memory
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    split(path, output_dir)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    split(path, output_dir)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:<20} {len(os.listdir(output_dir)):>6} files  {elapsed:8.2f} s  peak {peak / 1e6:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split by day in memory, streamed and compressed")
+    parser.add_argument('--lines', type=int, default=1_000_000, help='Number of lines to generate')
+    parser.add_argument('--max-open-files', type=int, default=8, help='Day files kept open by the streamed split')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        measure('in memory', grouped_split, path, os.path.join(tmp_dir, 'grouped'))
+        measure('streamed', lambda path, output_dir: split_syslog_by_day(path, output_dir=output_dir),
+                path, os.path.join(tmp_dir, 'streamed'))
+        measure(f'streamed, {args.max_open_files} open',
+                lambda path, output_dir: split_syslog_by_day(path, output_dir=output_dir,
+                                                             max_open_files=args.max_open_files),
+                path, os.path.join(tmp_dir, 'bounded'))
+
+        timed('plain', lambda path, output_dir: split_syslog_by_day(path, output_dir=output_dir),
+              path, os.path.join(tmp_dir, 'plain'))
+        timed('split then gzip', split_then_gzip, path, os.path.join(tmp_dir, 'gzip_after'))
+        timed('gzip while parsing',
+              lambda path, output_dir: split_syslog_by_day(path, output_dir=output_dir, compression='gzip',
+                                                           manifest=True),
+              path, os.path.join(tmp_dir, 'gzip'))
+
+
+if __name__ == "__main__":
+    main()
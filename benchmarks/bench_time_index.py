@@ -0,0 +1,68 @@
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.log_query import LogFileQuery
+from syslog_manager.time_index import TimeIndex, build_time_index, time_index_path
+
+
+def generate_ordered_log_file(path, num_lines):
+    """Writes num_lines syslog lines spread in time order over January to December."""
+    generate_log_file(path, num_lines)
+    months = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+    with open(path, 'r') as f:
+        lines = f.readlines()
+    with open(path, 'w') as f:
+        for number, line in enumerate(lines):
+            day_of_year = number * 336 // len(lines)
+            f.write(f"{months[day_of_year // 28]} {day_of_year % 28 + 1:2d}{line[6:]}")
+
+
+def query(start_date, end_date, use_index):
+    def run_query(path):
+        log_query = LogFileQuery(Path(path))
+        if not use_index:
+            # Same query as before the time index
+            log_query._time_index = lambda year: TimeIndex(None, year, False, [], [])
+        result = log_query.query_logs_between_timestamps(start_date, end_date)
+        return result.count('\n') + 1 if result else 0
+    return run_query
+
+
+def build(path):
+    build_time_index(path).save(time_index_path(path))
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="between query benchmark with and without the time index")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    args = parser.parse_args()
+
+    year = datetime.now().year
+    start_date, end_date = datetime(year, 6, 10), datetime(year, 6, 11)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_ordered_log_file(path, args.lines)
+
+        scan = run('scan', query(start_date, end_date, False), path, args.lines)
+        run('build index', build, path, args.lines)
+        indexed = run('indexed', query(start_date, end_date, True), path, args.lines)
+        print(f"speedup: {scan / indexed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.timestamps import TimestampDecoder
+from syslog_manager.utility import parse_lines
+
+
+def read_timestamps(path):
+    with open(path, 'r') as f:
+        return [record.timestamp for record in parse_lines(f)]
+
+
+def bench_legacy(timestamps):
+    # Decoding as it was before: datetime.now() and strptime for every line
+    def decode(path):
+        for timestamp in timestamps:
+            datetime.strptime(f"{timestamp} {datetime.now().year}", "%b %d %H:%M:%S %Y").date()
+        return len(timestamps)
+    return decode
+
+
+def bench_decoder(timestamps):
+    def decode(path):
+        decode_timestamp = TimestampDecoder()
+        for timestamp in timestamps:
+            decode_timestamp(timestamp)
+        return len(timestamps)
+    return decode
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Timestamp decoding benchmark")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+        timestamps = read_timestamps(path)
+
+        legacy = run('strptime', bench_legacy(timestamps), path, args.lines)
+        current = run('decoder', bench_decoder(timestamps), path, args.lines)
+        print(f"speedup: {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
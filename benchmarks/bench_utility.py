@@ -0,0 +1,35 @@
+import os
+import time
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+
+def generate_log_file(path, num_lines):
+    """Writes num_lines syslog lines to path by cycling over the sample data file."""
+    with open(SAMPLE_FILE, 'r') as f:
+        sample = f.readlines()
+
+    with open(path, 'w') as out:
+        written = 0
+        while written < num_lines:
+            chunk = sample[:num_lines - written]
+            out.writelines(chunk)
+            written += len(chunk)
+
+
+def count_lines(path):
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+def run(name, func, path, num_lines):
+    start = time.perf_counter()
+    parsed = func(path)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20} {parsed:>10} records  {elapsed:8.2f} s  {num_lines / elapsed:>12,.0f} lines/s")
+    return elapsed
@@ -0,0 +1,61 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from jsonschema.validators import validate
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file
+from syslog_manager.exporter import JSONSyslogExporter
+from syslog_manager.schema import compile_json_schema
+
+
+def legacy_validate(records, schema):
+    # Validation as it was before: jsonschema.validate rebuilds the validator for every record
+    for record in records:
+        validate(instance=record, schema=schema)
+
+
+def compiled_validate(records, schema):
+    check_record = compile_json_schema(schema)
+    for record in records:
+        if check_record(record) is not None:
+            raise ValueError(record)
+
+
+def run(name, func, records, schema):
+    start = time.perf_counter()
+    func(records, schema)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20} {len(records):>10} records  {elapsed:8.2f} s  {len(records) / elapsed:>12,.0f} records/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON record validation benchmark")
+    parser.add_argument('--lines', type=int, default=20_000, help='Number of lines to generate')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(log_path, args.lines)
+        exporter = JSONSyslogExporter(log_path, validate='off')
+        records = exporter.parsed_data
+        schema = exporter._create_schema()
+
+        legacy = run('jsonschema.validate', legacy_validate, records, schema)
+        current = run('compiled checker', compiled_validate, records, schema)
+        print(f"speedup: {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
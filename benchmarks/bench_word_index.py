@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from bench_utility import generate_log_file, run
+from syslog_manager.log_query import create_log_query
+from syslog_manager.word_index import build_word_index, word_index_path
+
+
+def query(keywords):
+    def run_query(path):
+        result = create_log_query(Path(path)).query_logs_by_words(keywords)
+        return result.count('\n') + 1 if result else 0
+    return run_query
+
+
+def build(path):
+    build_word_index(path)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="contains_words benchmark with and without the word index")
+    parser.add_argument('--lines', type=int, default=500_000, help='Number of lines to generate')
+    parser.add_argument('--keywords', type=str, default='abnormally,ftpd',
+                        help='Comma-separated list of words to search for')
+    args = parser.parse_args()
+    keywords = args.keywords.split(',')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.log')
+        generate_log_file(path, args.lines)
+
+        scan = run('scan', query(keywords), path, args.lines)
+        run('build index', build, path, args.lines)
+        print(f"index size: {os.path.getsize(word_index_path(path)) / 1e6:.1f} MB")
+        indexed = run('indexed', query(keywords), path, args.lines)
+        print(f"speedup: {scan / indexed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ setup(
     entry_points={
         'console_scripts': [
             'syslog_manager = syslog_manager.main:main',
+            'syslog_manager_client = syslog_manager.client:main',
         ],
     },
 )
@@ -0,0 +1,83 @@
+import argparse
+import io
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+# Only light modules here: the client is run once per query and must start fast
+from syslog_manager.keywords import read_keyword_arguments
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.utility import print_logs
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8514
+DEFAULT_SERVER = f'http://{DEFAULT_HOST}:{DEFAULT_PORT}'
+
+
+def query_server(server, input_file, query_filter):
+    """Yields the logs of input_file matching query_filter, as answered by the query server at the URL server."""
+    fields = {
+        'file': os.path.abspath(input_file),
+        'start': None if query_filter.start_timestamp is None else query_filter.start_timestamp.strftime('%Y-%m-%d'),
+        'end': None if query_filter.end_timestamp is None else query_filter.end_timestamp.strftime('%Y-%m-%d'),
+        'process': query_filter.process,
+        'hostname': query_filter.hostname,
+        'keywords': query_filter.keywords,
+        'regex': query_filter.regex,
+        'ignore_case': query_filter.ignore_case,
+    }
+    request = urllib.request.Request(f"{server.rstrip('/')}/query", data=json.dumps(fields).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        with e:
+            message = e.read().decode('utf-8').strip()
+        if e.code == 404:
+            raise FileNotFoundError(message)
+        raise ValueError(message)
+    except urllib.error.URLError as e:
+        raise ConnectionError(f"Cannot reach the query server at {server}: {e.reason}")
+    with response:
+        for line in io.TextIOWrapper(response, encoding='utf-8', newline='\n'):
+            yield line.rstrip('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query a .log file loaded by syslog_manager serve")
+    parser.add_argument('input_file', type=str, help='Path to the syslog file, as given to the server')
+    parser.add_argument('--server', type=str, default=DEFAULT_SERVER,
+                        help=f'URL of the query server (default: {DEFAULT_SERVER})')
+    parser.add_argument('--start', type=str, help='Start date (format: DD/MM/YYYY)')
+    parser.add_argument('--end', type=str, help='End date (format: DD/MM/YYYY)')
+    parser.add_argument('--process', type=str, help='Name of the process to filter by')
+    parser.add_argument('--hostname', type=str, help='Hostname to filter by')
+    parser.add_argument('--words', type=str, help='Comma-separated list of words to search for')
+    parser.add_argument('--words-file', type=str, help='File with one word to search for per line')
+    parser.add_argument('--regex', action='store_true',
+                        help='Treat the process name and the words as regular expressions')
+    parser.add_argument('-i', '--ignore-case', action='store_true',
+                        help='Match the process name and the words regardless of case')
+    args = parser.parse_args(argv)
+
+    query_filter = QueryFilter(
+        start_timestamp=datetime.strptime(args.start, "%d/%m/%Y") if args.start else None,
+        end_timestamp=datetime.strptime(args.end, "%d/%m/%Y") if args.end else None,
+        process=args.process, hostname=args.hostname,
+        keywords=read_keyword_arguments(args), regex=args.regex, ignore_case=args.ignore_case)
+    print_logs(query_server(args.server, args.input_file, query_filter))
+
+
+if __name__ == "__main__":
+    main()
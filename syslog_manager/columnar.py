@@ -0,0 +1,289 @@
+import json
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_right
+
+from syslog_manager.keywords import keyword_pattern
+
+# Columnar syslog file layout:
+#   MAGIC | message blob | fixed width columns (8 byte aligned) | footer JSON | footer length (uint64) | MAGIC
+# The footer stores the record count, the string dictionaries and the offset, length and
+# array typecode of every section. Integers are stored in the byte order of the writer.
+MAGIC = b'SLCOL01\n'
+_FOOTER_LENGTH = struct.Struct('<Q')
+
+NULL_PID = -1
+
+# Fixed width columns: name -> array typecode
+COLUMNS = {
+    'date': 'I',          # id in the date dictionary ("Jun 14")
+    'time': 'I',          # seconds since midnight
+    'hostname': 'I',      # id in the hostname dictionary
+    'process': 'I',       # id in the process dictionary
+    'pid': 'q',           # NULL_PID when the line has no pid
+    'message_offsets': 'Q'  # start of every message in the blob, plus the end of the last one
+}
+
+
+def _split_timestamp(timestamp):
+    """Splits 'Jun 14 15:16:01' into the date text and the seconds since midnight."""
+    date, time = timestamp.rsplit(' ', 1)
+    return date, int(time[0:2]) * 3600 + int(time[3:5]) * 60 + int(time[6:8])
+
+
+def _format_time(seconds):
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class _Dictionary:
+    """Maps every distinct string to a small integer id, in order of first appearance."""
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def encode(self, value):
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+
+class ColumnarWriter:
+    """
+    Writes records to the columnar format incrementally. Messages go straight to the output,
+    the fixed width columns are spilled to temporary files chunk by chunk and appended on close,
+    so memory only grows with the size of the dictionaries.
+    """
+    def __init__(self, file):
+        self._file = file
+        self._file.write(MAGIC)
+        self._blob_length = 0
+        self._count = 0
+        self._dictionaries = {'date': _Dictionary(), 'hostname': _Dictionary(), 'process': _Dictionary()}
+        self._spill_files = {name: tempfile.TemporaryFile() for name in COLUMNS}
+        self._spill_files['message_offsets'].write(array('Q', [0]).tobytes())
+
+    def write_records(self, records):
+        dates, hostnames, processes = (self._dictionaries[name] for name in ('date', 'hostname', 'process'))
+        columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        messages = []
+        for record in records:
+            date, seconds = _split_timestamp(record['timestamp'])
+            columns['date'].append(dates.encode(date))
+            columns['time'].append(seconds)
+            columns['hostname'].append(hostnames.encode(record['hostname']))
+            columns['process'].append(processes.encode(record['process']))
+            columns['pid'].append(NULL_PID if record['pid'] is None else record['pid'])
+            message = record['message'].encode('utf-8')
+            messages.append(message)
+            self._blob_length += len(message)
+            columns['message_offsets'].append(self._blob_length)
+
+        self._file.write(b''.join(messages))
+        for name, column in columns.items():
+            self._spill_files[name].write(column.tobytes())
+        self._count += len(records)
+
+    def close(self):
+        position = len(MAGIC) + self._blob_length
+        sections = {'message_blob': [len(MAGIC), self._blob_length, 'B']}
+        for name, typecode in COLUMNS.items():
+            padding = -position % 8
+            self._file.write(b'\0' * padding)
+            position += padding
+
+            spill_file = self._spill_files[name]
+            length = spill_file.tell()
+            spill_file.seek(0)
+            shutil.copyfileobj(spill_file, self._file)
+            spill_file.close()
+
+            sections[name] = [position, length, typecode]
+            position += length
+
+        footer = json.dumps({
+            'count': self._count,
+            'byteorder': sys.byteorder,
+            'sections': sections,
+            'dictionaries': {name: dictionary.values for name, dictionary in self._dictionaries.items()}
+        }).encode('utf-8')
+        self._file.write(footer)
+        self._file.write(_FOOTER_LENGTH.pack(len(footer)))
+        self._file.write(MAGIC)
+
+
+class ColumnarLogFile:
+    """
+    Memory-mapped reader for the columnar format. Columns are exposed as zero-copy
+    memoryviews, so a query only touches the pages of the columns it reads.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise ValueError(f"The file {path} is not a columnar syslog file.")
+        self._views = []
+        self._columns = {}
+
+        trailer_size = _FOOTER_LENGTH.size + len(MAGIC)
+        if (len(self._mmap) < len(MAGIC) + trailer_size or self._mmap[:len(MAGIC)] != MAGIC
+                or self._mmap[-len(MAGIC):] != MAGIC):
+            self.close()
+            raise ValueError(f"The file {path} is not a columnar syslog file.")
+
+        footer_length, = _FOOTER_LENGTH.unpack_from(self._mmap, len(self._mmap) - trailer_size)
+        footer_start = len(self._mmap) - trailer_size - footer_length
+        footer = json.loads(self._mmap[footer_start:footer_start + footer_length])
+        if footer['byteorder'] != sys.byteorder:
+            self.close()
+            raise ValueError(f"The file {path} was written on a machine with a different byte order.")
+
+        self.count = footer['count']
+        self._sections = footer['sections']
+        self.dates = footer['dictionaries']['date']
+        self.hostnames = footer['dictionaries']['hostname']
+        self.processes = footer['dictionaries']['process']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _view(self, section):
+        offset, length, typecode = self._sections[section]
+        view = memoryview(self._mmap)[offset:offset + length]
+        self._views.append(view)
+        if typecode != 'B':
+            view = view.cast(typecode)
+            self._views.append(view)
+        return view
+
+    def column(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = self._view(name)
+        return column
+
+    def message(self, index):
+        offsets = self.column('message_offsets')
+        start = self._sections['message_blob'][0]
+        return self._mmap[start + offsets[index]:start + offsets[index + 1]].decode('utf-8')
+
+    def timestamp(self, index):
+        return f"{self.dates[self.column('date')[index]]} {_format_time(self.column('time')[index])}"
+
+    def record(self, index):
+        return next(self.records([index]))
+
+    def records(self, indices):
+        """Yields the record dicts at the given indices, resolving the columns only once."""
+        dates, times, hostnames, processes, pids = (self.column(name) for name in
+                                                    ('date', 'time', 'hostname', 'process', 'pid'))
+        offsets = self.column('message_offsets')
+        blob_start = self._sections['message_blob'][0]
+        formatted_times = {}
+        for index in indices:
+            seconds = times[index]
+            time = formatted_times.get(seconds)
+            if time is None:
+                time = formatted_times[seconds] = _format_time(seconds)
+            pid = pids[index]
+            yield {
+                'timestamp': f"{self.dates[dates[index]]} {time}",
+                'hostname': self.hostnames[hostnames[index]],
+                'process': self.processes[processes[index]],
+                'pid': None if pid == NULL_PID else pid,
+                'message': self._mmap[blob_start + offsets[index]:blob_start + offsets[index + 1]].decode('utf-8')
+            }
+
+    def indices_with_ids(self, column_name, ids, indices=None):
+        """
+        Yields the indices of the records whose dictionary encoded column is one of ids,
+        among the given ordered indices or among all records.
+        """
+        if not ids:
+            return
+        column = self.column(column_name)
+        if indices is not None:
+            for index in indices:
+                if column[index] in ids:
+                    yield index
+        elif len(ids) == 1:
+            value_id, = ids
+            for index, column_id in enumerate(column):
+                if column_id == value_id:
+                    yield index
+        else:
+            for index, column_id in enumerate(column):
+                if column_id in ids:
+                    yield index
+
+    def indices_with_message_containing(self, keyword):
+        """
+        Yields, in order, the indices of the records whose message contains keyword.
+        The search runs over the raw message blob instead of decoding every message.
+        """
+        needle = keyword.encode('utf-8')
+        if not needle:
+            yield from range(self.count)
+            return
+        offsets = self.column('message_offsets')
+        blob_start, blob_length, _ = self._sections['message_blob']
+        blob_end = blob_start + blob_length
+        position = self._mmap.find(needle, blob_start, blob_end)
+        while position != -1:
+            index = bisect_right(offsets, position - blob_start) - 1
+            message_end = blob_start + offsets[index + 1]
+            if position + len(needle) <= message_end:
+                yield index
+                # Continue with the next message
+                position = self._mmap.find(needle, message_end, blob_end)
+            else:
+                # The match spans two messages
+                position = self._mmap.find(needle, position + 1, blob_end)
+
+    def indices_with_message_containing_any(self, keywords):
+        """Yields, in order, the indices of the records whose message contains any of keywords."""
+        if len(keywords) == 1:
+            yield from self.indices_with_message_containing(keywords[0])
+            return
+        needles = [keyword.encode('utf-8') for keyword in keywords]
+        if not needles:
+            return
+        if b'' in needles:
+            yield from range(self.count)
+            return
+        # A single pass over the blob finds every keyword
+        search = keyword_pattern(needles).search
+        offsets = self.column('message_offsets')
+        blob_start, blob_length, _ = self._sections['message_blob']
+        blob_end = blob_start + blob_length
+        match = search(self._mmap, blob_start, blob_end)
+        while match is not None:
+            position = match.start()
+            index = bisect_right(offsets, position - blob_start) - 1
+            message_end = blob_start + offsets[index + 1]
+            if match.end() <= message_end:
+                yield index
+                match = search(self._mmap, message_end, blob_end)
+            else:
+                # The match spans two messages, at most one keyword matches at a position
+                match = search(self._mmap, position + 1, blob_end)
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._columns = {}
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,88 @@
+import bz2
+import gzip
+import lzma
+import os
+import queue
+import threading
+
+# Openers of the compressed formats accepted wherever a .log file is, by file suffix
+COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+# Decompressed bytes passed to the reader at once
+READ_SIZE = 1 << 20
+
+# Chunks decompressed ahead of the reader
+QUEUE_SIZE = 8
+
+# Seconds between two checks, by the decompressing thread, that the reader is still there
+_PUT_TIMEOUT = 0.1
+
+_END = object()
+
+
+def is_compressed(path):
+    return os.path.splitext(str(path))[1].lower() in COMPRESSED_OPENERS
+
+
+def open_compressed(path):
+    """Binary file object of the decompressed content of path."""
+    return COMPRESSED_OPENERS[os.path.splitext(str(path))[1].lower()](path, 'rb')
+
+
+def _put(chunks, stopped, item):
+    # Gives up once the reader is gone, instead of blocking on a full queue
+    while not stopped.is_set():
+        try:
+            chunks.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _decompress(path, chunks, stopped, read_size):
+    try:
+        with open_compressed(path) as f:
+            while True:
+                chunk = f.read(read_size)
+                if not _put(chunks, stopped, chunk if chunk else _END) or not chunk:
+                    return
+    except BaseException as e:
+        # Raised again by the reader
+        _put(chunks, stopped, e)
+
+
+def iter_decompressed(path, read_size=None, queue_size=QUEUE_SIZE):
+    """
+    Yields the decompressed bytes of a .gz, .bz2 or .xz file in chunks. A background
+    thread decompresses up to queue_size chunks ahead, so decompression overlaps with the
+    processing of the chunks: the compression modules release the GIL while they work.
+    """
+    read_size = READ_SIZE if read_size is None else read_size
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"The file {path} does not exist.")
+    chunks = queue.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+    thread = threading.Thread(target=_decompress, args=(path, chunks, stopped, read_size), daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is _END:
+                return
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        # A reader that stops early lets the thread end without decompressing the rest
+        stopped.set()
+        thread.join()
+
+
+def read_start(path, size):
+    """First size bytes of path, decompressed if it is compressed."""
+    if is_compressed(path):
+        with open_compressed(path) as f:
+            return f.read(size)
+    with open(path, 'rb') as f:
+        return f.read(size)
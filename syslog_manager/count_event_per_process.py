@@ -1,16 +1,22 @@
 from collections import defaultdict
 
-from syslog_manager.utility import parse_syslog_line
+from syslog_manager.multi_file import as_paths
+from syslog_manager.parallel import DEFAULT_JOBS, scan_files
+from syslog_manager.utility import parse_lines
 
 
-def count_event_per_process(syslog_file):
+def _count_lines_per_process(lines):
+    num_event = {}
+    for record in parse_lines(lines):
+        num_event[record.process] = num_event.get(record.process, 0) + 1
+    return num_event
+
 
+def count_event_per_process(syslog_file, jobs=DEFAULT_JOBS):
+    """Number of events of every process in a syslog file, or in a list of them."""
     num_event = defaultdict(lambda: 0)
-    with open(syslog_file, 'r') as file:
-        lines = file.readlines()
-        for line in lines:
-            parsed_line = parse_syslog_line(line)
-            if parsed_line:
-                num_event[parsed_line['process']] += 1
+    for partial_counts in scan_files(as_paths(syslog_file), _count_lines_per_process, jobs=jobs):
+        for process, count in partial_counts.items():
+            num_event[process] += count
 
     return num_event
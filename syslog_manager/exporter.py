@@ -1,30 +1,138 @@
 import csv
 import json
+import os
+import sqlite3
 from abc import ABC, abstractmethod
+from itertools import islice
 
-from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
-from pycsvschema.checker import Validator
+from syslog_manager.columnar import ColumnarWriter
+from syslog_manager.mapped_lines import iter_lines
+from syslog_manager.multi_file import as_paths, iter_merged, timed_lines
+from syslog_manager.parallel import DEFAULT_JOBS
+from syslog_manager.schema import compile_csv_schema, compile_json_schema
+from syslog_manager.timestamps import TimestampDecoder
+from syslog_manager.utility import parse_lines
 
-from syslog_manager.utility import parse_syslog_line
+
+DEFAULT_CHUNK_SIZE = 10000
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Validation modes: every record, one record out of SAMPLE_INTERVAL, or no validation
+VALIDATION_MODES = ('full', 'sample', 'off')
+SAMPLE_INTERVAL = 100
+
+
+class JSONArrayWriter:
+    """
+    Writes a JSON array of flat, non-empty records (scalar values only) incrementally,
+    one chunk of records at a time. The output is the same as json.dump(records, f, indent=indent).
+    """
+    def __init__(self, file, indent=4):
+        self._file = file
+        self._indent = indent
+        # Every chunk goes through the C encoder with one field per line. Raw newlines never
+        # appear inside encoded strings, so the separators can be rewritten safely afterwards.
+        self._encoder = json.JSONEncoder(separators=(',\n', ': '))
+        self._count = 0
+
+    def _encode_chunk(self, records):
+        return self._encoder.encode(records)[1:-1]
+
+    def write_records(self, records):
+        if not records:
+            return
+        body = self._encode_chunk(records)
+        if self._indent is None:
+            body = body.replace(',\n', ', ')
+            self._file.write(("[" if self._count == 0 else ", ") + body)
+        else:
+            pad = ' ' * self._indent
+            body = (body.replace(',\n"', f',\n{pad}{pad}"')
+                    .replace('},\n{', f'\n{pad}}},\n{pad}{{\n{pad}{pad}'))
+            self._file.write(("[\n" if self._count == 0 else ",\n") + f"{pad}{{\n{pad}{pad}{body[1:-1]}\n{pad}}}")
+        self._count += len(records)
+
+    def close(self):
+        if self._count == 0:
+            self._file.write("[]")
+        else:
+            self._file.write("]" if self._indent is None else "\n]")
+
+
+class JSONLinesWriter(JSONArrayWriter):
+    """Writes one JSON object per line (JSON Lines)."""
+    def __init__(self, file):
+        super().__init__(file, indent=None)
+
+    def write_records(self, records):
+        if not records:
+            return
+        body = self._encode_chunk(records).replace(',\n"', ', "').replace('},\n{', '}\n{')
+        self._file.write(body + "\n")
+
+    def close(self):
+        pass
 
 
 class SyslogExporter(ABC):
-    def __init__(self, input_file):
+    def __init__(self, input_file, streaming=False, chunk_size=DEFAULT_CHUNK_SIZE, validate='full',
+                 jobs=DEFAULT_JOBS):
+        """
+        In streaming mode the input file is read, parsed and written one chunk of
+        records at a time during export(), so memory does not grow with the input size.
+        Otherwise the whole file is parsed upfront into self.parsed_data. input_file may
+        be a list of syslog files, whose records are merged in time order; with more than
+        one job every file is read by its own worker process.
+        """
+        if validate not in VALIDATION_MODES:
+            raise ValueError(f"Unsupported validation mode: {validate}. Supported modes are {', '.join(VALIDATION_MODES)}.")
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
         self.input_file = input_file
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.validate = validate
+        self.jobs = jobs
         self.parsed_data = []
-        self._parse_syslog_line = parse_syslog_line
-        self._read_and_parse_syslog()
+        self._parse_lines = parse_lines
+        if not self.streaming:
+            self._read_and_parse_syslog()
+
+    def _lines(self):
+        paths = as_paths(self.input_file)
+        if len(paths) == 1:
+            return iter_lines(paths[0])
+        return iter_merged(paths, timed_lines, (TimestampDecoder().year,), jobs=self.jobs)
+
+    def _iter_parsed_syslog(self):
+        for record in self._parse_lines(line.strip() for line in self._lines()):
+            parsed_line = record.to_dict()
+            parsed_line['pid'] = int(parsed_line['pid']) if parsed_line['pid'] else None
+            yield parsed_line
 
     def _read_and_parse_syslog(self):
-        with open(self.input_file, 'r') as f:
-            lines = f.readlines()
+        self.parsed_data.extend(self._iter_parsed_syslog())
+
+    def _records(self):
+        if self.streaming:
+            return self._iter_parsed_syslog()
+        return iter(self.parsed_data)
+
+    def _records_to_validate(self, chunk):
+        """Returns (index, record) pairs for the records of the chunk checked by the validation mode."""
+        if self.validate == 'off':
+            return []
+        step = SAMPLE_INTERVAL if self.validate == 'sample' else 1
+        return zip(range(0, len(chunk), step), chunk[::step])
 
-        for line in lines:
-            parsed_line = self._parse_syslog_line(line.strip())
-            if parsed_line:
-                parsed_line['pid'] = int(parsed_line['pid']) if parsed_line['pid'] else None
-                self.parsed_data.append(parsed_line)
+    def _chunks(self):
+        """Yields the records as lists of at most chunk_size elements."""
+        records = self._records()
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
 
     @abstractmethod
     def export(self, output_file):
@@ -32,6 +140,15 @@ class SyslogExporter(ABC):
 
 
 class JSONSyslogExporter(SyslogExporter):
+    def __init__(self, input_file, streaming=False, chunk_size=DEFAULT_CHUNK_SIZE, validate='full', compact=False,
+                 jobs=DEFAULT_JOBS):
+        self.compact = compact
+        self._check_record = compile_json_schema(self._create_schema())
+        super().__init__(input_file, streaming=streaming, chunk_size=chunk_size, validate=validate, jobs=jobs)
+
+    def _create_writer(self, file):
+        return JSONArrayWriter(file, indent=None if self.compact else 4)
+
     def _create_schema(self):
         return {
             "type": "object",
@@ -47,18 +164,25 @@ class JSONSyslogExporter(SyslogExporter):
             "required": ["timestamp", "hostname", "process", "message"]
         }
 
-    def _validate_data(self, file=None):
-        schema = self._create_schema()
-        for data in self.parsed_data:
-            try:
-                validate(instance=data, schema=schema)
-            except ValidationError as e:
-                raise ValueError(f"Invalid JSON data: {e.message}")
+    def _validate_data(self, data):
+        for _, record in self._records_to_validate(data):
+            error = self._check_record(record)
+            if error is not None:
+                raise ValueError(f"Invalid JSON data: {error}")
 
     def export(self, output_file):
-        self._validate_data()
-        with open(output_file, 'w') as f:
-            json.dump(self.parsed_data, f, indent=4)
+        with open(output_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = self._create_writer(f)
+            for chunk in self._chunks():
+                # Validated inline, right before the chunk is written
+                self._validate_data(chunk)
+                writer.write_records(chunk)
+            writer.close()
+
+
+class JSONLinesSyslogExporter(JSONSyslogExporter):
+    def _create_writer(self, file):
+        return JSONLinesWriter(file)
 
 
 class CSVSyslogExporter(SyslogExporter):
@@ -76,28 +200,52 @@ class CSVSyslogExporter(SyslogExporter):
             ]
         }
 
-    def _validate_data(self, file=None):
-        schema = self._create_schema()
-        v = Validator(csvfile=file, schema=schema)
-        try:
-            v.validate()
-        except ValidationError as e:
-            raise ValueError(f"Invalid CSV data: {e.message}")
+    def _validate_data(self, rows, first_line_number):
+        for index, row in self._records_to_validate(rows):
+            error = self._check_row(row)
+            if error is not None:
+                raise ValueError(f"Invalid CSV data at line {first_line_number + index}: {error}")
 
     def export(self, output_file):
         csv_header = ['timestamp', 'hostname', 'process', 'pid', 'message']
+        self._check_row = compile_csv_schema(self._create_schema(), csv_header)
 
-        with open(output_file, 'w', newline='') as csvfile:
+        with open(output_file, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=csv_header)
             writer.writeheader()
-            writer.writerows(self.parsed_data)
+            # Rows are validated right before they are written, line 1 is the header
+            line_number = 2
+            for chunk in self._chunks():
+                self._validate_data(chunk, line_number)
+                writer.writerows(chunk)
+                line_number += len(chunk)
 
-        self._validate_data(output_file)
+
+SQL_DIALECTS = ('insert', 'copy')
+
+# Escapes for the text format of COPY ... FROM stdin
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
 
 
 class SQLSyslogExporter(SyslogExporter):
+    def __init__(self, input_file, streaming=False, chunk_size=DEFAULT_CHUNK_SIZE, validate='full',
+                 batch_size=1, transactions=False, dialect='insert', jobs=DEFAULT_JOBS):
+        """
+        batch_size rows are written per multi-row INSERT statement. With transactions every
+        chunk of rows is wrapped in BEGIN/COMMIT. The copy dialect writes a single
+        COPY syslog FROM stdin block instead of INSERT statements.
+        """
+        if dialect not in SQL_DIALECTS:
+            raise ValueError(f"Unsupported SQL dialect: {dialect}. Supported dialects are {', '.join(SQL_DIALECTS)}.")
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least 1.")
+        self.batch_size = batch_size
+        self.transactions = transactions
+        self.dialect = dialect
+        super().__init__(input_file, streaming=streaming, chunk_size=chunk_size, validate=validate, jobs=jobs)
+
     def export(self, output_file):
-        with open(output_file, 'w') as f:
+        with open(output_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
             f.write("""
                 CREATE TABLE IF NOT EXISTS syslog (
                     id SERIAL PRIMARY KEY,
@@ -108,13 +256,97 @@ class SQLSyslogExporter(SyslogExporter):
                     message TEXT NOT NULL
                 );
                 """)
-            for row in self.parsed_data:
-                pid_value = row['pid'] if row['pid'] else 'NULL'
-                f.write(f"INSERT INTO syslog (timestamp, hostname, process, pid, message) VALUES\n")
-                f.write(
-                    f"('{row['timestamp'].replace("'", "''")}', "
-                    f"'{row['hostname'].replace("'", "''")}', "
-                    f"'{row['process'].replace("'", "''")}', "
-                    f"{pid_value}, "
-                    f"'{row['message'].replace("'", "''")}');\n"
+            if self.dialect == 'copy':
+                self._write_copy(f)
+                return
+            for chunk in self._chunks():
+                statements = "".join(self._insert_statement(chunk[start:start + self.batch_size])
+                                     for start in range(0, len(chunk), self.batch_size))
+                f.write(f"BEGIN;\n{statements}COMMIT;\n" if self.transactions else statements)
+
+    def _write_copy(self, f):
+        f.write("COPY syslog (timestamp, hostname, process, pid, message) FROM stdin;\n")
+        for chunk in self._chunks():
+            f.write("".join(self._copy_row(row) for row in chunk))
+        f.write("\\.\n")
+
+    def _copy_row(self, row):
+        pid_value = '\\N' if row['pid'] is None else str(row['pid'])
+        return (
+            f"{row['timestamp'].translate(_COPY_ESCAPES)}\t"
+            f"{row['hostname'].translate(_COPY_ESCAPES)}\t"
+            f"{row['process'].translate(_COPY_ESCAPES)}\t"
+            f"{pid_value}\t"
+            f"{row['message'].translate(_COPY_ESCAPES)}\n"
+        )
+
+    def _values(self, row):
+        pid_value = row['pid'] if row['pid'] else 'NULL'
+        return (
+            f"('{row['timestamp'].replace("'", "''")}', "
+            f"'{row['hostname'].replace("'", "''")}', "
+            f"'{row['process'].replace("'", "''")}', "
+            f"{pid_value}, "
+            f"'{row['message'].replace("'", "''")}')"
+        )
+
+    def _insert_statement(self, rows):
+        values = ",\n".join(self._values(row) for row in rows)
+        return f"INSERT INTO syslog (timestamp, hostname, process, pid, message) VALUES\n{values};\n"
+
+
+class SQLiteSyslogExporter(SyslogExporter):
+    # Bulk load settings: no rollback journal or fsync, a large page cache and an exclusive lock
+    BULK_LOAD_PRAGMAS = (
+        "PRAGMA journal_mode = OFF",
+        "PRAGMA synchronous = OFF",
+        "PRAGMA locking_mode = EXCLUSIVE",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -65536",
+    )
+    INDEXED_COLUMNS = ('timestamp', 'process', 'hostname')
+
+    def export(self, output_file):
+        # Like the file based exporters, an existing output is replaced
+        if os.path.exists(output_file):
+            os.remove(output_file)
+
+        connection = sqlite3.connect(output_file)
+        try:
+            for pragma in self.BULK_LOAD_PRAGMAS:
+                connection.execute(pragma)
+            connection.execute("""
+                CREATE TABLE syslog (
+                    id INTEGER PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    hostname TEXT NOT NULL,
+                    process TEXT NOT NULL,
+                    pid INTEGER,
+                    message TEXT NOT NULL
                 )
+                """)
+
+            # One transaction per chunk of rows
+            for chunk in self._chunks():
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO syslog (timestamp, hostname, process, pid, message) VALUES (?, ?, ?, ?, ?)",
+                        [(row['timestamp'], row['hostname'], row['process'], row['pid'], row['message'])
+                         for row in chunk]
+                    )
+
+            # Building the indexes once after the load is cheaper than maintaining them on every insert
+            with connection:
+                for column in self.INDEXED_COLUMNS:
+                    connection.execute(f"CREATE INDEX idx_syslog_{column} ON syslog ({column})")
+        finally:
+            connection.close()
+
+
+class ColumnarSyslogExporter(SyslogExporter):
+    def export(self, output_file):
+        with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = ColumnarWriter(f)
+            for chunk in self._chunks():
+                writer.write_records(chunk)
+            writer.close()
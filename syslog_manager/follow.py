@@ -0,0 +1,116 @@
+import asyncio
+import os
+
+from syslog_manager.timestamps import TimestampDecoder
+from syslog_manager.utility import parse_lines
+
+# Seconds between two checks of a file that has no new lines
+POLL_INTERVAL = 0.25
+
+# Bytes read from a followed file at once
+READ_SIZE = 1 << 20
+
+
+class FollowedFile:
+    """
+    Complete lines appended to a file since the last read. Only the bytes past the
+    current offset are read. When the path is rotated to a new file, the rest of the old
+    one is read before the new one is opened, and a file truncated in place is read again
+    from its start.
+    """
+    def __init__(self, path):
+        self.path = path
+        try:
+            self._open()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {path} does not exist.")
+
+    def _open(self):
+        self._file = open(self.path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        # Bytes of the last line, not terminated yet
+        self._partial = b''
+
+    def close(self):
+        self._file.close()
+
+    def _split(self, data, final=False):
+        lines = (self._partial + data).split(b'\n')
+        self._partial = b'' if final else lines.pop()
+        return [line.decode('utf-8', errors='replace').rstrip('\r') for line in lines if line]
+
+    def read_lines(self):
+        """Lines appended since the last call, at most about READ_SIZE bytes of them."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # Rotated away, the new file is not created yet
+            stat = None
+        if stat is not None and (stat.st_dev, stat.st_ino) == self._identity and stat.st_size < self._file.tell():
+            self._file.seek(0)
+            self._partial = b''
+        data = self._file.read(READ_SIZE)
+        if data or stat is None or (stat.st_dev, stat.st_ino) == self._identity:
+            return self._split(data)
+        # The old file is read to its end, its last line is complete
+        lines = self._split(b'', final=True)
+        self._file.close()
+        self._open()
+        return lines + self._split(self._file.read(READ_SIZE))
+
+
+async def follow_lines(path, poll_interval=POLL_INTERVAL):
+    """
+    Yields the lists of lines of path, from its start and then as they are appended,
+    forever. An empty list is yielded each time the end of the file is reached.
+    """
+    followed = FollowedFile(path)
+    try:
+        while True:
+            lines = followed.read_lines()
+            yield lines
+            # Lets the other followed files run between two reads
+            await asyncio.sleep(0 if lines else poll_interval)
+    finally:
+        followed.close()
+
+
+async def follow_query(paths, query_filter, emit, poll_interval=POLL_INTERVAL):
+    """
+    Calls emit with the list of logs of paths matching query_filter, once for every batch
+    of lines read, as the files grow. Logs are prefixed with their path when there are
+    several paths.
+    """
+    matches = query_filter.matcher(TimestampDecoder())
+
+    async def follow(path):
+        prefix = f"{path}:" if len(paths) > 1 else ""
+        async for lines in follow_lines(path, poll_interval):
+            logs = [prefix + record.line.strip() for record in parse_lines(lines)
+                    if matches(record.timestamp, record.hostname, record.process, record.message)]
+            if logs:
+                emit(logs)
+
+    if not query_filter.is_empty():
+        await asyncio.gather(*(follow(path) for path in paths))
+
+
+async def follow_counts(paths, emit, poll_interval=POLL_INTERVAL):
+    """
+    Counts the events per process of paths as they grow. Each time a file has been read
+    to its end, emit is called with the processes whose count changed and their counts.
+    """
+    num_event = {}
+
+    async def follow(path):
+        changed = set()
+        async for lines in follow_lines(path, poll_interval):
+            for record in parse_lines(lines):
+                num_event[record.process] = num_event.get(record.process, 0) + 1
+                changed.add(record.process)
+            if not lines and changed:
+                emit({process: num_event[process] for process in sorted(changed)})
+                changed.clear()
+
+    await asyncio.gather(*(follow(path) for path in paths))
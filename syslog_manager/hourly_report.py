@@ -1,7 +1,33 @@
+import re
 import plotext as plt
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-from syslog_manager.utility import parse_syslog_line
+from syslog_manager.multi_file import as_paths
+from syslog_manager.parallel import DEFAULT_JOBS, scan_files
+from syslog_manager.timestamps import SECONDS_PER_DAY, TimestampDecoder, epoch_to_date
+from syslog_manager.utility import print_logs
+
+# Bucket widths in seconds, by name
+BUCKET_WIDTHS = {'minute': 60, '5min': 300, 'hour': 3600, 'day': SECONDS_PER_DAY}
+
+# Units of the widths given as a number, e.g. '15m'
+_WIDTH_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': SECONDS_PER_DAY}
+
+_BLANK = rb'[^\S\n]+'
+_DATE = rb'[A-Za-z]{3}' + _BLANK + rb'\d{1,2}'
+
+# Timestamps of SYSLOG_PATTERN, with a group around the part a histogram needs: the hour
+# of day (None), or the date up to the day, hour, minute or second
+_TIMESTAMP_KEYS = {
+    None: _DATE + _BLANK + rb'(\d{2}):\d{2}:\d{2}',
+    SECONDS_PER_DAY: rb'(' + _DATE + rb')' + _BLANK + rb'\d{2}:\d{2}:\d{2}',
+    3600: rb'(' + _DATE + _BLANK + rb'\d{2}):\d{2}:\d{2}',
+    60: rb'(' + _DATE + _BLANK + rb'\d{2}:\d{2}):\d{2}',
+    1: rb'(' + _DATE + _BLANK + rb'\d{2}:\d{2}:\d{2})',
+}
+
+# Completes a key of every precision into a full timestamp
+_KEY_SUFFIXES = {SECONDS_PER_DAY: ' 00:00:00', 3600: ':00:00', 60: ':00', 1: ''}
 
 
 def parse_log_timestamp(timestamp):
@@ -17,22 +43,124 @@ def parse_log_timestamp(timestamp):
         return None
 
 
-def count_events_per_hour(log_file_path):
+def parse_bucket_width(text):
+    """Seconds of a bucket width given by name, e.g. 'hour', or as a number and a unit, e.g. '15m'."""
+    if text in BUCKET_WIDTHS:
+        return BUCKET_WIDTHS[text]
+    match = re.fullmatch(r'(\d+)([smhd])', text)
+    if match is None or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid bucket width {text}: expected one of {', '.join(BUCKET_WIDTHS)} "
+                         "or a number of s, m, h or d, e.g. 15m")
+    return int(match.group(1)) * _WIDTH_UNITS[match.group(2)]
+
+
+def _precision(width):
+    # Largest part of the timestamp every bucket boundary falls on
+    if width is None:
+        return None
+    return next(precision for precision in (SECONDS_PER_DAY, 3600, 60, 1) if width % precision == 0)
+
+
+def _histogram_pattern(precision, per_process):
+    # The rest of SYSLOG_PATTERN, so that exactly the lines it parses are counted. Lines
+    # are found by their leading newline, a literal the regex engine searches quickly.
+    if per_process:
+        # Same process as the lazy group of SYSLOG_PATTERN, the first alternative
+        # matches the usual names without backtracking
+        process = rb'(?:([^\s\[:]+)(?:\[\d+\])?|(\S+?)(?:\[\d+\])?): '
+    else:
+        # A process, with or without a pid, is any token ending with ':'
+        process = rb'\S+: '
+    return re.compile(rb'\n' + _TIMESTAMP_KEYS[precision] + rb' \S+ ' + process)
+
+
+def _count_keys(blocks, pattern):
+    # Every block is matched at once, and its keys are counted by Counter in C
+    counts = Counter()
+    findall = pattern.findall
+    for block in blocks:
+        counts.update(findall(b'\n' + block))
+    return counts
+
+
+def _key_counts(log_file_path, precision, per_process, jobs):
+    counts = Counter()
+    pattern = _histogram_pattern(precision, per_process)
+    for partial_counts in scan_files(as_paths(log_file_path), _count_keys, args=(pattern,), jobs=jobs, blocks=True):
+        counts.update(partial_counts)
+    return counts
+
+
+def _histogram(counts, bucket, per_process):
+    # Adds up the counts of the keys of every bucket, and of every process with per_process
+    histogram = defaultdict(lambda: defaultdict(int)) if per_process else defaultdict(int)
+    buckets = {}
+    for key, count in counts.items():
+        timestamp = key[0] if per_process else key
+        if timestamp not in buckets:
+            buckets[timestamp] = bucket(timestamp.decode('ascii'))
+        if buckets[timestamp] is None:
+            continue
+        if per_process:
+            # One of the two process groups matched
+            process = (key[1] or key[2]).decode('utf-8', errors='replace')
+            histogram[process][buckets[timestamp]] += count
+        else:
+            histogram[buckets[timestamp]] += count
+    return histogram
+
+
+def _hour_of_day(hour):
+    hour = int(hour)
+    return hour if hour < 24 else None
+
+
+def count_events_per_hour(log_file_path, jobs=DEFAULT_JOBS, per_process=False):
     """
-    Counts the number of log events that occur for each hour of the day from a log file.
+    Counts the number of log events that occur for each hour of the day from a log file,
+    or from a list of them. With per_process, the counts are given for every process.
+    The hour is matched in the raw bytes of whole blocks of lines, which are not decoded.
     """
-    hourly_counts = defaultdict(int)
+    counts = _key_counts(log_file_path, None, per_process, jobs)
+    return _histogram(counts, _hour_of_day, per_process)
+
+
+def count_events_per_bucket(log_file_path, width=3600, jobs=DEFAULT_JOBS, per_process=False):
+    """
+    Counts the log events of a log file, or of a list of them, in buckets of width
+    seconds, keyed by the epoch seconds of their start. With per_process, the counts are
+    given for every process.
+    """
+    precision = _precision(width)
+    decode_timestamp = TimestampDecoder()
+    suffix = _KEY_SUFFIXES[precision]
+
+    def bucket(timestamp):
+        try:
+            epoch = decode_timestamp(timestamp + suffix)
+        except ValueError:
+            return None
+        return epoch - epoch % width
+
+    return _histogram(_key_counts(log_file_path, precision, per_process, jobs), bucket, per_process)
 
-    with open(log_file_path, 'r') as file:
-        for line in file:
-            parsed_line = parse_syslog_line(line)
-            if parsed_line:
-                timestamp = parsed_line.get('timestamp')
-                hour = parse_log_timestamp(timestamp)
-                if hour is not None and 0 <= hour < 24:
-                    hourly_counts[hour] += 1
 
-    return hourly_counts
+def bucket_label(bucket, width):
+    """Date and time of the start of a bucket, down to the precision of its width."""
+    day = epoch_to_date(bucket).strftime('%Y-%m-%d')
+    if width % SECONDS_PER_DAY == 0:
+        return day
+    seconds = bucket % SECONDS_PER_DAY
+    time_of_day = f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}"
+    if width % 60:
+        time_of_day += f":{seconds % 60:02d}"
+    return f"{day} {time_of_day}"
+
+
+def print_process_counts(process_counts, label=str):
+    """Prints the count of every bucket of every process, one per line."""
+    print_logs(f"{label(bucket)}\t{process}\t{count}" for process in sorted(process_counts)
+               for bucket, count in sorted(process_counts[process].items()))
 
 
 def generate_bar_chart(hourly_counts):
@@ -48,3 +176,16 @@ def generate_bar_chart(hourly_counts):
     plt.title('Event Frequency by Hour')
     plt.xticks(hours)
     plt.show()
+
+
+def generate_bucket_chart(bucket_counts, width):
+    """
+    Generates a bar chart showing event frequency per bucket of width seconds using plotext.
+    """
+    buckets = sorted(bucket_counts)
+    plt.bar([bucket_label(bucket, width) for bucket in buckets], [bucket_counts[bucket] for bucket in buckets],
+            color='blue', width=0.6)
+    plt.xlabel('Time')
+    plt.ylabel('Number of Events')
+    plt.title('Event Frequency over Time')
+    plt.show()
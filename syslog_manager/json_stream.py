@@ -0,0 +1,90 @@
+import json
+import re
+
+# Characters read from the file at a time, more when a single value does not fit
+READ_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_SEPARATOR = re.compile(r'[ \t\n\r]*,[ \t\n\r]*')
+
+
+def iter_json_array(file, read_size=READ_SIZE):
+    """
+    Yields the values of the JSON array in the text file one at a time, so memory only
+    holds the value being decoded and the next read_size characters. Raises
+    json.JSONDecodeError for the same documents json.load would reject.
+    """
+    decode = json.JSONDecoder().raw_decode
+    skip_whitespace = _WHITESPACE.match
+    match_separator = _SEPARATOR.match
+    buffer = ''
+    position = 0
+    eof = False
+    # What comes next: '[' the start of the array, 'first' a value or ']', 'value' a value
+    # after a comma, 'separator' a comma or ']', 'end' nothing but whitespace
+    expected = '['
+    while True:
+        position = skip_whitespace(buffer, position).end()
+        if position == len(buffer):
+            if eof:
+                if expected == 'end':
+                    return
+                raise json.JSONDecodeError("Expecting value" if expected == '[' else "Unterminated array",
+                                           buffer, position)
+            # The unread part of the buffer is kept, the read size doubles with it so
+            # decoding a long value again after every read stays linear
+            chunk = file.read(max(read_size, len(buffer) - position))
+            buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+            continue
+
+        char = buffer[position]
+        if expected == '[':
+            if char != '[':
+                raise json.JSONDecodeError("Expecting '['", buffer, position)
+            position += 1
+            expected = 'first'
+        elif expected == 'end':
+            raise json.JSONDecodeError("Extra data", buffer, position)
+        elif char == ']' and expected in ('first', 'separator'):
+            position += 1
+            expected = 'end'
+        elif expected == 'separator':
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+            expected = 'value'
+        else:
+            try:
+                value, end = decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = len(buffer)
+            if end == len(buffer) and not eof:
+                # The value may be cut short by the end of the buffer, e.g. a number
+                chunk = file.read(max(read_size, len(buffer) - position))
+                buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+                continue
+            yield value
+            position = end
+            expected = 'separator'
+            # Fast path through the values that are whole in the buffer
+            size = len(buffer)
+            separator = match_separator(buffer, position)
+            while separator is not None:
+                try:
+                    value, end = decode(buffer, separator.end())
+                except json.JSONDecodeError:
+                    break
+                if end == size:
+                    break
+                yield value
+                position = end
+                separator = match_separator(buffer, end)
+
+
+def iter_json_lines(file):
+    """Yields the value of every non-blank line of a JSON Lines text file."""
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
@@ -0,0 +1,157 @@
+import re
+from functools import lru_cache
+
+# Compiled patterns kept for the following queries of the process
+PATTERN_CACHE_SIZE = 256
+
+# Characters with a meaning in a regular expression outside of a character class
+_SPECIAL_CHARACTERS = frozenset('.^$*+?{}[]()|\\')
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern, flags=0):
+    """re.compile through a bounded cache shared by every query."""
+    return re.compile(pattern, flags)
+
+
+def literal_prefix(pattern):
+    """
+    Longest literal text every match of the regular expression pattern starts with, ''
+    when there is none or the pattern is not simple enough to tell.
+    """
+    prefix = []
+    # Anchoring at the start of the text does not change the text matched
+    position = 1 if pattern.startswith('^') else 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char == '\\':
+            escaped = pattern[position + 1:position + 2]
+            # Escaped punctuation stands for itself, escaped letters and digits are classes or references
+            if not escaped or escaped.isalnum() or escaped == '_' or escaped.isspace():
+                break
+            literal, position = escaped, position + 2
+        elif char in _SPECIAL_CHARACTERS:
+            break
+        else:
+            literal, position = char, position + 1
+        quantifier = pattern[position:position + 1]
+        if quantifier in ('*', '?', '{'):
+            # The literal may be missing or its count is unknown
+            break
+        prefix.append(literal)
+        if quantifier == '+':
+            break
+    if prefix and _has_top_level_alternation(pattern):
+        return ''
+    return ''.join(prefix)
+
+
+def _has_top_level_alternation(pattern):
+    depth = 0
+    in_class = False
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char == '\\':
+            position += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+            # A ] right after [ or [^ is a literal
+            if pattern[position + 1:position + 2] == '^':
+                position += 1
+            if pattern[position + 1:position + 2] == ']':
+                position += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        position += 1
+    return False
+
+
+def _trie(keywords):
+    root = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        # Marks the end of a keyword
+        node[None] = None
+    return root
+
+
+def _trie_alternation(node):
+    """Pattern matching any path from node to the end of a keyword."""
+    prefix = []
+    while True:
+        if None in node:
+            # A keyword ends here, the longer ones sharing this prefix need no checking
+            return ''.join(prefix)
+        if len(node) != 1:
+            break
+        (char, node), = node.items()
+        prefix.append(re.escape(char))
+    branches = [re.escape(char) + _trie_alternation(child) for char, child in node.items()]
+    return ''.join(prefix) + '(?:' + '|'.join(branches) + ')'
+
+
+def keyword_pattern(keywords, flags=0):
+    """
+    Compiles a regular expression matching any of keywords, all str or all bytes. The
+    alternatives are factored into a trie, so the engine compares each character of the
+    text with the keywords sharing the prefix matched so far instead of with every keyword.
+    """
+    keywords = list(keywords)
+    if not keywords:
+        # Matches nothing
+        return compile_pattern('(?!)', flags)
+    if isinstance(keywords[0], bytes):
+        # Latin-1 maps every byte to the character with the same code
+        pattern = _trie_alternation(_trie(keyword.decode('latin-1') for keyword in keywords))
+        return compile_pattern(pattern.encode('latin-1'), flags)
+    return compile_pattern(_trie_alternation(_trie(keywords)), flags)
+
+
+class KeywordMatcher:
+    """
+    Tells whether a text contains any of keywords, or matches any of them when they are
+    regular expressions. Built once per query, it scans the text once however many
+    keywords there are.
+    """
+    def __init__(self, keywords, regex=False, ignore_case=False):
+        self.keywords = list(keywords)
+        flags = re.IGNORECASE if ignore_case else 0
+        if regex:
+            pattern = '|'.join(f'(?:{keyword})' for keyword in self.keywords) if self.keywords else '(?!)'
+            search = compile_pattern(pattern, flags).search
+            self._matches = lambda text: search(text) is not None
+        elif len(self.keywords) == 1 and not ignore_case:
+            keyword, = self.keywords
+            self._matches = lambda text: keyword in text
+        else:
+            search = keyword_pattern(self.keywords, flags).search
+            self._matches = lambda text: search(text) is not None
+
+    def __call__(self, text):
+        return self._matches(text)
+
+
+def read_keywords(path):
+    """Reads one keyword per line, ignoring blank lines and surrounding whitespace."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def read_keyword_arguments(args):
+    """Keywords of the words and --words-file arguments, None when neither is given."""
+    if args.words is None and args.words_file is None:
+        return None
+    keywords = [] if args.words is None else args.words.split(',')
+    if args.words_file is not None:
+        keywords.extend(read_keywords(args.words_file))
+    return keywords
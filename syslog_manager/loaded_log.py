@@ -0,0 +1,149 @@
+import heapq
+import threading
+from array import array
+from bisect import bisect_right
+
+from syslog_manager.keywords import keyword_pattern
+from syslog_manager.log_query import LogQuery
+from syslog_manager.utility import SYSLOG_PATTERN, file_signature
+
+# Below this many candidates from the day, process or hostname lists, checking them is
+# cheaper than searching the whole text for the keywords
+SMALL_CANDIDATE_COUNT = 10000
+
+
+class LoadedLog:
+    """
+    Syslog file held in memory for repeated queries: its text, the start of every valid
+    record and, for every day, process and hostname, the indices of its records. Records
+    with an impossible date, e.g. Feb 30, belong to no day and are listed in undated.
+    """
+    def __init__(self, path, decode_timestamp):
+        self.path = path
+        self.signature = file_signature(path)
+        with open(path, 'rb') as f:
+            # Same line breaks as a file opened in text mode
+            self.text = f.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        self.starts = array('Q')
+        self.days = {}
+        self.processes = {}
+        self.hostnames = {}
+        self.undated = array('I')
+
+        match = SYSLOG_PATTERN.match
+        position = 0
+        for line in self.text.split('\n'):
+            m = match(line)
+            if m:
+                index = len(self.starts)
+                self.starts.append(position)
+                timestamp, hostname, process, _, _ = m.groups()
+                try:
+                    day = decode_timestamp.day_start(timestamp)
+                except ValueError:
+                    # Reported by the queries on time only, as a scan of the file does
+                    day = None
+                    self.undated.append(index)
+                for postings, key in ((self.days, day), (self.processes, process), (self.hostnames, hostname)):
+                    if key is None:
+                        continue
+                    posting = postings.get(key)
+                    if posting is None:
+                        posting = postings[key] = array('I')
+                    posting.append(index)
+            position += len(line) + 1
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _line(self, index):
+        start = self.starts[index]
+        end = self.text.find('\n', start)
+        return self.text[start:] if end == -1 else self.text[start:end]
+
+    def _indices_containing(self, literals):
+        # Indices of the records whose line contains one of literals, in order
+        search = keyword_pattern(literals).search
+        text = self.text
+        starts = self.starts
+        previous_index = -1
+        match = search(text)
+        while match is not None:
+            index = bisect_right(starts, match.start()) - 1
+            # Matches in invalid lines map to the record before them
+            if index >= 0 and index != previous_index:
+                previous_index = index
+                yield index
+            line_end = text.find('\n', match.start())
+            if line_end == -1:
+                return
+            match = search(text, line_end + 1)
+
+    def _candidate_lists(self, query_filter):
+        # Postings of the records matching each dictionary predicate, disjoint within a predicate
+        lists = []
+        if query_filter.has_time_range():
+            # Undated records are checked, so that their timestamp raises ValueError
+            lists.append([posting for day, posting in self.days.items() if query_filter.in_time_range(day)]
+                         + ([self.undated] if self.undated else []))
+        if query_filter.hostname is not None:
+            posting = self.hostnames.get(query_filter.hostname)
+            lists.append([] if posting is None else [posting])
+        if query_filter.process_pattern is not None:
+            lists.append([posting for process, posting in self.processes.items()
+                          if query_filter.process_pattern.match(process)])
+        return lists
+
+    def query(self, query_filter, decode_timestamp):
+        """Yields the stripped lines of the records matching query_filter, in file order."""
+        if query_filter.is_empty():
+            return
+        lists = self._candidate_lists(query_filter)
+        # The predicate leaving the fewest candidates selects them, the others are checked on each
+        lists.sort(key=lambda postings: sum(map(len, postings)))
+        keyword_literals = query_filter.keyword_literals()
+        check = True
+        if lists and (sum(map(len, lists[0])) <= SMALL_CANDIDATE_COUNT or keyword_literals is None):
+            indices = heapq.merge(*lists[0])
+            # A single dictionary predicate is exact
+            check = (len(lists) > 1 or query_filter.keywords is not None
+                     or (query_filter.has_time_range() and len(self.undated) > 0))
+        elif keyword_literals is not None:
+            indices = self._indices_containing(keyword_literals)
+        else:
+            indices = range(len(self))
+
+        if not check:
+            for index in indices:
+                yield self._line(index).strip()
+            return
+        matches = query_filter.matcher(decode_timestamp)
+        match = SYSLOG_PATTERN.match
+        for index in indices:
+            line = self._line(index)
+            timestamp, hostname, process, _, message = match(line).groups()
+            if matches(timestamp, hostname, process, message):
+                yield line.strip()
+
+
+class LoadedLogQuery(LogQuery):
+    """Answers queries on a .log file from a LoadedLog, loaded again when the file changes."""
+    def __init__(self, input_file):
+        super().__init__(input_file)
+        self._lock = threading.Lock()
+        self._loaded_log = LoadedLog(input_file, self._decode_timestamp)
+
+    def loaded_log(self):
+        with self._lock:
+            if file_signature(self.input_file) != self._loaded_log.signature:
+                self._loaded_log = LoadedLog(self.input_file, self._decode_timestamp)
+            return self._loaded_log
+
+    def query(self, query_filter):
+        try:
+            loaded_log = self.loaded_log()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {self.input_file} does not exist.")
+        except IOError as e:
+            raise IOError(f"Error reading the file {self.input_file}: {e}")
+        return loaded_log.query(query_filter, self._decode_timestamp)
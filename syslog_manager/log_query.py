@@ -1,195 +1,289 @@
-import re
 from abc import ABC, abstractmethod
-from datetime import datetime
+from pathlib import Path
 import json
 import csv
 
-from syslog_manager.utility import parse_syslog_line
+from syslog_manager.columnar import ColumnarLogFile
+from syslog_manager.compressed import is_compressed, read_start
+from syslog_manager.json_stream import iter_json_array, iter_json_lines
+from syslog_manager.mapped_lines import count_occurrences, iter_lines, lines_at
+from syslog_manager.multi_file import iter_merged, timed
+from syslog_manager.parallel import DEFAULT_JOBS, iter_scan_file
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.time_index import build_time_index, open_time_index, time_index_path
+from syslog_manager.timestamps import TimestampDecoder
+from syslog_manager.utility import parse_lines
+from syslog_manager.word_index import open_word_index
+
+# Bytes read from the start of a .log file to estimate how often each literal occurs
+NEEDLE_SAMPLE_SIZE = 1 << 20
+
+# Looking keywords up in the word index visits every token once per word, above this many
+# keywords a scan matching them all at once is faster
+WORD_INDEX_MAX_KEYWORDS = 64
 
 
 class LogQuery(ABC):
+    """
+    query(query_filter) yields the logs matching every predicate of a QueryFilter as they
+    are found. The iter_logs_* methods are single predicate queries and the query_logs_*
+    methods return their logs joined by newlines.
+    """
     def __init__(self, input_file):
         self.input_file = input_file
-        self.filtered_logs = []
-
-    def _filter_by_timestamp(self, timestamp_str, start_date, end_date):
-        # Convert the timestamp to a date object
-        entry_timestamp = datetime.strptime(timestamp_str, "%b %d %H:%M:%S %Y").date()
-        # Check if the entry timestamp is within the specified range
-        return start_date <= entry_timestamp <= end_date
-
-    def _process_name_patter(self, process_name):
-        process_name_pattern = re.escape(process_name)
-        return re.compile(rf'{process_name_pattern}')
+        # Resolves the year of the timestamps once for every query of this object
+        self._decode_timestamp = TimestampDecoder()
 
     @abstractmethod
-    def query_logs_between_timestamps(self, start_timestamp, end_timestamp):
+    def query(self, query_filter):
         pass
 
-    @abstractmethod
-    def query_logs_by_process(self, process):
-        pass
+    def iter_logs_between_timestamps(self, start_timestamp, end_timestamp):
+        return self.query(QueryFilter(start_timestamp=start_timestamp, end_timestamp=end_timestamp))
 
-    @abstractmethod
-    def query_logs_by_words(self, keywords):
-        pass
+    def iter_logs_by_process(self, process, regex=False, ignore_case=False):
+        return self.query(QueryFilter(process=process, regex=regex, ignore_case=ignore_case))
 
-
-class LogFileQuery(LogQuery):
-    def __init__(self, input_file):
-        super().__init__(input_file)
-        self._parse_syslog_line = parse_syslog_line
+    def iter_logs_by_words(self, keywords, regex=False, ignore_case=False):
+        return self.query(QueryFilter(keywords=keywords, regex=regex, ignore_case=ignore_case))
 
     def query_logs_between_timestamps(self, start_timestamp, end_timestamp):
-        try:
-            with open(self.input_file, 'r') as f:
-                lines = f.readlines()
-                for line in lines:
-                    entry = self._parse_syslog_line(line)
-                    if entry and self._filter_by_timestamp(f"{entry['timestamp']} {datetime.now().year}",
-                                                           start_timestamp.date(), end_timestamp.date()):
-                        self.filtered_logs.append(line.strip())
-        except FileNotFoundError:
-            raise FileNotFoundError(f"The file {self.input_file} does not exist.")
-        except IOError as e:
-            raise IOError(f"Error reading the file {self.input_file}: {e}")
+        return "\n".join(self.iter_logs_between_timestamps(start_timestamp, end_timestamp))
 
-        return "\n".join(self.filtered_logs)
+    def query_logs_by_process(self, process, regex=False, ignore_case=False):
+        return "\n".join(self.iter_logs_by_process(process, regex=regex, ignore_case=ignore_case))
 
-    def query_logs_by_process(self, process):
-        pattern = self._process_name_patter(process)
-        try:
-            with open(self.input_file, 'r') as file:
-                lines = file.readlines()
-                for line in lines:
-                    parsed_line = self._parse_syslog_line(line)
-                    if parsed_line and pattern.match(parsed_line['process']):
-                        self.filtered_logs.append(line.strip())
-        except FileNotFoundError:
-            raise FileNotFoundError(f"The file {self.input_file} does not exist.")
-        except IOError as e:
-            raise IOError(f"Error reading the file {self.input_file}: {e}")
-
-        return "\n".join(self.filtered_logs)
+    def query_logs_by_words(self, keywords, regex=False, ignore_case=False):
+        return "\n".join(self.iter_logs_by_words(keywords, regex=regex, ignore_case=ignore_case))
 
-    def query_logs_by_words(self, keywords):
-        try:
-            with open(self.input_file, 'r') as syslog_file:
-                for line in syslog_file:
-                    parsed_line = self._parse_syslog_line(line)
-                    if parsed_line:
-                        message = parsed_line['message']
-                        if any(keyword in message for keyword in keywords):
-                            self.filtered_logs.append(line.strip())
-        except FileNotFoundError:
-            raise FileNotFoundError(f"The file {self.input_file} does not exist.")
-        except IOError as e:
-            raise IOError(f"Error reading the file {self.input_file}: {e}")
 
-        return "\n".join(self.filtered_logs)
+def _scan_lines_matching(lines, query_filter, year):
+    matches = query_filter.matcher(TimestampDecoder(year))
+    return (record.line.strip() for record in parse_lines(lines)
+            if matches(record.timestamp, record.hostname, record.process, record.message))
 
 
-class JSONFileQuery(LogQuery):
-    def query_logs_between_timestamps(self, start_timestamp, end_timestamp):
+class LogFileQuery(LogQuery):
+    def __init__(self, input_file, jobs=DEFAULT_JOBS):
+        super().__init__(input_file)
+        self.jobs = jobs
+
+    def _scan(self, scan, *args, needles=None):
+        # Full scan of the file, split over self.jobs processes. Only lines containing one
+        # of needles are decoded and parsed.
+        return iter_scan_file(self.input_file, scan, args, jobs=self.jobs, needles=needles)
+
+    def _time_index(self):
+        time_index = open_time_index(self.input_file, self._decode_timestamp.year)
+        if time_index is None:
+            # Built on first use and kept next to the log for the following queries
+            time_index = build_time_index(self.input_file, self._decode_timestamp)
+            try:
+                time_index.save(time_index_path(self.input_file))
+            except OSError:
+                pass
+        return time_index
+
+    def _word_index_offsets(self, keywords):
+        # Offsets of the candidate lines, if the word index is up to date and can be used
+        word_index = open_word_index(self.input_file)
+        if word_index is None:
+            return None
+        with word_index:
+            return word_index.candidate_offsets(keywords)
+
+    def _most_selective_needles(self, query_filter):
+        # The group of literals occurring the least in a sample of the file
+        groups = [[literal.encode('utf-8') for literal in group] for group in query_filter.needle_groups()]
+        if not groups:
+            return None
+        if len(groups) == 1:
+            return groups[0]
+        sample = read_start(self.input_file, NEEDLE_SAMPLE_SIZE)
+        return min(groups, key=lambda needles: count_occurrences(sample, needles))
+
+    def query(self, query_filter):
+        if query_filter.is_empty():
+            return
+        year = self._decode_timestamp.year
+        # The indexes hold byte offsets, which a compressed file cannot seek to
+        indexed = not is_compressed(self.input_file)
         try:
-            with open(self.input_file, 'r') as f:
-                data = json.load(f)
-                for entry in data:
-                    timestamp = entry.get('timestamp')
-                    if timestamp and self._filter_by_timestamp(f"{timestamp} {datetime.now().year}",
-                                                               start_timestamp.date(), end_timestamp.date()):
-                        self.filtered_logs.append(json.dumps(entry))
+            # Records are in time order: only the part of the file inside the range is read
+            start_offset, end_offset = 0, None
+            ordered = False
+            if indexed and query_filter.has_time_range():
+                time_index = self._time_index()
+                if time_index.ordered:
+                    ordered = True
+                    if query_filter.start is not None:
+                        start_offset = time_index.start_offset(query_filter.start)
+                    if query_filter.end is not None:
+                        end_offset = time_index.end_offset(query_filter.end)
+
+            offsets = None
+            keyword_literals = query_filter.keyword_literals()
+            if indexed and keyword_literals is not None and len(keyword_literals) <= WORD_INDEX_MAX_KEYWORDS:
+                offsets = self._word_index_offsets(keyword_literals)
+
+            needles = self._most_selective_needles(query_filter)
+            if offsets is not None:
+                offsets = [offset for offset in offsets
+                           if offset >= start_offset and (end_offset is None or offset < end_offset)]
+                if offsets:
+                    yield from _scan_lines_matching(lines_at(self.input_file, offsets), query_filter, year)
+            elif ordered:
+                lines = iter_lines(self.input_file, start=start_offset, end=end_offset, needles=needles)
+                yield from _scan_lines_matching(lines, query_filter, year)
+            else:
+                yield from self._scan(_scan_lines_matching, query_filter, year, needles=needles)
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {self.input_file} does not exist.")
         except IOError as e:
             raise IOError(f"Error reading the file {self.input_file}: {e}")
 
-        return "\n".join(self.filtered_logs)
 
-    def query_logs_by_process(self, process):
-        pattern = self._process_name_patter(process)
-        try:
-            with open(self.input_file, 'r') as f:
-                data = json.load(f)
-                for entry in data:
-                    if 'process' in entry and pattern.match(entry['process']):
-                        self.filtered_logs.append(json.dumps(entry))
-        except FileNotFoundError:
-            raise FileNotFoundError(f"The file {self.input_file} does not exist.")
-        except IOError as e:
-            raise IOError(f"Error reading the file {self.input_file}: {e}")
+def _timed_logs(path, query_filter, year):
+    return timed(LogFileQuery(path, jobs=1).query(query_filter), year)
 
-        return "\n".join(self.filtered_logs)
 
-    def query_logs_by_words(self, keywords):
-        try:
-            with open(self.input_file, 'r') as f:
-                data = json.load(f)
-                for entry in data:
-                    if 'message' in entry and any(keyword in entry['message'] for keyword in keywords):
-                        self.filtered_logs.append(json.dumps(entry))
-        except FileNotFoundError:
-            raise FileNotFoundError(f"The file {self.input_file} does not exist.")
-        except IOError as e:
-            raise IOError(f"Error reading the file {self.input_file}: {e}")
+class MergedLogFileQuery(LogQuery):
+    """
+    Queries several syslog files at once, e.g. the rotations of a log, each of them being
+    in time order. The logs of the files are merged lazily in time order, and with more
+    than one job every file is queried by its own worker process.
+    """
+    def __init__(self, input_files, jobs=DEFAULT_JOBS):
+        super().__init__(input_files)
+        self.jobs = jobs
 
-        return "\n".join(self.filtered_logs)
+    def query(self, query_filter):
+        if query_filter.is_empty():
+            return
+        yield from iter_merged(self.input_file, _timed_logs, (query_filter, self._decode_timestamp.year),
+                               jobs=self.jobs)
 
 
-class CSVFileQuery(LogQuery):
-    def query_logs_between_timestamps(self, start_timestamp, end_timestamp):
+class JSONFileQuery(LogQuery):
+    def _entries(self, file):
+        # Decoded one record at a time instead of loading the whole array
+        return iter_json_array(file)
+
+    def query(self, query_filter):
+        if query_filter.is_empty():
+            return
+        matches = query_filter.matcher(self._decode_timestamp)
         try:
             with open(self.input_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    timestamp = row.get('timestamp')
-                    if timestamp and self._filter_by_timestamp(f"{timestamp} {datetime.now().year}",
-                                                              start_timestamp.date(), end_timestamp.date()):
-                        self.filtered_logs.append(str(row))
+                for entry in self._entries(f):
+                    if matches(entry.get('timestamp'), entry.get('hostname'), entry.get('process'),
+                               entry.get('message')):
+                        yield json.dumps(entry)
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {self.input_file} does not exist.")
         except IOError as e:
             raise IOError(f"Error reading the file {self.input_file}: {e}")
 
-        return "\n".join(self.filtered_logs)
 
-    def query_logs_by_process(self, process):
-        pattern = self._process_name_patter(process)
+class JSONLinesFileQuery(JSONFileQuery):
+    def _entries(self, file):
+        return iter_json_lines(file)
+
+
+class CSVFileQuery(LogQuery):
+    def query(self, query_filter):
+        if query_filter.is_empty():
+            return
+        matches = query_filter.matcher(self._decode_timestamp)
         try:
             with open(self.input_file, 'r') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    if 'process' in row and pattern.match(row['process']):
-                        self.filtered_logs.append(str(row))
+                    if matches(row.get('timestamp'), row.get('hostname'), row.get('process'), row.get('message')):
+                        yield str(row)
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {self.input_file} does not exist.")
         except IOError as e:
             raise IOError(f"Error reading the file {self.input_file}: {e}")
 
-        return "\n".join(self.filtered_logs)
 
-    def query_logs_by_words(self, keywords):
+class ColumnarFileQuery(LogQuery):
+    """
+    Queries the columnar export format through a memory map. Each query only reads the
+    columns it filters on, plus the full records of the matches.
+    """
+    def _select_indices(self, log_file, query_filter):
+        # Predicates on dictionary encoded columns are evaluated once per distinct value
+        column_ids = []
+        if query_filter.has_time_range():
+            column_ids.append(('date', {date_id for date_id, date in enumerate(log_file.dates)
+                                        if query_filter.in_time_range(self._decode_timestamp.decode_date(date))},
+                               len(log_file.dates)))
+        if query_filter.hostname is not None:
+            column_ids.append(('hostname', {hostname_id for hostname_id, hostname in enumerate(log_file.hostnames)
+                                            if hostname == query_filter.hostname}, len(log_file.hostnames)))
+        if query_filter.process_pattern is not None:
+            column_ids.append(('process', {process_id for process_id, name in enumerate(log_file.processes)
+                                           if query_filter.process_pattern.match(name)}, len(log_file.processes)))
+        if any(not ids for _, ids, _ in column_ids):
+            return []
+        # The column keeping the smallest share of its values filters first
+        column_ids.sort(key=lambda column: len(column[1]) / column[2])
+
+        keyword_literals = query_filter.keyword_literals()
+        if keyword_literals is not None:
+            # Searching the message blob only visits the matches, so it comes first
+            indices = log_file.indices_with_message_containing_any(keyword_literals)
+        elif column_ids:
+            column_name, ids, _ = column_ids.pop(0)
+            indices = log_file.indices_with_ids(column_name, ids)
+        else:
+            indices = range(log_file.count)
+        for column_name, ids, _ in column_ids:
+            indices = log_file.indices_with_ids(column_name, ids, indices)
+        if query_filter.keywords is not None and not query_filter.keywords_are_literals():
+            # The literals only narrowed the candidates down, their messages are checked last
+            contains_keyword = query_filter.keyword_matcher()
+            indices = (index for index in indices if contains_keyword(log_file.message(index)))
+        return indices
+
+    def query(self, query_filter):
+        if query_filter.is_empty():
+            return
         try:
-            with open(self.input_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if 'message' in row and any(keyword in row['message'] for keyword in keywords):
-                        self.filtered_logs.append(str(row))
+            with ColumnarLogFile(self.input_file) as log_file:
+                for record in log_file.records(self._select_indices(log_file, query_filter)):
+                    yield json.dumps(record)
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {self.input_file} does not exist.")
         except IOError as e:
             raise IOError(f"Error reading the file {self.input_file}: {e}")
 
-        return "\n".join(self.filtered_logs)
-
 
 # Factory method to instantiate the correct subclass based on the file type
-def create_log_query(input_file):
-    if input_file.suffix == '.log':
-        return LogFileQuery(input_file)
+def create_log_query(input_file, jobs=DEFAULT_JOBS):
+    if input_file.suffix == '.log' or is_compressed(input_file):
+        # Only .log files are scanned in parallel, compressed syslog files are decompressed on the fly
+        return LogFileQuery(input_file, jobs=jobs)
     elif input_file.suffix == '.json':
         return JSONFileQuery(input_file)
+    elif input_file.suffix == '.jsonl':
+        return JSONLinesFileQuery(input_file)
     elif input_file.suffix == '.csv':
         return CSVFileQuery(input_file)
+    elif input_file.suffix == '.slc':
+        return ColumnarFileQuery(input_file)
     else:
-        raise ValueError("Unsupported file format. Supported formats are .log, .json, and .csv.")
+        raise ValueError("Unsupported file format. Supported formats are .log (also compressed as .gz, .bz2 or "
+                         ".xz), .json, .jsonl, .csv and .slc.")
+
+
+def create_merged_log_query(input_files, jobs=DEFAULT_JOBS):
+    """Query over one file of any format, or over several syslog files merged in time order."""
+    if len(input_files) == 1:
+        return create_log_query(Path(input_files[0]), jobs=jobs)
+    for input_file in input_files:
+        if Path(input_file).suffix != '.log' and not is_compressed(input_file):
+            raise ValueError(f"Only .log files, also compressed as .gz, .bz2 or .xz, can be queried together, "
+                             f"got {input_file}")
+    return MergedLogFileQuery(list(input_files), jobs=jobs)
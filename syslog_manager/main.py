@@ -1,8 +1,8 @@
 import argparse
+import asyncio
 import os
 import sys
 from datetime import datetime
-from pathlib import Path
 
 # Get the directory containing the current script
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,121 +12,321 @@ project_path = os.path.abspath(os.path.join(script_dir, '..'))
 if project_path not in sys.path:
     sys.path.append(project_path)
 
-from syslog_manager.split_by_day import split_syslog_by_day
+from syslog_manager.split_by_day import COMPRESSIONS, MANIFEST_NAME, MAX_OPEN_FILES, split_syslog_by_day
 from syslog_manager.count_event_per_process import count_event_per_process
-from syslog_manager.exporter import JSONSyslogExporter, CSVSyslogExporter, SQLSyslogExporter
-from syslog_manager.log_query import create_log_query
+from syslog_manager.exporter import (JSONSyslogExporter, JSONLinesSyslogExporter, CSVSyslogExporter, SQLSyslogExporter,
+                                     SQLiteSyslogExporter, ColumnarSyslogExporter, DEFAULT_CHUNK_SIZE,
+                                     VALIDATION_MODES, SQL_DIALECTS)
+from syslog_manager.compressed import is_compressed
+from syslog_manager.client import DEFAULT_HOST, DEFAULT_PORT, query_server
+from syslog_manager.follow import follow_counts, follow_query
+from syslog_manager.keywords import read_keyword_arguments
+from syslog_manager.log_query import create_merged_log_query
+from syslog_manager.multi_file import expand_inputs, iter_merged, timed
+from syslog_manager.parallel import DEFAULT_JOBS
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.server import serve
+from syslog_manager.time_index import build_time_index, time_index_path
+from syslog_manager.utility import print_logs
+from syslog_manager.word_index import build_word_index
 from syslog_manager.hourly_report import *
 
 
+def print_event_counts(num_event):
+    print_logs(f'Events for process {process}: {num_events}' for process, num_events in num_event.items())
+
+
+def non_negative_int(text):
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+    return value
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def check_log_files(input_files, compressed=True):
+    expected = ".log, .gz, .bz2 or .xz" if compressed else ".log"
+    for input_file in input_files:
+        input_file_extension = input_file.split('.')[-1]
+        if input_file_extension != 'log' and not (compressed and is_compressed(input_file)):
+            raise ValueError(f"Input file format not supported: Expected {expected}, got {input_file_extension}")
+
+
+def run_until_interrupted(coroutine):
+    try:
+        asyncio.run(coroutine)
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
     parser = argparse.ArgumentParser(description="Syslog export utility")
     subparsers = parser.add_subparsers(dest="command")
 
+    # Option shared by the commands that scan a whole .log file
+    jobs_parser = argparse.ArgumentParser(add_help=False)
+    jobs_parser.add_argument('--jobs', type=non_negative_int, default=DEFAULT_JOBS,
+                             help='Number of processes scanning .log files in parallel, 0 for one per CPU '
+                                  f'(default: {DEFAULT_JOBS}). With several input files, every file is read '
+                                  'by its own process')
+
+    # Options shared by the queries matching process names or messages
+    search_mode_parser = argparse.ArgumentParser(add_help=False)
+    search_mode_parser.add_argument('--regex', action='store_true',
+                                    help='Treat the process name and the words as regular expressions')
+    search_mode_parser.add_argument('-i', '--ignore-case', action='store_true',
+                                    help='Match the process name and the words regardless of case')
+
     # Export command
     export_parser = subparsers.add_parser('export', help='Export syslog data')
-    export_parser.add_argument('format', choices=['json', 'csv', 'sql'], help='Export format')
-    export_parser.add_argument('input_file', type=str, help='Path to the syslog file')
+    export_parser.add_argument('format', choices=['json', 'jsonl', 'csv', 'sql', 'sqlite', 'slc'],
+                               help='Export format (slc is the columnar binary format)')
+    export_parser.add_argument('input_files', type=str, nargs='+',
+                               help='Paths or glob patterns of the syslog files, merged in time order')
     export_parser.add_argument('output_file', type=str, help='Path to the output file')
+    export_parser.add_argument('--stream', action='store_true',
+                               help='Read, parse and write records in chunks instead of loading the whole file')
+    export_parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                               help=f'Number of records per chunk in streaming mode (default: {DEFAULT_CHUNK_SIZE})')
+    export_parser.add_argument('--compact', action='store_true', help='Write the JSON export without indentation')
+    export_parser.add_argument('--validate', choices=VALIDATION_MODES, default='full',
+                               help='Validate every record, a sample of the records, or none (default: full)')
+    export_parser.add_argument('--batch-size', type=positive_int, default=1,
+                               help='Number of rows per INSERT statement in SQL exports (default: 1)')
+    export_parser.add_argument('--transactions', action='store_true',
+                               help='Wrap every chunk of INSERT statements in a transaction in SQL exports')
+    export_parser.add_argument('--jobs', type=non_negative_int, default=DEFAULT_JOBS,
+                               help='Read every input file in its own process when above 1 '
+                                    f'(default: {DEFAULT_JOBS})')
+    export_parser.add_argument('--dialect', choices=SQL_DIALECTS, default='insert',
+                               help='Write INSERT statements or a COPY syslog FROM stdin block in SQL exports')
 
     # Query command
     query_parser = subparsers.add_parser('query', help='Query syslog data')
-    query_parser.add_argument('file_format', type=str, choices=['log', 'json', 'csv'],
-                              help='Input file format (log, json, csv)')
-    query_parser.add_argument('input_file', type=str, help='Path to the syslog file')
+    query_parser.add_argument('file_format', type=str, choices=['log', 'json', 'jsonl', 'csv', 'slc'],
+                              help='Input file format (log, json, jsonl, csv, slc)')
+    query_parser.add_argument('input_file', type=str,
+                              help='Path to the syslog file, or quoted glob pattern of log files whose logs are '
+                                   'merged in time order')
+    query_parser.add_argument('--server', type=str,
+                              help='URL of a running syslog_manager serve to send the query to, '
+                                   f'e.g. http://{DEFAULT_HOST}:{DEFAULT_PORT} (log format only)')
+    query_parser.add_argument('--follow', action='store_true',
+                              help='Keep reading the file as it grows, across rotations, and print new matches '
+                                   'until interrupted (log format only)')
     query_subparsers = query_parser.add_subparsers(dest='query_type')
 
     # 'between' command under 'query'
-    between_parser = query_subparsers.add_parser('between', help='Query syslog data between two timestamps')
+    between_parser = query_subparsers.add_parser('between', help='Query syslog data between two timestamps',
+                                                 parents=[jobs_parser])
     between_parser.add_argument('start_date', type=str, help='Start date (format: DD/MM/YYYY)')
     between_parser.add_argument('end_date', type=str, help='End date (format: DD/MM/YYYY)')
 
     # 'from_process' command under 'query'
-    from_process_parser = query_subparsers.add_parser('from_process', help='Query syslog data from a specific process')
+    from_process_parser = query_subparsers.add_parser('from_process', help='Query syslog data from a specific process',
+                                                      parents=[jobs_parser, search_mode_parser])
     from_process_parser.add_argument('process_name', type=str, help='Name of the process to filter by')
 
     # 'contains_words' command under 'query'
-    contains_words_parser = query_subparsers.add_parser('contains_words', help='Query syslog data for messages containing specific words')
-    contains_words_parser.add_argument('words', type=str, help='Comma-separated list of words to search for')
+    contains_words_parser = query_subparsers.add_parser('contains_words', help='Query syslog data for messages containing specific words',
+                                                        parents=[jobs_parser, search_mode_parser])
+    contains_words_parser.add_argument('words', type=str, nargs='?', help='Comma-separated list of words to search for')
+    contains_words_parser.add_argument('--words-file', type=str,
+                                       help='File with one word to search for per line')
+
+    # 'filter' command under 'query'
+    filter_parser = query_subparsers.add_parser('filter', help='Query syslog data matching every given predicate '
+                                                               'in a single pass',
+                                                parents=[jobs_parser, search_mode_parser])
+    filter_parser.add_argument('--start', type=str, help='Start date (format: DD/MM/YYYY)')
+    filter_parser.add_argument('--end', type=str, help='End date (format: DD/MM/YYYY)')
+    filter_parser.add_argument('--process', type=str, help='Name of the process to filter by')
+    filter_parser.add_argument('--hostname', type=str, help='Hostname to filter by')
+    filter_parser.add_argument('--words', type=str, help='Comma-separated list of words to search for')
+    filter_parser.add_argument('--words-file', type=str, help='File with one word to search for per line')
+
+    # Serve command
+    serve_parser = subparsers.add_parser('serve', help='Load .log files in memory and answer queries on them '
+                                                       'over HTTP')
+    serve_parser.add_argument('input_files', type=str, nargs='+', help='Paths or glob patterns of the syslog files')
+    serve_parser.add_argument('--host', type=str, default=DEFAULT_HOST,
+                              help=f'Address to listen on (default: {DEFAULT_HOST})')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                              help=f'Port to listen on (default: {DEFAULT_PORT})')
+
+    # Index command
+    index_parser = subparsers.add_parser('index', help='Build indexes that speed up queries on a syslog file')
+    index_subparsers = index_parser.add_subparsers(dest='index_command')
+    index_build_parser = index_subparsers.add_parser('build', help='Build the word index used by contains_words '
+                                                                   'queries and the time index used by between queries')
+    index_build_parser.add_argument('input_files', type=str, nargs='+',
+                                    help='Paths or glob patterns of the syslog files')
 
     # Split command
-    split_parser = subparsers.add_parser('split', help='Split syslog file by day')
-    split_parser.add_argument('input_file', type=str, help='Path to the syslog file')
+    split_parser = subparsers.add_parser('split', help='Split syslog file by day', parents=[jobs_parser])
+    split_parser.add_argument('input_files', type=str, nargs='+',
+                              help='Paths or glob patterns of the syslog files')
+    split_parser.add_argument('--output-dir', type=str,
+                              help='Directory of the daily files, created if missing (default: next to the input)')
+    split_parser.add_argument('--max-open-files', type=positive_int, default=MAX_OPEN_FILES,
+                              help=f'Number of daily files kept open at once (default: {MAX_OPEN_FILES})')
+    split_parser.add_argument('--compress', choices=COMPRESSIONS,
+                              help='Write the daily files compressed, in a thread pool while the log is parsed')
+    split_parser.add_argument('--manifest', action='store_true',
+                              help=f'Write the line count, size and input byte range of every day to {MANIFEST_NAME}')
 
     # Print number of event for each process
-    events_counter = subparsers.add_parser('count_event_per_process', help='Count the number of events per process')
-    events_counter.add_argument('input_file', type=str, help='Path to the syslog file')
+    events_counter = subparsers.add_parser('count_event_per_process', help='Count the number of events per process',
+                                           parents=[jobs_parser])
+    events_counter.add_argument('input_files', type=str, nargs='+',
+                                help='Paths or glob patterns of the syslog files')
+    events_counter.add_argument('--follow', action='store_true',
+                                help='Keep reading the file as it grows, across rotations, and print the updated '
+                                     'counts until interrupted')
 
     # Hourly report command
-    hourly_report_parser = subparsers.add_parser('hourly_report', help='Generate hourly event frequency report')
-    hourly_report_parser.add_argument('input_file', type=str, help='Path to the syslog file')
+    hourly_report_parser = subparsers.add_parser('hourly_report', help='Generate hourly event frequency report',
+                                                 parents=[jobs_parser])
+    hourly_report_parser.add_argument('input_files', type=str, nargs='+',
+                                      help='Paths or glob patterns of the syslog files')
+    hourly_report_parser.add_argument('--bucket', type=parse_bucket_width,
+                                      help='Count the events over time in buckets of this width instead of per hour '
+                                           f'of the day: {", ".join(BUCKET_WIDTHS)}, or a number of s, m, h or d, '
+                                           'e.g. 15m')
+    hourly_report_parser.add_argument('--per-process', action='store_true',
+                                      help='Print the counts of every process instead of a chart')
 
     args = parser.parse_args()
 
     if args.command == 'export':
-        input_file_extension = args.input_file.split('.')[-1]
+        input_files = expand_inputs(args.input_files)
+        check_log_files(input_files)
+        input_file = input_files[0] if len(input_files) == 1 else input_files
         output_file_extension = args.output_file.split('.')[-1]
-        if input_file_extension != 'log':
-            raise ValueError(f"Input file format not supported: Expected .log, got {input_file_extension}")
-        if output_file_extension != args.format:
-            raise ValueError(f"File format mismatch: Expected {args.file_format}, got {output_file_extension}")
+        expected_extensions = ['db', 'sqlite', 'sqlite3'] if args.format == 'sqlite' else [args.format]
+        if output_file_extension not in expected_extensions:
+            raise ValueError(f"File format mismatch: Expected {args.format}, got {output_file_extension}")
         if args.format == 'json':
-            json_exporter = JSONSyslogExporter(args.input_file)
+            json_exporter = JSONSyslogExporter(input_file, streaming=args.stream, chunk_size=args.chunk_size,
+                                               validate=args.validate, compact=args.compact,
+                                               jobs=args.jobs)
             json_exporter.export(args.output_file)
+        elif args.format == 'jsonl':
+            jsonl_exporter = JSONLinesSyslogExporter(input_file, streaming=args.stream,
+                                                     chunk_size=args.chunk_size, validate=args.validate, jobs=args.jobs)
+            jsonl_exporter.export(args.output_file)
         elif args.format == 'csv':
-            csv_exporter = CSVSyslogExporter(args.input_file)
+            csv_exporter = CSVSyslogExporter(input_file, streaming=args.stream,
+                                             chunk_size=args.chunk_size, validate=args.validate, jobs=args.jobs)
             csv_exporter.export(args.output_file)
         elif args.format == 'sql':
-            sql_exporter = SQLSyslogExporter(args.input_file)
+            sql_exporter = SQLSyslogExporter(input_file, streaming=args.stream, chunk_size=args.chunk_size,
+                                             batch_size=args.batch_size, transactions=args.transactions,
+                                             dialect=args.dialect, jobs=args.jobs)
             sql_exporter.export(args.output_file)
+        elif args.format == 'sqlite':
+            sqlite_exporter = SQLiteSyslogExporter(input_file, streaming=args.stream, chunk_size=args.chunk_size,
+                                                   jobs=args.jobs)
+            sqlite_exporter.export(args.output_file)
+        elif args.format == 'slc':
+            columnar_exporter = ColumnarSyslogExporter(input_file, streaming=args.stream,
+                                                       chunk_size=args.chunk_size, jobs=args.jobs)
+            columnar_exporter.export(args.output_file)
         else:
             parser.print_help()
 
     elif args.command == 'query':
-        file_extension = args.input_file.split('.')[-1]
-        # Check if the file extension matches the specified file format
-        if file_extension != args.file_format:
-            raise ValueError(f"File format mismatch: Expected {args.file_format}, got {file_extension}")
+        input_files = expand_inputs([args.input_file])
+        for input_file in input_files:
+            file_extension = input_file.split('.')[-1]
+            # Check if the file extension matches the specified file format
+            if file_extension != args.file_format and not (args.file_format == 'log' and is_compressed(input_file)):
+                raise ValueError(f"File format mismatch: Expected {args.file_format}, got {file_extension}")
         if args.query_type == 'between':
-            start_date = datetime.strptime(args.start_date, "%d/%m/%Y")
-            end_date = datetime.strptime(args.end_date, "%d/%m/%Y")
-            # Call the log query function based on the format
-            log_query = create_log_query(Path(args.input_file))
-            result = log_query.query_logs_between_timestamps(start_date, end_date)
-            print(result)
+            query_filter = QueryFilter(start_timestamp=datetime.strptime(args.start_date, "%d/%m/%Y"),
+                                       end_timestamp=datetime.strptime(args.end_date, "%d/%m/%Y"))
         elif args.query_type == 'from_process':
-            log_query = create_log_query(Path(args.input_file))
-            result = log_query.query_logs_by_process(args.process_name)
-            print(result)
+            query_filter = QueryFilter(process=args.process_name, regex=args.regex, ignore_case=args.ignore_case)
         elif args.query_type == 'contains_words':
-            keywords = args.words.split(',')
+            keywords = read_keyword_arguments(args)
+            if keywords is None:
+                parser.error("contains_words requires words or --words-file")
+            query_filter = QueryFilter(keywords=keywords, regex=args.regex, ignore_case=args.ignore_case)
+        elif args.query_type == 'filter':
+            query_filter = QueryFilter(
+                start_timestamp=datetime.strptime(args.start, "%d/%m/%Y") if args.start else None,
+                end_timestamp=datetime.strptime(args.end, "%d/%m/%Y") if args.end else None,
+                process=args.process, hostname=args.hostname,
+                keywords=read_keyword_arguments(args), regex=args.regex, ignore_case=args.ignore_case)
+        else:
+            parser.print_help()
+            return
+        if args.follow:
+            if args.file_format != 'log' or args.server or any(map(is_compressed, input_files)):
+                raise ValueError("--follow only reads uncompressed log files directly")
+            run_until_interrupted(follow_query(input_files, query_filter, print_logs))
+        elif args.server:
+            if args.file_format != 'log':
+                raise ValueError(f"Only log files are served, got {args.file_format}")
+            # The logs answered for every file are merged in time order
+            print_logs(iter_merged(input_files, lambda input_file: timed(
+                query_server(args.server, input_file, query_filter))))
+        else:
             # Call the log query function based on the format
-            log_query = create_log_query(Path(args.input_file))
-            result = log_query.query_logs_by_words(keywords)
-            print(result)
+            log_query = create_merged_log_query(input_files, jobs=args.jobs)
+            print_logs(log_query.query(query_filter))
+
+    elif args.command == 'serve':
+        input_files = expand_inputs(args.input_files)
+        check_log_files(input_files, compressed=False)
+        serve(input_files, host=args.host, port=args.port)
+
+    elif args.command == 'index':
+        if args.index_command == 'build':
+            input_files = expand_inputs(args.input_files)
+            check_log_files(input_files, compressed=False)
+            for input_file in input_files:
+                build_word_index(input_file)
+                build_time_index(input_file).save(time_index_path(input_file))
         else:
             parser.print_help()
 
     elif args.command == 'split':
-        input_file_extension = args.input_file.split('.')[-1]
-        if input_file_extension != 'log':
-            raise ValueError(f"Input file format not supported: Expected .log, got {input_file_extension}")
-        split_syslog_by_day(args.input_file)
+        input_files = expand_inputs(args.input_files)
+        check_log_files(input_files)
+        split_syslog_by_day(input_files, jobs=args.jobs, output_dir=args.output_dir,
+                            max_open_files=args.max_open_files, compression=args.compress, manifest=args.manifest)
 
     elif args.command == 'count_event_per_process':
-        input_file_extension = args.input_file.split('.')[-1]
-        if input_file_extension != 'log':
-            raise ValueError(f"Input file format not supported: Expected .log, got {input_file_extension}")
-        num_event = count_event_per_process(args.input_file)
-        for process, num_events in num_event.items():
-            print(f'Events for process {process}: {num_events}')
+        input_files = expand_inputs(args.input_files)
+        check_log_files(input_files)
+        if args.follow:
+            run_until_interrupted(follow_counts(input_files, print_event_counts))
+        else:
+            print_event_counts(count_event_per_process(input_files, jobs=args.jobs))
 
     elif args.command == 'hourly_report':
-        input_file_extension = args.input_file.split('.')[-1]
-        if input_file_extension != 'log':
-            raise ValueError(f"Input file format not supported: Expected .log, got {input_file_extension}")
-        hourly_counts = count_events_per_hour(args.input_file)
-        generate_bar_chart(hourly_counts)
+        input_files = expand_inputs(args.input_files)
+        check_log_files(input_files)
+        if args.bucket is None:
+            hourly_counts = count_events_per_hour(input_files, jobs=args.jobs, per_process=args.per_process)
+            if args.per_process:
+                print_process_counts(hourly_counts, label=lambda hour: f"{hour:02d}:00")
+            else:
+                generate_bar_chart(hourly_counts)
+        else:
+            bucket_counts = count_events_per_bucket(input_files, width=args.bucket, jobs=args.jobs,
+                                                    per_process=args.per_process)
+            if args.per_process:
+                print_process_counts(bucket_counts, label=lambda bucket: bucket_label(bucket, args.bucket))
+            else:
+                generate_bucket_chart(bucket_counts, args.bucket)
 
     else:
         parser.print_help()
@@ -0,0 +1,201 @@
+import heapq
+import io
+import mmap
+import os
+
+from syslog_manager.compressed import is_compressed, iter_decompressed
+from syslog_manager.keywords import keyword_pattern
+
+# Bytes read at once, extended to the next line end
+BLOCK_SIZE = 1 << 20
+
+# With needles, a block is decoded whole when more than one line in DENSE_MATCH_RATIO
+# contains one, otherwise only the matching lines are located and decoded
+DENSE_MATCH_RATIO = 8
+
+# Above this many needles, blocks are searched with a single pattern instead of once per needle
+MAX_COUNTED_NEEDLES = 8
+
+
+def _decode(raw_line):
+    # Same line as a file opened in text mode returns
+    line = raw_line.decode('utf-8')
+    if line.endswith('\r\n'):
+        return line[:-2] + '\n'
+    return line
+
+
+def _split_block(block):
+    return io.TextIOWrapper(io.BytesIO(block), encoding='utf-8', newline=None)
+
+
+def _blocks(log_map, start, end):
+    """Yields consecutive blocks of whole lines between the byte offsets start and end."""
+    position = start
+    while position < end:
+        block_end = min(position + BLOCK_SIZE, end)
+        if block_end < end:
+            newline = log_map.rfind(b'\n', position, block_end)
+            if newline == -1:
+                # Line longer than a block
+                newline = log_map.find(b'\n', block_end, end)
+            block_end = end if newline == -1 else newline + 1
+        yield log_map[position:block_end]
+        position = block_end
+
+
+def _line_spans(block, needle):
+    """Yields the (start, end) offsets of the lines of block containing needle."""
+    find = block.find
+    position = find(needle)
+    while position != -1 and position < len(block):
+        line_start = block.rfind(b'\n', 0, position) + 1
+        line_end = find(b'\n', position)
+        line_end = len(block) if line_end == -1 else line_end + 1
+        yield line_start, line_end
+        position = find(needle, line_end)
+
+
+def _lines_containing(block, needles):
+    """Yields the lines of block containing any of needles, without splitting the whole block."""
+    if len(needles) == 1:
+        spans = _line_spans(block, needles[0])
+    else:
+        spans = heapq.merge(*(_line_spans(block, needle) for needle in needles))
+    previous_start = -1
+    for line_start, line_end in spans:
+        if line_start != previous_start:
+            previous_start = line_start
+            yield _decode(block[line_start:line_end])
+
+
+def _lines_matching(block, search):
+    """Yields the lines of block in which search finds a match."""
+    position = 0
+    size = len(block)
+    while position < size:
+        match = search(block, position)
+        if match is None:
+            return
+        line_start = block.rfind(b'\n', 0, match.start()) + 1
+        line_end = block.find(b'\n', match.start())
+        line_end = size if line_end == -1 else line_end + 1
+        yield _decode(block[line_start:line_end])
+        position = line_end
+
+
+def count_occurrences(data, needles):
+    """Number of occurrences of needles in data, only counting one of overlapping ones above MAX_COUNTED_NEEDLES."""
+    if len(needles) <= MAX_COUNTED_NEEDLES:
+        return sum(data.count(needle) for needle in needles)
+    return sum(1 for _ in keyword_pattern(needles).finditer(data))
+
+
+def _line_ranges(block, position):
+    """Yields the (start, end, line) of every line of block, which starts at the byte offset position."""
+    raw_lines = block.split(b'\n')
+    last = raw_lines.pop()
+    for raw_line in raw_lines:
+        end = position + len(raw_line) + 1
+        yield position, end, _decode(raw_line + b'\n')
+        position = end
+    if last:
+        yield position, position + len(last), _decode(last)
+
+
+def _whole_line_blocks(chunks):
+    """Joins consecutive chunks of bytes into blocks of whole lines."""
+    rest = b''
+    for chunk in chunks:
+        block = rest + chunk
+        newline = block.rfind(b'\n')
+        if newline == -1:
+            rest = block
+            continue
+        rest = block[newline + 1:]
+        yield block[:newline + 1]
+    if rest:
+        yield rest
+
+
+def _block_lines(blocks, start, needles, offsets):
+    """Lines of consecutive blocks of whole lines, the first one starting at the byte offset start."""
+    if offsets:
+        position = start
+        for block in blocks:
+            yield from _line_ranges(block, position)
+            position += len(block)
+        return
+    if needles is None:
+        for block in blocks:
+            yield from _split_block(block)
+        return
+
+    if len(needles) > MAX_COUNTED_NEEDLES:
+        # The blocks are scanned once for all needles
+        search = keyword_pattern(needles).search
+        for block in blocks:
+            yield from _lines_matching(block, search)
+        return
+
+    text_needles = [needle.decode('utf-8') for needle in needles]
+    for block in blocks:
+        matches = sum(block.count(needle) for needle in needles)
+        if not matches:
+            continue
+        if matches * DENSE_MATCH_RATIO <= block.count(b'\n'):
+            yield from _lines_containing(block, needles)
+        elif len(text_needles) == 1:
+            text_needle, = text_needles
+            yield from [line for line in _split_block(block) if text_needle in line]
+        else:
+            lines = list(_split_block(block))
+            selected = set()
+            for text_needle in text_needles:
+                selected.update([number for number, line in enumerate(lines) if text_needle in line])
+            yield from [lines[number] for number in sorted(selected)]
+
+
+def iter_lines(path, start=0, end=None, needles=None, offsets=False):
+    """
+    Yields the lines of path between the byte offsets start and end, which must be line
+    starts, as a file opened in text mode would. The file is read through a memory map.
+    With needles, a list of byte strings, only the lines containing one of them are
+    yielded, and blocks with few matches only decode the matching lines. Matching lines
+    are delimited by '\n', so lone '\r' line breaks are only honoured without needles.
+    With offsets, every line is yielded as a (start, end, line) tuple of its byte range
+    and its text, lines being delimited by '\n', and needles are ignored.
+    Compressed files are decompressed in a background thread and read whole, their
+    offsets are those of the decompressed content.
+    """
+    yield from _block_lines(iter_blocks(path, start, end), start, needles, offsets)
+
+
+def iter_blocks(path, start=0, end=None):
+    """
+    Yields the bytes of path between the byte offsets start and end, which must be line
+    starts, in blocks of whole lines of about BLOCK_SIZE bytes, for scans that match
+    the raw bytes instead of decoding lines. Compressed files are read whole.
+    """
+    if is_compressed(path):
+        if start != 0 or end is not None:
+            raise ValueError(f"Byte ranges of the compressed file {path} cannot be read")
+        yield from _whole_line_blocks(iter_decompressed(path))
+        return
+    with open(path, 'rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            end = len(log_map) if end is None else min(end, len(log_map))
+            yield from _blocks(log_map, start, end)
+
+
+def lines_at(path, offsets):
+    """Yields the lines of path starting at the given byte offsets."""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            find = log_map.find
+            for offset in offsets:
+                line_end = find(b'\n', offset)
+                yield _decode(log_map[offset:len(log_map) if line_end == -1 else line_end + 1])
@@ -0,0 +1,139 @@
+import glob
+import heapq
+import multiprocessing
+import os
+import re
+from operator import itemgetter
+
+from syslog_manager.mapped_lines import iter_lines
+from syslog_manager.parallel import DEFAULT_JOBS, resolve_jobs
+from syslog_manager.timestamps import TimestampDecoder
+
+# Items sent at once by a file worker to the merge
+MERGE_BATCH_SIZE = 1024
+
+# Batches every file worker produces ahead of the merge
+MERGE_QUEUE_SIZE = 4
+
+_GLOB_CHARACTERS = re.compile(r'[*?[]')
+
+# Same layout as the timestamp of SYSLOG_PATTERN
+_TIMESTAMP = re.compile(r'[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}')
+
+_END = None
+
+
+def expand_inputs(patterns):
+    """
+    Paths of the input files given as paths or glob patterns, in the given order, the
+    matches of a pattern sorted by name and every path listed once. A path that is not a
+    pattern is kept as is, so a missing file is reported by the reader.
+    """
+    paths = []
+    for pattern in patterns:
+        if _GLOB_CHARACTERS.search(pattern):
+            matches = sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+            if not matches:
+                raise FileNotFoundError(f"No file matches {pattern}.")
+        else:
+            matches = [pattern]
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+
+def as_paths(files):
+    """List of paths of a path or of an iterable of paths."""
+    if isinstance(files, (str, os.PathLike)):
+        return [files]
+    return list(files)
+
+
+def timed(lines, year=None):
+    """
+    Yields (epoch, line) for every syslog line. A line without a valid timestamp gets the
+    epoch of the line before it, so it stays after that line once merged.
+    """
+    decode_timestamp = TimestampDecoder(year)
+    match = _TIMESTAMP.match
+    epoch = 0
+    for line in lines:
+        m = match(line)
+        if m:
+            try:
+                epoch = decode_timestamp(m.group())
+            except ValueError:
+                pass
+        yield epoch, line
+
+
+def timed_lines(path, year=None):
+    """timed over the lines of a syslog file, compressed or not."""
+    return timed(iter_lines(path), year)
+
+
+def _merge_scans(paths, scan, args):
+    # Items of the same second keep the order of paths
+    return heapq.merge(*(scan(path, *args) for path in paths), key=itemgetter(0))
+
+
+def _produce(scan, args, paths, batches):
+    try:
+        batch = []
+        for item in _merge_scans(paths, scan, args):
+            batch.append(item)
+            if len(batch) >= MERGE_BATCH_SIZE:
+                batches.put(batch)
+                batch = []
+        if batch:
+            batches.put(batch)
+        batches.put(_END)
+    except BaseException as e:
+        # Raised again by the merge
+        batches.put(e)
+
+
+def _consume(batches):
+    while True:
+        batch = batches.get()
+        if batch is _END:
+            return
+        if isinstance(batch, BaseException):
+            raise batch
+        yield from batch
+
+
+def iter_merged(paths, scan, args=(), jobs=DEFAULT_JOBS):
+    """
+    Yields the items of every path merged in time order, scan(path, *args) yielding the
+    (epoch, item) pairs of a path in time order. The merge is a lazy k-way merge on a
+    heap, which holds one item per path, and items of the same second keep the order of
+    paths. With more than one job the paths are split into at most jobs consecutive
+    groups, each merged by its own worker process, which sends its items in batches
+    through a bounded queue, so scan and its arguments must be picklable.
+    """
+    worker_count = min(resolve_jobs(jobs), len(paths))
+    if worker_count <= 1:
+        for _, item in _merge_scans(paths, scan, args):
+            yield item
+        return
+
+    context = multiprocessing.get_context()
+    workers, queues = [], []
+    try:
+        for number in range(worker_count):
+            group = paths[number * len(paths) // worker_count:(number + 1) * len(paths) // worker_count]
+            batches = context.Queue(maxsize=MERGE_QUEUE_SIZE)
+            worker = context.Process(target=_produce, args=(scan, args, group, batches), daemon=True)
+            worker.start()
+            workers.append(worker)
+            queues.append(batches)
+        for _, item in heapq.merge(*(_consume(batches) for batches in queues), key=itemgetter(0)):
+            yield item
+    finally:
+        # A consumer that stops early does not wait for the workers to scan the rest
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        for batches in queues:
+            batches.close()
@@ -0,0 +1,126 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from syslog_manager.compressed import is_compressed
+from syslog_manager.mapped_lines import iter_blocks, iter_lines
+
+DEFAULT_JOBS = 1
+
+# Every worker gets a few ranges, so a slow range does not leave the other workers idle
+RANGES_PER_JOB = 4
+
+# Largest byte range scanned by a worker when results are streamed, as the matches of a
+# whole range are held in memory until they are consumed
+STREAM_RANGE_SIZE = 1 << 24
+
+
+def resolve_jobs(jobs):
+    """Number of worker processes for a --jobs value, 0 meaning one per CPU."""
+    if jobs < 0:
+        raise ValueError(f"The number of jobs must be 0 or more, got {jobs}.")
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def split_ranges(path, parts):
+    """Splits path into at most parts (start, end) byte ranges that begin at a line start."""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        for part in range(1, parts):
+            position = size * part // parts
+            if position <= boundaries[-1]:
+                continue
+            # Reading from the byte before keeps a boundary that already is a line start
+            f.seek(position - 1)
+            f.readline()
+            position = f.tell()
+            if position < size and position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def _scan_range(scan, args, path, needles, offsets, byte_range, blocks=False):
+    # A byte_range of None is the whole file
+    start, end = (0, None) if byte_range is None else byte_range
+    if blocks:
+        return scan(iter_blocks(path, start, end), *args)
+    return scan(iter_lines(path, start, end, needles, offsets), *args)
+
+
+def _collect_range(scan, args, path, needles, offsets, byte_range):
+    return list(_scan_range(scan, args, path, needles, offsets, byte_range))
+
+
+def scan_file(path, scan, args=(), jobs=DEFAULT_JOBS, needles=None, offsets=False, blocks=False):
+    """
+    Runs scan(lines, *args) over path and returns the list of its results in file order.
+    With needles, scan only gets the lines containing one of those byte strings. With more
+    than one job the file is split into newline-aligned byte ranges that are scanned in a
+    process pool, so scan and its arguments must be picklable. Compressed files are
+    scanned by a single job. With offsets, scan gets
+    (start, end, line) tuples, as iter_lines yields them. With blocks, scan gets the
+    blocks of whole lines of iter_blocks instead of lines.
+    """
+    return scan_files([path], scan, args, jobs=jobs, needles=needles, offsets=offsets, blocks=blocks)
+
+
+def scan_files(paths, scan, args=(), jobs=DEFAULT_JOBS, needles=None, offsets=False, blocks=False):
+    """
+    scan_file over several files: the results of all the files, in the order of paths.
+    The byte ranges of every file, and the compressed files whole, share one process
+    pool, so a small file does not leave workers idle while a large one is scanned.
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs == 1:
+        return [_scan_range(scan, args, path, needles, offsets, None, blocks) for path in paths]
+
+    tasks = []
+    for path in paths:
+        # A compressed stream cannot be split
+        if is_compressed(path):
+            tasks.append((path, None))
+        else:
+            tasks.extend((path, byte_range) for byte_range in split_ranges(path, jobs * RANGES_PER_JOB))
+    if len(tasks) <= 1:
+        return [_scan_range(scan, args, path, needles, offsets, byte_range, blocks) for path, byte_range in tasks]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        futures = [executor.submit(_scan_range, scan, args, path, needles, offsets, byte_range, blocks)
+                   for path, byte_range in tasks]
+        return [future.result() for future in futures]
+
+
+def iter_scan_file(path, scan, args=(), jobs=DEFAULT_JOBS, needles=None, offsets=False):
+    """
+    Yields the items of the iterables returned by scan(lines, *args) over path, in file
+    order. With a single job scan runs lazily in this process. With more, the matches of
+    every byte range are collected by a worker and at most two ranges per job are in
+    flight, so memory stays bounded however many items the scan yields.
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs == 1 or is_compressed(path):
+        yield from scan(iter_lines(path, needles=needles, offsets=offsets), *args)
+        return
+
+    parts = max(jobs * RANGES_PER_JOB, -(-os.path.getsize(path) // STREAM_RANGE_SIZE))
+    ranges = split_ranges(path, parts)
+    if len(ranges) <= 1:
+        for byte_range in ranges:
+            yield from _scan_range(scan, args, path, needles, offsets, byte_range)
+        return
+    executor = ProcessPoolExecutor(max_workers=min(jobs, len(ranges)))
+    try:
+        pending = deque()
+        for byte_range in ranges:
+            pending.append(executor.submit(_collect_range, scan, args, path, needles, offsets, byte_range))
+            if len(pending) > 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # A consumer that stops early cancels the ranges not started yet, and only waits
+        # for the ones being scanned
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,99 @@
+import re
+
+from syslog_manager.keywords import KeywordMatcher, compile_pattern, literal_prefix
+from syslog_manager.timestamps import SECONDS_PER_DAY, epoch_day
+
+
+class QueryFilter:
+    """
+    Conjunction of the predicates of a composite query. Predicates left as None match
+    every record. The time range covers whole days, from the day of start_timestamp to
+    the day of end_timestamp included, the process name matches as a prefix, the hostname
+    exactly and a record matches keywords when its message contains any of them. With
+    regex, the process name and the keywords are regular expressions, matched at the start
+    of the process and anywhere in the message. ignore_case applies to both.
+    """
+    def __init__(self, start_timestamp=None, end_timestamp=None, process=None, hostname=None, keywords=None,
+                 regex=False, ignore_case=False):
+        self.start_timestamp = start_timestamp
+        self.end_timestamp = end_timestamp
+        self.process = process
+        self.hostname = hostname
+        self.keywords = None if keywords is None else list(keywords)
+        self.regex = regex
+        self.ignore_case = ignore_case
+        # Epoch seconds range [start, end), either bound may be open
+        self.start = None if start_timestamp is None else epoch_day(start_timestamp.date())
+        self.end = None if end_timestamp is None else epoch_day(end_timestamp.date()) + SECONDS_PER_DAY
+        flags = re.IGNORECASE if ignore_case else 0
+        self.process_pattern = None if process is None else compile_pattern(process if regex else re.escape(process),
+                                                                            flags)
+
+    def has_time_range(self):
+        return self.start is not None or self.end is not None
+
+    def is_empty(self):
+        """True when no record can match, without reading any."""
+        return (self.start is not None and self.end is not None and self.start >= self.end) or self.keywords == []
+
+    def in_time_range(self, epoch):
+        return (self.start is None or epoch >= self.start) and (self.end is None or epoch < self.end)
+
+    def _literals(self, patterns):
+        # Literals, one of which the text matched by any of patterns contains, or None
+        if self.ignore_case:
+            return None
+        if not self.regex:
+            return patterns
+        prefixes = [literal_prefix(pattern) for pattern in patterns]
+        return prefixes if all(prefixes) else None
+
+    def keyword_literals(self):
+        """Literals one of which the message of every matching record contains, None if unknown."""
+        return None if self.keywords is None else self._literals(self.keywords)
+
+    def keywords_are_literals(self):
+        """True when matching the keywords is finding keyword_literals()."""
+        return not self.regex and not self.ignore_case
+
+    def needle_groups(self):
+        """
+        Lists of literals, each of which a matching syslog line contains at least one of.
+        Reading only the lines containing one literal of a group skips no match.
+        """
+        groups = []
+        if self.hostname is not None:
+            groups.append([self.hostname])
+        if self.process is not None and self._literals([self.process]) is not None:
+            groups.append(self._literals([self.process]))
+        if self.keyword_literals() is not None:
+            groups.append(self.keyword_literals())
+        return groups
+
+    def keyword_matcher(self):
+        return KeywordMatcher(self.keywords, regex=self.regex, ignore_case=self.ignore_case)
+
+    def matcher(self, decode_timestamp):
+        """
+        Returns a function of the timestamp, hostname, process and message of a record,
+        None for missing fields, that is true when the record matches. The predicates are
+        checked from the cheapest to the most expensive one.
+        """
+        hostname_filter = self.hostname
+        process_match = None if self.process_pattern is None else self.process_pattern.match
+        has_time_range = self.has_time_range()
+        in_time_range = self.in_time_range
+        contains_keyword = None if self.keywords is None else self.keyword_matcher()
+
+        def matches(timestamp, hostname, process, message):
+            if hostname_filter is not None and hostname != hostname_filter:
+                return False
+            if process_match is not None and (process is None or not process_match(process)):
+                return False
+            if has_time_range and (not timestamp or not in_time_range(decode_timestamp(timestamp))):
+                return False
+            if contains_keyword is not None:
+                return message is not None and contains_keyword(message)
+            return True
+
+        return matches
@@ -0,0 +1,167 @@
+import re
+
+from jsonschema.validators import validator_for
+from pycsvschema.checker import Validator
+
+
+# JSON schema keywords understood by the specialised record checker. "format" is an
+# annotation only, jsonschema does not enforce it without a format checker either.
+_SUPPORTED_KEYWORDS = {'type', 'properties', 'required', 'pattern', 'format'}
+
+
+def _is_integer(value):
+    return type(value) is int or (type(value) is float and value.is_integer())
+
+
+_TYPE_CHECKS = {
+    'string': lambda value: type(value) is str,
+    'integer': _is_integer,
+    'number': lambda value: type(value) in (int, float),
+    'boolean': lambda value: type(value) is bool,
+    'null': lambda value: value is None,
+    'object': lambda value: isinstance(value, dict),
+    'array': lambda value: isinstance(value, list),
+}
+
+
+def _uses_only_supported_keywords(schema):
+    if set(schema) - _SUPPORTED_KEYWORDS:
+        return False
+    return all(not (set(sub_schema) - _SUPPORTED_KEYWORDS) and 'properties' not in sub_schema
+               for sub_schema in schema.get('properties', {}).values())
+
+
+def _compile_property(name, sub_schema):
+    """Builds a check for a single property, returning an error message or None."""
+    types = sub_schema.get('type')
+    if isinstance(types, str):
+        types = [types]
+    type_checks = [_TYPE_CHECKS[type_name] for type_name in types] if types else []
+    type_names = ", ".join(repr(type_name) for type_name in types) if types else ""
+    pattern = re.compile(sub_schema['pattern']) if 'pattern' in sub_schema else None
+
+    def check(value):
+        if type_checks and not any(type_check(value) for type_check in type_checks):
+            return f"{value!r} is not of type {type_names}"
+        if pattern is not None and type(value) is str and not pattern.search(value):
+            return f"{value!r} does not match {pattern.pattern!r}"
+        return None
+
+    return name, check
+
+
+def compile_json_schema(schema):
+    """
+    Compiles a JSON schema for flat records into a function that returns the first
+    error message for a record, or None if the record is valid. The schema is checked
+    once here. Schemas using only type/properties/required/pattern get a specialised
+    checker, anything else falls back to a jsonschema validator built once.
+    """
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+
+    if not _uses_only_supported_keywords(schema) or schema.get('type', 'object') != 'object':
+        validator = validator_class(schema)
+
+        def check_with_validator(record):
+            error = next(validator.iter_errors(record), None)
+            return error.message if error is not None else None
+
+        return check_with_validator
+
+    required = tuple(schema.get('required', ()))
+    property_checks = tuple(_compile_property(name, sub_schema)
+                            for name, sub_schema in schema.get('properties', {}).items())
+
+    def check_record(record):
+        if not isinstance(record, dict):
+            return f"{record!r} is not of type 'object'"
+        for name in required:
+            if name not in record:
+                return f"{name!r} is a required property"
+        for name, check in property_checks:
+            if name in record:
+                error = check(record[name])
+                if error is not None:
+                    return error
+        return None
+
+    return check_record
+
+
+# CSV schema options (pycsvschema format) understood by the specialised row checker
+_SUPPORTED_CSV_OPTIONS = {'fields', 'missingValues'}
+_SUPPORTED_CSV_FIELD_OPTIONS = {'name', 'type', 'required', 'nullable', 'pattern'}
+
+_CSV_TYPE_CONVERTERS = {
+    'number': float,
+    'integer': int,
+}
+
+
+def _csv_cell(value):
+    # Same conversion csv.writer applies when writing the value
+    return '' if value is None else str(value)
+
+
+def _compile_csv_field(field_schema):
+    """Builds a check for a single CSV cell, returning an error message or None."""
+    type_name = field_schema.get('type', 'string')
+    converter = _CSV_TYPE_CONVERTERS.get(type_name)
+    pattern = re.compile(field_schema['pattern']) if type_name == 'string' and field_schema.get('pattern') else None
+    check_nullable = 'nullable' in field_schema and field_schema['nullable'] is not True
+
+    def check(cell):
+        if cell is None:
+            return "Illegal null value" if check_nullable else None
+        if pattern is not None and not pattern.match(cell):
+            return f"Value {cell} does not satisfy the type or format"
+        if converter is not None:
+            try:
+                converter(cell)
+            except ValueError:
+                return f"Value {cell} does not satisfy the type or format"
+        return None
+
+    return field_schema['name'], check
+
+
+def compile_csv_schema(schema, header):
+    """
+    Compiles a pycsvschema schema for the given CSV header into a function that takes
+    a row dict, as passed to csv.DictWriter, and returns the first error message or None.
+    Rows are checked in memory before they are written, so the output is never re-read.
+    """
+    # Checks the schema against the pycsvschema meta schema once
+    validator = Validator(csvfile=None, schema=schema)
+    validator.header = list(header)
+    validator.prepare_field_schema()
+    header_error = next(validator.check_header(), None)
+    if header_error is not None:
+        raise ValueError(f"Invalid CSV data: {header_error.message}")
+
+    supported = (not set(schema) - _SUPPORTED_CSV_OPTIONS and
+                 all(not set(field) - _SUPPORTED_CSV_FIELD_OPTIONS and
+                     field.get('type', 'string') in ('string', 'number', 'integer')
+                     for field in schema.get('fields', [])))
+
+    if not supported:
+        def check_with_validator(row):
+            cells = [_csv_cell(row.get(name)) for name in header]
+            error = next(validator.check_rows([cells]), None)
+            return error.message if error is not None else None
+
+        return check_with_validator
+
+    missing_values = frozenset(schema.get('missingValues', ['']))
+    field_checks = tuple(_compile_csv_field(field) for field in schema.get('fields', []) if field['name'] in header)
+
+    def check_row(row):
+        for name, check in field_checks:
+            cell = _csv_cell(row.get(name))
+            error = check(None if cell in missing_values else cell)
+            if error is not None:
+                return error
+        return None
+
+    return check_row
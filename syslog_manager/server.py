@@ -0,0 +1,112 @@
+import json
+import os
+import re
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from syslog_manager.client import DEFAULT_HOST, DEFAULT_PORT
+from syslog_manager.loaded_log import LoadedLogQuery
+from syslog_manager.query_filter import QueryFilter
+
+# Logs written to the socket at once while a query streams its results
+WRITE_BATCH_SIZE = 1 << 16
+
+
+def query_filter_from_fields(fields):
+    """QueryFilter of the JSON object of a query request, dates in ISO format."""
+    start, end = fields.get('start'), fields.get('end')
+    keywords = fields.get('keywords')
+    # A string would be taken as the list of its characters
+    if keywords is not None and (not isinstance(keywords, list)
+                                 or not all(isinstance(keyword, str) for keyword in keywords)):
+        raise TypeError("keywords must be a list of strings")
+    return QueryFilter(start_timestamp=None if start is None else datetime.fromisoformat(start),
+                       end_timestamp=None if end is None else datetime.fromisoformat(end),
+                       process=fields.get('process'), hostname=fields.get('hostname'),
+                       keywords=keywords, regex=bool(fields.get('regex')),
+                       ignore_case=bool(fields.get('ignore_case')))
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /query answers a JSON query on one of the served files with its logs, one per
+    line, written as they are found. GET /files lists the served files.
+    """
+    def _send_text(self, status, text, content_type='text/plain; charset=utf-8'):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != '/files':
+            self._send_text(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}\n")
+            return
+        self._send_text(HTTPStatus.OK, json.dumps(sorted(self.server.log_queries)), 'application/json')
+
+    def do_POST(self):
+        if self.path != '/query':
+            self._send_text(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}\n")
+            return
+        try:
+            fields = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            log_query = self.server.log_queries.get(os.path.abspath(fields['file']))
+            if log_query is None:
+                self._send_text(HTTPStatus.NOT_FOUND, f"The file {fields['file']} is not served.\n")
+                return
+            logs = log_query.query(query_filter_from_fields(fields))
+            # Errors in the query surface on the first log, before the status is sent
+            first_log = next(logs, None)
+        except (ValueError, TypeError, KeyError, re.error) as e:
+            self._send_text(HTTPStatus.BAD_REQUEST, f"Invalid query: {e}\n")
+            return
+        except OSError as e:
+            self._send_text(HTTPStatus.INTERNAL_SERVER_ERROR, f"{e}\n")
+            return
+
+        # The response ends when the connection closes, its length is not known in advance
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.end_headers()
+        if first_log is None:
+            return
+        batch = [first_log]
+        size = len(first_log)
+        try:
+            for log in logs:
+                batch.append(log)
+                size += len(log) + 1
+                if size >= WRITE_BATCH_SIZE:
+                    self.wfile.write(('\n'.join(batch) + '\n').encode('utf-8'))
+                    batch, size = [], 0
+            if batch:
+                self.wfile.write(('\n'.join(batch) + '\n').encode('utf-8'))
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading
+            logs.close()
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    HTTP server answering queries on .log files loaded in memory once, when it starts.
+    Each request runs in its own thread.
+    """
+    daemon_threads = True
+
+    def __init__(self, log_files, server_address=(DEFAULT_HOST, DEFAULT_PORT)):
+        self.log_queries = {os.path.abspath(log_file): LoadedLogQuery(log_file) for log_file in log_files}
+        super().__init__(server_address, QueryRequestHandler)
+
+
+def serve(log_files, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Loads log_files and answers queries on them until interrupted."""
+    with QueryServer(log_files, (host, port)) as server:
+        host, port = server.server_address[:2]
+        print(f"Serving {len(server.log_queries)} file(s) on http://{host}:{port}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -1,31 +1,237 @@
+import gzip
+import json
 import os
-from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
-from syslog_manager.utility import parse_syslog_line
+from syslog_manager.mapped_lines import iter_lines
+from syslog_manager.multi_file import as_paths, iter_merged
+from syslog_manager.parallel import DEFAULT_JOBS, iter_scan_file
+from syslog_manager.timestamps import SECONDS_PER_DAY, TimestampDecoder, epoch_to_date
+from syslog_manager.utility import SYSLOG_PATTERN
 
+# Day files kept open at once, the least recently written one is closed first
+MAX_OPEN_FILES = 64
 
-def split_syslog_by_day(file_path):
-    """Splits the syslog file by day into separate files."""
-    logs_by_day = {}
+# Buffer of every open day file, and size of the chunks compressed at once
+WRITE_BUFFER_SIZE = 1 << 20
 
-    with open(file_path, 'r') as file:
-        for line in file:
-            entry = parse_syslog_line(line)
-            if entry:
-                # Construct the full timestamp string with the current year
-                full_timestamp_str = f"{entry['timestamp']} {datetime.now().year}"
-                log_date = datetime.strptime(full_timestamp_str, "%b %d %H:%M:%S %Y").date()
-                log_date_str = log_date.strftime('%Y-%m-%d')
+COMPRESSIONS = ('gzip',)
 
-                # Store the log line under the correct date
-                if log_date_str not in logs_by_day:
-                    logs_by_day[log_date_str] = []
-                logs_by_day[log_date_str].append(line)
+# Favours speed, the higher levels save little on syslog text
+COMPRESS_LEVEL = 6
 
-    # Write logs to separate files by day
-    output_dir = os.path.dirname(file_path)
+MANIFEST_NAME = 'syslog-manifest.json'
 
-    for log_date_str, logs in logs_by_day.items():
-        output_file = os.path.join(output_dir, f'syslog-{log_date_str}.log')
-        with open(output_file, 'w', encoding='utf-8') as out_file:
-            out_file.writelines(logs)
+
+def day_file_name(day, compression=None):
+    suffix = '.log.gz' if compression == 'gzip' else '.log'
+    return f"syslog-{epoch_to_date(day).strftime('%Y-%m-%d')}{suffix}"
+
+
+class DayFilePool:
+    """
+    Writes lines to one syslog-YYYY-MM-DD.log file per day in output_dir, keeping at most
+    max_open_files of them open. A file closed to make room is reopened in append mode,
+    so lines of a day reach its file in the order they are written. With a compression,
+    the files take the compressed bytes and are named after it.
+    """
+    def __init__(self, output_dir, max_open_files=MAX_OPEN_FILES, buffer_size=WRITE_BUFFER_SIZE, compression=None):
+        if max_open_files < 1:
+            raise ValueError("max_open_files must be at least 1")
+        self.output_dir = output_dir
+        self.max_open_files = max_open_files
+        self.buffer_size = buffer_size
+        self.compression = compression
+        self._open_files = OrderedDict()
+        # Days whose file was created by this pool, any older file is overwritten
+        self._started_days = set()
+
+    def path(self, day):
+        return os.path.join(self.output_dir, day_file_name(day, self.compression))
+
+    def file(self, day):
+        """Open file of day, the most recently used one from now on."""
+        out_file = self._open_files.get(day)
+        if out_file is not None:
+            self._open_files.move_to_end(day)
+            return out_file
+        if len(self._open_files) >= self.max_open_files:
+            _, oldest = self._open_files.popitem(last=False)
+            oldest.close()
+        mode = 'a' if day in self._started_days else 'w'
+        if self.compression is not None:
+            out_file = open(self.path(day), mode + 'b', buffering=self.buffer_size)
+        else:
+            out_file = open(self.path(day), mode, encoding='utf-8', buffering=self.buffer_size)
+        self._started_days.add(day)
+        self._open_files[day] = out_file
+        return out_file
+
+    def close(self):
+        while self._open_files:
+            _, out_file = self._open_files.popitem(last=False)
+            out_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CompressedDayWriter:
+    """
+    Writes lines to gzip day files through a DayFilePool. Lines are buffered per
+    day, and every full buffer is compressed into a gzip member by a thread pool while
+    the input is parsed: zlib releases the GIL. A day file is a sequence of members,
+    which gzip readers decompress as one stream. Buffers of the days not written lately
+    are compressed early, so at most max_open_files of them are held.
+    """
+    def __init__(self, pool, threads=None, level=COMPRESS_LEVEL, chunk_size=WRITE_BUFFER_SIZE):
+        self.pool = pool
+        self.level = level
+        self.chunk_size = chunk_size
+        self.threads = threads or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self.threads)
+        self._buffers = OrderedDict()
+        # Compressed chunks in submission order, which keeps the order of the chunks of a day
+        self._pending = deque()
+
+    def write(self, day, line):
+        buffer = self._buffers.get(day)
+        if buffer is None:
+            if len(self._buffers) >= self.pool.max_open_files:
+                self._submit(*self._buffers.popitem(last=False))
+            buffer = self._buffers[day] = [[], 0]
+        else:
+            self._buffers.move_to_end(day)
+        buffer[0].append(line)
+        buffer[1] += len(line)
+        if buffer[1] >= self.chunk_size:
+            self._submit(day, self._buffers.pop(day))
+
+    def _submit(self, day, buffer):
+        data = ''.join(buffer[0]).encode('utf-8')
+        self._pending.append((day, self._executor.submit(gzip.compress, data, self.level, mtime=0)))
+        # Bounds the memory of the chunks waiting to be written
+        while len(self._pending) > 2 * self.threads:
+            self._write_oldest()
+
+    def _write_oldest(self):
+        day, future = self._pending.popleft()
+        self.pool.file(day).write(future.result())
+
+    def close(self):
+        try:
+            while self._buffers:
+                self._submit(*self._buffers.popitem(last=False))
+            while self._pending:
+                self._write_oldest()
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _PlainDayWriter:
+    def __init__(self, pool):
+        self.pool = pool
+        self._current_day, self._current_file = None, None
+
+    def write(self, day, line):
+        # Logs are mostly in time order, consecutive lines share their file
+        if day != self._current_day:
+            self._current_day, self._current_file = day, self.pool.file(day)
+        self._current_file.write(line)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+def _lines_by_day(lines, year):
+    decode_timestamp = TimestampDecoder(year)
+    match = SYSLOG_PATTERN.match
+    for start, end, line in lines:
+        m = match(line)
+        if m:
+            yield decode_timestamp.day_start(m.group('timestamp')), start, end, line
+
+
+def _timed_day_lines(path, year):
+    decode_timestamp = TimestampDecoder(year)
+    match = SYSLOG_PATTERN.match
+    for start, end, line in iter_lines(path, offsets=True):
+        m = match(line)
+        if m:
+            epoch = decode_timestamp(m.group('timestamp'))
+            yield epoch, (epoch - epoch % SECONDS_PER_DAY, path, start, end, line)
+
+
+def split_syslog_by_day(file_path, jobs=DEFAULT_JOBS, output_dir=None, max_open_files=MAX_OPEN_FILES,
+                        compression=None, manifest=False):
+    """
+    Splits the syslog file by day into separate files, in output_dir or next to the file.
+    Every line is written to its day file as soon as it is parsed, compressed when
+    compression is 'gzip'. file_path may be a list of syslog files, whose lines are merged
+    in time order. Returns, sorted by date, the file, number of lines, input and file
+    bytes and range of input byte offsets in every source file of every day, also written
+    to syslog-manifest.json with manifest.
+    """
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression {compression}, supported: {', '.join(COMPRESSIONS)}")
+    paths = as_paths(file_path)
+    # Timestamps are resolved in the current year, once for all the workers
+    year = TimestampDecoder().year
+    if output_dir is None:
+        output_dir = os.path.dirname(paths[0])
+    else:
+        os.makedirs(output_dir, exist_ok=True)
+
+    # (day, source, start, end, line) of every line, in file order or merged in time order
+    if len(paths) == 1:
+        source = paths[0]
+        day_lines = ((day, source, start, end, text) for day, start, end, text
+                     in iter_scan_file(source, _lines_by_day, args=(year,), jobs=jobs, offsets=True))
+    else:
+        day_lines = iter_merged(paths, _timed_day_lines, (year,), jobs=jobs)
+
+    # Lines, bytes, and first and end offset in every source of every day
+    days = {}
+    with DayFilePool(output_dir, max_open_files, compression=compression) as pool:
+        writer = _PlainDayWriter(pool) if compression is None else CompressedDayWriter(pool)
+        with writer:
+            for day, source, start, end, line in day_lines:
+                writer.write(day, line if line.endswith('\n') else line + '\n')
+                entry = days.get(day)
+                if entry is None:
+                    entry = days[day] = [0, 0, {}]
+                entry[0] += 1
+                entry[1] += end - start
+                source_range = entry[2].get(source)
+                if source_range is None:
+                    entry[2][source] = [start, end]
+                else:
+                    source_range[1] = end
+
+    entries = [{
+        'date': epoch_to_date(day).strftime('%Y-%m-%d'),
+        'file': day_file_name(day, compression),
+        'lines': lines,
+        'bytes': size,
+        'file_bytes': os.path.getsize(os.path.join(output_dir, day_file_name(day, compression))),
+        'ranges': [{'source': os.path.abspath(source), 'first_offset': first_offset, 'end_offset': end_offset}
+                   for source, (first_offset, end_offset) in ranges.items()],
+    } for day, (lines, size, ranges) in sorted(days.items())]
+    if manifest:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump({'sources': [os.path.abspath(path) for path in paths], 'compression': compression,
+                       'days': entries}, f, indent=2)
+    return entries
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+from bisect import bisect_left
+
+from syslog_manager.timestamps import TimestampDecoder
+from syslog_manager.utility import SYSLOG_PATTERN, file_signature
+
+# Number of syslog records between two entries of the time index
+TIME_INDEX_INTERVAL = 1000
+
+# Bumped whenever the meaning of the stored values changes, older indexes are then stale
+TIME_INDEX_VERSION = 2
+
+
+def time_index_path(log_file):
+    return f"{log_file}.time.idx"
+
+
+class TimeIndex:
+    """
+    Sparse index of a syslog file: the start of the day, in epoch seconds, and the byte
+    offset of every TIME_INDEX_INTERVAL-th record. It can only be used to seek when the
+    records are in time order.
+    """
+    def __init__(self, source, year, ordered, days, offsets):
+        self.source = source
+        self.year = year
+        self.ordered = ordered
+        self.days = days
+        self.offsets = offsets
+
+    def start_offset(self, start_day):
+        """Offset from which reading finds every record of the day starting at start_day or later."""
+        # Records before the entry found here are all earlier than start_day
+        position = max(bisect_left(self.days, start_day) - 1, 0)
+        return self.offsets[position] if self.offsets else 0
+
+    def end_offset(self, end):
+        """Offset from which every record is at end or later, None if there is no such entry."""
+        # The days of the entries are not earlier than the records before them
+        position = bisect_left(self.days, end)
+        return self.offsets[position] if position < len(self.offsets) else None
+
+    def save(self, path):
+        # A temporary file of its own, so that queries saving the same index at once do
+        # not write into each other's file
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(path)),
+                                         prefix=f"{os.path.basename(path)}.", suffix='.tmp', delete=False) as f:
+            try:
+                json.dump({'version': TIME_INDEX_VERSION, 'source': self.source, 'year': self.year,
+                           'ordered': self.ordered, 'days': self.days, 'offsets': self.offsets}, f)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+    @classmethod
+    def load(cls, path):
+        """Returns the saved TimeIndex, or None if it was written by an older version."""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get('version') != TIME_INDEX_VERSION:
+            return None
+        return cls(data['source'], data['year'], data['ordered'], data['days'], data['offsets'])
+
+
+def build_time_index(log_file, decode_timestamp=None, interval=TIME_INDEX_INTERVAL):
+    """Reads log_file once and returns its TimeIndex, with dates resolved in the year of the decoder."""
+    if decode_timestamp is None:
+        decode_timestamp = TimestampDecoder()
+    source = file_signature(log_file)
+    ordered = True
+    days = []
+    offsets = []
+    previous_day = None
+    records = 0
+    offset = 0
+    with open(log_file, 'rb') as f:
+        for raw_line in f:
+            match = SYSLOG_PATTERN.match(raw_line.decode('utf-8').rstrip('\r\n'))
+            if match:
+                try:
+                    day = decode_timestamp.day_start(match.group('timestamp'))
+                except ValueError:
+                    # The query falls back to a full scan, which reports the invalid timestamp
+                    ordered = False
+                    break
+                if previous_day is not None and day < previous_day:
+                    ordered = False
+                    break
+                if records % interval == 0:
+                    days.append(day)
+                    offsets.append(offset)
+                previous_day = day
+                records += 1
+            offset += len(raw_line)
+
+    if not ordered:
+        days, offsets = [], []
+    return TimeIndex(source, decode_timestamp.year, ordered, days, offsets)
+
+
+def open_time_index(log_file, year):
+    """Returns the saved TimeIndex of log_file, or None if there is none or it is stale or unreadable."""
+    path = time_index_path(log_file)
+    if not os.path.exists(path):
+        return None
+    try:
+        time_index = TimeIndex.load(path)
+    except (ValueError, KeyError, OSError):
+        # An empty, truncated or corrupt index is rebuilt by the query
+        return None
+    if time_index is None or time_index.year != year or time_index.source != file_signature(log_file):
+        return None
+    return time_index
@@ -0,0 +1,60 @@
+from datetime import date, datetime
+from functools import lru_cache
+
+SECONDS_PER_DAY = 86400
+
+# Syslog timestamps carry no time zone, epoch values are computed as if they were UTC
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_MONTHS = {name: number for number, name in
+           enumerate(('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+
+# Distinct seconds and days kept by every decoder
+SECOND_CACHE_SIZE = 4096
+DAY_CACHE_SIZE = 1024
+
+
+def epoch_day(day):
+    """Epoch seconds of the start of a date."""
+    return (day.toordinal() - _EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+
+def epoch_to_date(epoch):
+    return date.fromordinal(_EPOCH_ORDINAL + epoch // SECONDS_PER_DAY)
+
+
+class TimestampDecoder:
+    """
+    Decodes 'Jun 14 15:16:01' syslog timestamps into epoch seconds. The fixed layout is
+    parsed directly instead of with datetime.strptime, the year is resolved once when the
+    decoder is created and results are memoized per second and per day. Raises ValueError
+    for the same timestamps datetime.strptime would reject.
+    """
+    def __init__(self, year=None):
+        self.year = datetime.now().year if year is None else year
+        self.decode = lru_cache(maxsize=SECOND_CACHE_SIZE)(self._decode)
+        self.decode_date = lru_cache(maxsize=DAY_CACHE_SIZE)(self._decode_date)
+
+    def __call__(self, timestamp):
+        return self.decode(timestamp)
+
+    def _decode(self, timestamp):
+        date_text, time_text = timestamp.rsplit(None, 1)
+        hours, minutes, seconds = time_text.split(':')
+        hours, minutes, seconds = int(hours), int(minutes), int(seconds)
+        if hours > 23 or minutes > 59 or seconds > 59:
+            raise ValueError(f"time data {timestamp!r} is out of range")
+        return self.decode_date(date_text) + hours * 3600 + minutes * 60 + seconds
+
+    def _decode_date(self, date_text):
+        """Epoch seconds of the start of the day of a 'Jun 14' date."""
+        try:
+            month, day = date_text.split()
+            return epoch_day(date(self.year, _MONTHS[month.lower()], int(day)))
+        except (KeyError, ValueError):
+            raise ValueError(f"time data {date_text!r} does not match format '%b %d'")
+
+    def day_start(self, timestamp):
+        """Epoch seconds of the start of the day of a full timestamp."""
+        epoch = self.decode(timestamp)
+        return epoch - epoch % SECONDS_PER_DAY
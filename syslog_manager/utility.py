@@ -1,16 +1,87 @@
+import os
 import re
+import sys
+
+
+# Compiled once at import time and shared by every parser call
+SYSLOG_PATTERN = re.compile(
+    r'^(?P<timestamp>[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}) '
+    r'(?P<hostname>\S+) '
+    r'(?P<process>\S+?)'
+    r'(?:\[(?P<pid>\d+)\])?: '
+    r'(?P<message>.*)$'
+)
+
+SYSLOG_FIELDS = ('timestamp', 'hostname', 'process', 'pid', 'message')
+
+
+class SyslogRecord:
+    """
+    Compact parsed syslog entry. Keeps a reference to the original line so callers
+    that output raw lines do not need to rebuild them.
+    """
+    __slots__ = ('timestamp', 'hostname', 'process', 'pid', 'message', 'line')
+
+    def __init__(self, timestamp, hostname, process, pid, message, line=None):
+        self.timestamp = timestamp
+        self.hostname = hostname
+        self.process = process
+        self.pid = pid
+        self.message = message
+        self.line = line
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'hostname': self.hostname,
+            'process': self.process,
+            'pid': self.pid,
+            'message': self.message
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, SyslogRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"SyslogRecord({self.to_dict()!r})"
 
 
 def parse_syslog_line(line):
-    syslog_pattern = re.compile(
-        r'^(?P<timestamp>[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}) '
-        r'(?P<hostname>\S+) '
-        r'(?P<process>\S+?)'
-        r'(?:\[(?P<pid>\d+)\])?: '
-        r'(?P<message>.*)$'
-    )
-
-    match = syslog_pattern.match(line)
+    match = SYSLOG_PATTERN.match(line)
     if match:
         return match.groupdict()
     return None
+
+
+def parse_lines(lines):
+    """
+    Parses an iterable of syslog lines, yielding a SyslogRecord for every valid line.
+    Invalid lines are skipped. Trailing newlines are ignored by the pattern.
+    """
+    match = SYSLOG_PATTERN.match
+    for line in lines:
+        m = match(line)
+        if m:
+            timestamp, hostname, process, pid, message = m.groups()
+            yield SyslogRecord(timestamp, hostname, process, pid, message, line)
+
+
+def file_signature(path):
+    """Size and modification time of a file, used to tell whether an index of it is stale."""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def print_logs(logs):
+    """Writes every log to stdout as soon as the query yields it."""
+    try:
+        for log in logs:
+            sys.stdout.write(log)
+            sys.stdout.write('\n')
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader stopped early, e.g. piped into head: silence the final flush
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
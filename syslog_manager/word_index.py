@@ -0,0 +1,160 @@
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+
+from syslog_manager.utility import SYSLOG_PATTERN, file_signature
+
+# Word index file layout:
+#   MAGIC | posting lists (uint64 line offsets) | footer JSON | footer length (uint64) | MAGIC
+# The footer stores the size and modification time of the indexed log, so a stale index
+# is detected, and maps every token to the position and length of its posting list.
+MAGIC = b'SLWIX01\n'
+_FOOTER_LENGTH = struct.Struct('<Q')
+
+# Messages are split into runs of word characters. A keyword is found by looking up the
+# tokens containing its word runs, the candidate lines are then checked with the keyword.
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def word_index_path(log_file):
+    return f"{log_file}.words.idx"
+
+
+def build_word_index(log_file):
+    """
+    Builds the word index of log_file next to it and returns its path. Every token of a
+    message maps to the byte offsets of the lines containing it, in file order.
+    """
+    # Taken before reading, so lines appended while building make the index stale
+    source = file_signature(log_file)
+    find_tokens = TOKEN_PATTERN.findall
+    postings = {}
+    offset = 0
+    with open(log_file, 'rb') as f:
+        for raw_line in f:
+            match = SYSLOG_PATTERN.match(raw_line.decode('utf-8').rstrip('\r\n'))
+            if match:
+                for token in set(find_tokens(match.group('message'))):
+                    posting = postings.get(token)
+                    if posting is None:
+                        posting = postings[token] = array('Q')
+                    posting.append(offset)
+            offset += len(raw_line)
+
+    path = word_index_path(log_file)
+    # A temporary file of its own, so that builds of the same index at once do not write
+    # into each other's file
+    with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(os.path.abspath(path)),
+                                     prefix=f"{os.path.basename(path)}.", suffix='.tmp', delete=False) as f:
+        try:
+            f.write(MAGIC)
+            tokens = {}
+            position = 0
+            for token, posting in postings.items():
+                f.write(posting.tobytes())
+                tokens[token] = [position, len(posting)]
+                position += len(posting)
+            footer = json.dumps({'source': source, 'byteorder': sys.byteorder, 'tokens': tokens}).encode('utf-8')
+            f.write(footer)
+            f.write(_FOOTER_LENGTH.pack(len(footer)))
+            f.write(MAGIC)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    # Readers never see a partially written index
+    os.replace(f.name, path)
+    return path
+
+
+def open_word_index(log_file):
+    """Returns the WordIndex of log_file, or None if there is no index or it is stale or unreadable."""
+    path = word_index_path(log_file)
+    if not os.path.exists(path):
+        return None
+    try:
+        word_index = WordIndex(path)
+    except (ValueError, OSError):
+        # A truncated or corrupt index, or one of another byte order: the file is scanned
+        return None
+    try:
+        fresh = word_index.source == file_signature(log_file)
+    except OSError:
+        fresh = False
+    if not fresh:
+        word_index.close()
+        return None
+    return word_index
+
+
+class WordIndex:
+    """Memory-mapped reader for a word index built by build_word_index."""
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        trailer_size = _FOOTER_LENGTH.size + len(MAGIC)
+        if (len(self._mmap) < len(MAGIC) + trailer_size or self._mmap[:len(MAGIC)] != MAGIC
+                or self._mmap[-len(MAGIC):] != MAGIC):
+            self._mmap.close()
+            raise ValueError(f"The file {path} is not a word index.")
+
+        footer_length, = _FOOTER_LENGTH.unpack_from(self._mmap, len(self._mmap) - trailer_size)
+        footer_start = len(self._mmap) - trailer_size - footer_length
+        footer = json.loads(self._mmap[footer_start:footer_start + footer_length])
+        if footer['byteorder'] != sys.byteorder:
+            self._mmap.close()
+            raise ValueError(f"The file {path} was written on a machine with a different byte order.")
+
+        self.source = footer['source']
+        self.tokens = footer['tokens']
+        self._postings = memoryview(self._mmap)[len(MAGIC):footer_start].cast('Q')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _lines_with_token_containing(self, word):
+        offsets = set()
+        for token, (position, length) in self.tokens.items():
+            if word in token:
+                offsets.update(self._postings[position:position + length])
+        return offsets
+
+    def _keyword_candidates(self, keyword):
+        words = TOKEN_PATTERN.findall(keyword)
+        if not words:
+            return None
+        # Every word run of the keyword lies inside a single token of a matching message
+        candidates = None
+        for word in sorted(words, key=len, reverse=True):
+            lines = self._lines_with_token_containing(word)
+            candidates = lines if candidates is None else candidates & lines
+            if not candidates:
+                break
+        return candidates
+
+    def candidate_offsets(self, keywords):
+        """
+        Returns the sorted offsets of the lines that may contain any of the keywords, or
+        None when a keyword has no word characters and cannot be looked up.
+        """
+        offsets = set()
+        for keyword in keywords:
+            candidates = self._keyword_candidates(keyword)
+            if candidates is None:
+                return None
+            offsets |= candidates
+        return sorted(offsets)
+
+    def close(self):
+        self._postings.release()
+        self._mmap.close()
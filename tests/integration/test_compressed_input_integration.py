@@ -0,0 +1,36 @@
+import gzip
+import subprocess
+import sys
+from pathlib import Path
+
+SYSLOG_DATA = """\
+Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+"""
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+
+def run(*arguments):
+    return subprocess.run([sys.executable, str(SCRIPT_PATH)] + [str(argument) for argument in arguments],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def test_cli_commands_read_rotated_gzip_log(tmp_path):
+    temp_file = tmp_path / "syslog.1.gz"
+    temp_file.write_bytes(gzip.compress(SYSLOG_DATA.encode('utf-8')))
+
+    query = run("query", "log", temp_file, "from_process", "systemd")
+    count = run("count_event_per_process", temp_file)
+    export = run("export", "csv", temp_file, tmp_path / "output.csv")
+    split = run("split", temp_file, "--output-dir", tmp_path / "days")
+
+    assert query.stdout == "Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.\n"
+    assert count.stdout == "Events for process sshd(pam_unix): 3\nEvents for process systemd: 1\n"
+    assert (tmp_path / "output.csv").read_text(encoding='utf-8').count("\n") == 5
+    assert sorted(path.name for path in (tmp_path / "days").iterdir()) == [
+        "syslog-2024-06-13.log", "syslog-2024-06-14.log", "syslog-2024-06-15.log"]
+    for result in (query, count, export, split):
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,42 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_cli_export_and_query_columnar(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2"""
+    syslog_file = tmp_path / "syslog.log"
+    columnar_file = tmp_path / "syslog.slc"
+
+    syslog_file.write_text(syslog_content)
+
+    # Construct the path to the main.py file, going two directories up
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), 'export', 'slc', str(syslog_file), str(columnar_file)],
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+    assert columnar_file.exists()
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), 'query', 'slc', str(columnar_file), 'from_process', 'sshd'],
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+    assert [json.loads(line) for line in result.stdout.strip().splitlines()] == [
+        {"timestamp": "Jun 14 15:16:01", "hostname": "combo", "process": "sshd(pam_unix)", "pid": 19939,
+         "message": "authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4"},
+        {"timestamp": "Jun 15 15:19:04", "hostname": "combo", "process": "sshd(pam_unix)", "pid": 19941,
+         "message": "Failed password for user1 from 192.168.0.2 port 22 ssh2"}
+    ]
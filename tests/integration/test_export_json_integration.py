@@ -36,4 +36,75 @@ def test_cli_export_syslog_to_json(tmp_path):
         }
     ]
 
-    assert data == expected_data
\ No newline at end of file
+    assert data == expected_data
+
+def test_cli_export_syslog_to_json_streaming(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root."""
+    syslog_file = tmp_path / "syslog.log"
+    output_json_file = tmp_path / "syslog.json"
+
+    syslog_file.write_text(syslog_content)
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), 'export', 'json', str(syslog_file), str(output_json_file),
+         '--stream', '--chunk-size', '1'],
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+
+    with open(output_json_file, 'r') as f:
+        data = json.load(f)
+
+    assert [entry['pid'] for entry in data] == [19939, 1]
+
+
+def test_cli_export_syslog_to_json_rejects_empty_chunks(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_json_file = tmp_path / "syslog.json"
+
+    syslog_file.write_text("Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root.")
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    for chunk_size in ('0', '-5'):
+        result = subprocess.run(
+            [sys.executable, str(script_path), 'export', 'json', str(syslog_file), str(output_json_file),
+             '--stream', '--chunk-size', chunk_size],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 2
+        assert "--chunk-size" in result.stderr
+        assert not output_json_file.exists()
+
+
+def test_cli_export_syslog_to_json_lines(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root."""
+    syslog_file = tmp_path / "syslog.log"
+    output_jsonl_file = tmp_path / "syslog.jsonl"
+
+    syslog_file.write_text(syslog_content)
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), 'export', 'jsonl', str(syslog_file), str(output_jsonl_file)],
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+
+    with open(output_jsonl_file, 'r') as f:
+        data = [json.loads(line) for line in f]
+
+    assert [entry['pid'] for entry in data] == [19939, 1]
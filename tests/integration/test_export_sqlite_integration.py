@@ -0,0 +1,50 @@
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_cli_export_syslog_to_sqlite(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root."""
+    syslog_file = tmp_path / "syslog.log"
+    output_db_file = tmp_path / "syslog.db"
+
+    syslog_file.write_text(syslog_content)
+
+    # Construct the path to the main.py file, going two directories up
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), 'export', 'sqlite', str(syslog_file), str(output_db_file)],
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+    assert output_db_file.exists()
+
+    connection = sqlite3.connect(output_db_file)
+    try:
+        rows = connection.execute("SELECT hostname, process, pid FROM syslog ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+    assert rows == [('combo', 'sshd(pam_unix)', 19939), ('combo', 'systemd', 1)]
+
+
+def test_cli_export_sqlite_rejects_wrong_extension(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text("Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure")
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), 'export', 'sqlite', str(syslog_file), str(tmp_path / "syslog.sql")],
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode != 0
+    assert "File format mismatch" in result.stderr
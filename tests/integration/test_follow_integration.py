@@ -0,0 +1,48 @@
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+SSHD_LINE = "Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; rhost=218.188.2.4\n"
+FTPD_LINE = "Jun 14 15:17:02 combo ftpd[24487]: connection from 24.54.76.216\n"
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+
+def run_following(command, path):
+    process = subprocess.Popen([sys.executable, str(SCRIPT_PATH)] + command, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True)
+    try:
+        first_line = process.stdout.readline()
+        with open(path, 'a') as f:
+            f.write(FTPD_LINE + SSHD_LINE)
+        second_line = process.stdout.readline()
+    finally:
+        process.send_signal(signal.SIGINT)
+        process.wait(timeout=10)
+    return first_line, second_line, process
+
+
+def test_cli_query_follow(tmp_path):
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_text(SSHD_LINE + FTPD_LINE, encoding='utf-8')
+
+    first_line, second_line, process = run_following(
+        ["query", "log", str(temp_file), "--follow", "from_process", "sshd"], temp_file)
+
+    assert first_line == SSHD_LINE
+    assert second_line == SSHD_LINE
+    assert process.returncode == 0
+    assert process.stderr.read() == ""
+
+
+def test_cli_count_event_per_process_follow(tmp_path):
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_text(SSHD_LINE, encoding='utf-8')
+
+    first_line, second_line, process = run_following(
+        ["count_event_per_process", str(temp_file), "--follow"], temp_file)
+
+    assert first_line == "Events for process sshd(pam_unix): 1\n"
+    assert second_line == "Events for process ftpd: 1\n"
+    assert process.returncode == 0
@@ -0,0 +1,70 @@
+import gzip
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+OLDER_SYSLOG_DATA = """\
+Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+"""
+
+NEWER_SYSLOG_DATA = """\
+Jun 14 09:00:00 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+"""
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+
+def run(*arguments):
+    return subprocess.run([sys.executable, str(SCRIPT_PATH)] + [str(argument) for argument in arguments],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def test_cli_commands_read_several_files(tmp_path):
+    (tmp_path / "syslog.2.log").write_text(OLDER_SYSLOG_DATA)
+    (tmp_path / "syslog.1.log.gz").write_bytes(gzip.compress(NEWER_SYSLOG_DATA.encode('utf-8')))
+    pattern = tmp_path / "syslog.*"
+
+    query = run("query", "log", pattern, "contains_words", "user1", "--jobs", "2")
+    count = run("count_event_per_process", tmp_path / "syslog.2.log", tmp_path / "syslog.1.log.gz")
+    export = run("export", "jsonl", pattern, tmp_path / "output.jsonl", "--jobs", "2")
+    split = run("split", pattern, "--output-dir", tmp_path / "days")
+
+    assert query.stdout == (
+        "Jun 14 09:00:00 combo systemd[1]: Started Session 1 of user user1.\n"
+        "Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2\n"
+        "Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2\n")
+    assert count.stdout == "Events for process sshd(pam_unix): 3\nEvents for process systemd: 1\n"
+    with open(tmp_path / "output.jsonl", encoding='utf-8') as f:
+        assert [json.loads(line)['pid'] for line in f] == [19939, 1, 19940, 19941]
+    assert (tmp_path / "days" / "syslog-2024-06-14.log").read_text(encoding='utf-8') == (
+        NEWER_SYSLOG_DATA.splitlines(keepends=True)[0] + OLDER_SYSLOG_DATA.splitlines(keepends=True)[1])
+    for result in (query, count, export, split):
+        assert result.returncode == 0, result.stderr
+
+
+def test_cli_rejects_pattern_without_match_and_mixed_formats(tmp_path):
+    (tmp_path / "syslog.log").write_text(OLDER_SYSLOG_DATA)
+    (tmp_path / "syslog.json").write_text("[]")
+
+    missing = run("count_event_per_process", tmp_path / "*.gz")
+    mixed = run("query", "log", tmp_path / "syslog.*", "from_process", "sshd")
+
+    assert missing.returncode != 0
+    assert "No file matches" in missing.stderr
+    assert mixed.returncode != 0
+    assert "File format mismatch" in mixed.stderr
+
+
+def test_cli_rejects_negative_jobs(tmp_path):
+    (tmp_path / "syslog.log").write_text(OLDER_SYSLOG_DATA)
+
+    query = run("query", "log", tmp_path / "syslog.log", "from_process", "sshd", "--jobs", "-4")
+    export = run("export", "jsonl", tmp_path / "syslog.log", tmp_path / "output.jsonl", "--jobs", "-4")
+
+    for result in (query, export):
+        assert result.returncode == 2
+        assert "--jobs" in result.stderr
+    assert not (tmp_path / "output.jsonl").exists()
@@ -129,4 +129,38 @@ Jun 16 10:00:00,combo,systemd,1,"Started Session 2 of user user2."
     assert result.returncode == 0
 
     # Check if there was any error
-    assert result.stderr == ""
\ No newline at end of file
+    assert result.stderr == ""
+
+def test_cli_query_contains_words_file_command_log(tmp_path):
+    syslog_data = """\
+Jun 13 15:16:01 combo kernel: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+"""
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_text(syslog_data, encoding='utf-8', newline='')
+    words_file = tmp_path / "iocs.txt"
+    words_file.write_text("".join(f"10.0.{number}.1\n" for number in range(50)) + "218.188.2.4\n192.168.0.2\n")
+
+    expected_output = """\
+Jun 13 15:16:01 combo kernel: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+"""
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [
+            sys.executable, str(script_path), "query", "log", str(temp_file), "contains_words", "Started",
+            "--words-file", str(words_file)
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    assert result.stdout.strip() == expected_output.strip()
+    assert result.returncode == 0
+    assert result.stderr == ""
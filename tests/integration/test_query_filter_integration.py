@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_cli_query_filter_command_log(tmp_path):
+    syslog_data = """\
+Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 14 15:17:30 relay sshd(pam_unix)[19942]: Failed password for user3 from 192.168.0.3 port 22 ssh2
+Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+Jun 16 10:00:00 combo sshd(pam_unix)[19943]: Failed password for user2 from 192.168.0.4 port 22 ssh2
+"""
+
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_text(syslog_data, encoding='utf-8', newline='')
+
+    expected_output = """\
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+"""
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [
+            sys.executable, str(script_path), "query", "log", str(temp_file), "filter",
+            "--start", "14/06/2024", "--end", "15/06/2024", "--process", "sshd", "--hostname", "combo",
+            "--words", "Failed,refused"
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    assert result.stdout.strip() == expected_output.strip()
+    assert result.returncode == 0
+    assert result.stderr == ""
@@ -0,0 +1,123 @@
+import json
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from syslog_manager.client import query_server
+from syslog_manager.log_query import LogFileQuery
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.server import QueryServer
+
+SYSLOG_DATA = """\
+Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 14 15:17:30 relay sshd(pam_unix)[19942]: Failed password for user3 from 192.168.0.3 port 22 ssh2
+Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+Jun 16 10:00:00 combo sshd(pam_unix)[19943]: Failed password for user2 from 192.168.0.4 port 22 ssh2
+"""
+
+
+@pytest.fixture
+def syslog_file(tmp_path):
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_text(SYSLOG_DATA, encoding='utf-8', newline='')
+    return temp_file
+
+
+@pytest.fixture
+def server_url(syslog_file):
+    # Port 0 picks a free port
+    server = QueryServer([syslog_file], ('127.0.0.1', 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("query_filter", [
+    QueryFilter(start_timestamp=datetime(2024, 6, 14), end_timestamp=datetime(2024, 6, 15)),
+    QueryFilter(process="systemd"),
+    QueryFilter(keywords=["Failed", "Accepted"]),
+    QueryFilter(keywords=["unknown"]),
+    QueryFilter(process="SSHD", hostname="combo", keywords=[r"user[12]\b"], regex=True, ignore_case=True),
+])
+def test_server_answers_like_file_query(syslog_file, server_url, query_filter):
+    expected = list(LogFileQuery(syslog_file).query(query_filter))
+
+    assert list(query_server(server_url, syslog_file, query_filter)) == expected
+
+
+def test_server_lists_files(syslog_file, server_url):
+    with urllib.request.urlopen(f"{server_url}/files") as response:
+        assert json.load(response) == [str(syslog_file.resolve())]
+
+
+def test_server_rejects_file_not_served(tmp_path, server_url):
+    with pytest.raises(FileNotFoundError, match="is not served"):
+        list(query_server(server_url, tmp_path / "other.log", QueryFilter(process="sshd")))
+
+
+def test_server_rejects_invalid_pattern(syslog_file, server_url):
+    with pytest.raises(ValueError, match="Invalid query"):
+        list(query_server(server_url, syslog_file, QueryFilter(keywords=["(unclosed"], regex=True)))
+
+
+@pytest.mark.parametrize("keywords", ["Failed", [1], {"word": "Failed"}])
+def test_server_rejects_keywords_not_list_of_strings(syslog_file, server_url, keywords):
+    body = json.dumps({'file': str(syslog_file), 'keywords': keywords}).encode('utf-8')
+    request = urllib.request.Request(f"{server_url}/query", data=body, headers={'Content-Type': 'application/json'})
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request)
+
+    assert error.value.code == 400
+    assert "keywords must be a list of strings" in error.value.read().decode('utf-8')
+    error.value.close()
+
+
+def test_query_unreachable_server(syslog_file):
+    with pytest.raises(ConnectionError):
+        list(query_server("http://127.0.0.1:1", syslog_file, QueryFilter(process="sshd")))
+
+
+def test_cli_query_through_server(syslog_file, server_url):
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [
+            sys.executable, str(script_path), "query", "log", str(syslog_file), "--server", server_url,
+            "contains_words", "Failed"
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == [line for line in SYSLOG_DATA.splitlines() if "Failed" in line]
+    assert result.returncode == 0
+
+
+def test_client_command(syslog_file, server_url):
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "client.py"
+
+    result = subprocess.run(
+        [
+            sys.executable, str(script_path), str(syslog_file), "--server", server_url,
+            "--hostname", "combo", "--process", "systemd"
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    assert result.stdout == "Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.\n"
+    assert result.returncode == 0
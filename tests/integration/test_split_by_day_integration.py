@@ -71,3 +71,21 @@ Jun 16 15:18:03 combo systemd[1]: Started Session 1 of user user1.
     # Ensure the command ran without errors
     assert result.returncode == 0
     assert result.stderr == ""
+
+
+def test_cli_split_rejects_max_open_files_below_one(tmp_path):
+    temp_file = write_syslog_to_temp_file(tmp_path, "Jun 13 15:16:01 combo systemd[1]: Started Session 1 of user user1.\n")
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    for max_open_files in ("0", "-1"):
+        result = subprocess.run(
+            [sys.executable, str(script_path), "split", str(temp_file), "--max-open-files", max_open_files],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        assert result.returncode == 2
+        assert "--max-open-files" in result.stderr
+        assert not (tmp_path / 'syslog-2024-06-13.log').exists()
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_cli_index_build_and_query(tmp_path):
+    syslog_data = """\
+Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+"""
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_text(syslog_data, encoding='utf-8', newline='')
+
+    script_path = Path(__file__).resolve().parents[2] / "syslog_manager" / "main.py"
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), "index", "build", str(temp_file)],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+    assert (tmp_path / "syslog.log.words.idx").exists()
+    assert (tmp_path / "syslog.log.time.idx").exists()
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), "query", "log", str(temp_file), "contains_words", "Accepted,Failed"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+    assert result.stdout.strip() == """\
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2"""
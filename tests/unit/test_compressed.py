@@ -0,0 +1,132 @@
+import bz2
+import gzip
+import lzma
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager import compressed
+from syslog_manager.compressed import is_compressed, iter_decompressed, read_start
+from syslog_manager.count_event_per_process import count_event_per_process
+from syslog_manager.exporter import JSONLinesSyslogExporter
+from syslog_manager.hourly_report import count_events_per_hour
+from syslog_manager.log_query import create_log_query
+from syslog_manager.mapped_lines import iter_lines
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.split_by_day import split_syslog_by_day
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+COMPRESSORS = {'.gz': gzip.compress, '.bz2': bz2.compress, '.xz': lzma.compress}
+
+
+@pytest.fixture
+def sample_data():
+    with open(SAMPLE_FILE, 'rb') as f:
+        # A CRLF line break across a chunk boundary and an unterminated last line
+        return f.read().replace(b'\n', b'\r\n', 3)
+
+
+@pytest.fixture(params=sorted(COMPRESSORS))
+def compressed_file(request, tmp_path, sample_data):
+    path = tmp_path / f"syslog.1{request.param}"
+    path.write_bytes(COMPRESSORS[request.param](sample_data))
+    plain_path = tmp_path / "plain" / "syslog.log"
+    plain_path.parent.mkdir()
+    plain_path.write_bytes(sample_data)
+    return path, plain_path
+
+
+def test_is_compressed():
+    assert is_compressed("syslog.1.gz")
+    assert is_compressed(Path("syslog.2.BZ2"))
+    assert is_compressed("syslog.xz")
+    assert not is_compressed("syslog.log")
+
+
+@pytest.mark.parametrize("read_size", [7, 1 << 20])
+def test_iter_decompressed(compressed_file, sample_data, read_size):
+    path, _ = compressed_file
+
+    assert b"".join(iter_decompressed(path, read_size=read_size, queue_size=2)) == sample_data
+    assert read_start(path, 100) == sample_data[:100]
+
+
+def test_iter_decompressed_stops_with_reader(compressed_file):
+    path, _ = compressed_file
+    threads = threading.active_count()
+
+    chunks = iter_decompressed(path, read_size=16, queue_size=1)
+    next(chunks)
+    chunks.close()
+
+    assert threading.active_count() == threads
+
+
+def test_iter_decompressed_raises_errors(tmp_path):
+    path = tmp_path / "corrupt.gz"
+    path.write_bytes(gzip.compress(b"line\n" * 1000)[:-20])
+
+    with pytest.raises(EOFError):
+        list(iter_decompressed(path))
+    with pytest.raises(FileNotFoundError):
+        list(iter_decompressed(tmp_path / "missing.gz"))
+
+
+@pytest.mark.parametrize("block_size", [64, 1 << 20])
+@pytest.mark.parametrize("needles", [None, [b"sshd"], [b"ftpd", b"su("]])
+def test_iter_lines_compressed(monkeypatch, compressed_file, block_size, needles):
+    monkeypatch.setattr(compressed, 'READ_SIZE', block_size)
+    path, plain_path = compressed_file
+
+    assert list(iter_lines(path, needles=needles)) == list(iter_lines(plain_path, needles=needles))
+    assert list(iter_lines(path, offsets=True)) == list(iter_lines(plain_path, offsets=True))
+    with pytest.raises(ValueError):
+        list(iter_lines(path, start=10))
+
+
+@pytest.mark.parametrize("query_filter", [
+    QueryFilter(start_timestamp=datetime(2024, 6, 20), end_timestamp=datetime(2024, 7, 1)),
+    QueryFilter(process="sshd", keywords=["failure"]),
+    QueryFilter(keywords=["combo"], hostname="combo"),
+])
+def test_query_compressed(compressed_file, query_filter):
+    path, plain_path = compressed_file
+
+    expected = list(create_log_query(plain_path).query(query_filter))
+
+    assert list(create_log_query(path, jobs=2).query(query_filter)) == expected
+
+
+def test_counts_and_exports_compressed(tmp_path, compressed_file):
+    path, plain_path = compressed_file
+
+    assert count_event_per_process(path, jobs=2) == count_event_per_process(plain_path)
+    assert count_events_per_hour(path) == count_events_per_hour(plain_path)
+
+    JSONLinesSyslogExporter(path, streaming=True).export(tmp_path / "compressed.jsonl")
+    JSONLinesSyslogExporter(plain_path, streaming=True).export(tmp_path / "plain.jsonl")
+    assert (tmp_path / "compressed.jsonl").read_text() == (tmp_path / "plain.jsonl").read_text()
+
+    entries = split_syslog_by_day(path, output_dir=tmp_path / "compressed_days")
+    plain_entries = split_syslog_by_day(plain_path, output_dir=tmp_path / "plain_days")
+    # Same days and offsets, only the source differs
+    for entry in entries + plain_entries:
+        for source_range in entry['ranges']:
+            del source_range['source']
+    assert entries == plain_entries
+    for entry in entries:
+        assert ((tmp_path / "compressed_days" / entry['file']).read_text()
+                == (tmp_path / "plain_days" / entry['file']).read_text())
@@ -0,0 +1,102 @@
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.columnar import ColumnarLogFile
+from syslog_manager.exporter import ColumnarSyslogExporter
+from syslog_manager.log_query import create_log_query
+
+
+@pytest.fixture
+def sample_syslog_data():
+    return """Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; user 'root'
+Invalid line without the correct format
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+Jun 16 10:00:00 combo kernel: [UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"""
+
+
+@pytest.fixture
+def columnar_file(tmp_path, sample_syslog_data):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text(sample_syslog_data)
+    output_file = tmp_path / "syslog.slc"
+    ColumnarSyslogExporter(syslog_file, streaming=True, chunk_size=2).export(output_file)
+    return output_file
+
+
+def test_export_columnar_round_trip(columnar_file):
+    with ColumnarLogFile(columnar_file) as log_file:
+        records = [log_file.record(index) for index in range(log_file.count)]
+
+    assert records == [
+        {"timestamp": "Jun 13 15:16:01", "hostname": "combo", "process": "sshd(pam_unix)", "pid": 19939,
+         "message": "authentication failure; user 'root'"},
+        {"timestamp": "Jun 14 15:17:02", "hostname": "combo", "process": "sshd(pam_unix)", "pid": 19940,
+         "message": "Accepted password for user1 from 192.168.0.1 port 22 ssh2"},
+        {"timestamp": "Jun 14 15:18:03", "hostname": "combo", "process": "systemd", "pid": 1,
+         "message": "Started Session 1 of user user1."},
+        {"timestamp": "Jun 15 15:19:04", "hostname": "combo", "process": "sshd(pam_unix)", "pid": 19941,
+         "message": "Failed password for user1 from 192.168.0.2 port 22 ssh2"},
+        {"timestamp": "Jun 16 10:00:00", "hostname": "combo", "process": "kernel", "pid": None,
+         "message": "[UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"}
+    ]
+
+
+def test_export_columnar_empty_file(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text("")
+    output_file = tmp_path / "syslog.slc"
+
+    ColumnarSyslogExporter(syslog_file).export(output_file)
+
+    with ColumnarLogFile(output_file) as log_file:
+        assert log_file.count == 0
+        assert list(log_file.indices_with_message_containing("failure")) == []
+
+
+def test_columnar_rejects_other_files(tmp_path):
+    not_columnar = tmp_path / "syslog.slc"
+    not_columnar.write_text("Jun 14 15:16:01 combo systemd[1]: Started Session 1 of user root.")
+
+    with pytest.raises(ValueError):
+        ColumnarLogFile(not_columnar)
+
+
+def test_columnar_match_spanning_two_messages(columnar_file):
+    # "ssh2" ends the second message and "Started" begins the third one
+    with ColumnarLogFile(columnar_file) as log_file:
+        assert list(log_file.indices_with_message_containing("ssh2Started")) == []
+        assert list(log_file.indices_with_message_containing("ssh2")) == [1, 3]
+
+
+def test_query_columnar_by_process(columnar_file):
+    result = create_log_query(columnar_file).query_logs_by_process("sshd")
+
+    assert [json.loads(line)["pid"] for line in result.splitlines()] == [19939, 19940, 19941]
+
+
+def test_query_columnar_by_words(columnar_file):
+    result = create_log_query(columnar_file).query_logs_by_words(["failure", "Started"])
+
+    assert [json.loads(line)["timestamp"] for line in result.splitlines()] == ["Jun 13 15:16:01", "Jun 14 15:18:03"]
+
+
+def test_query_columnar_between_timestamps(columnar_file):
+    year = datetime.now().year
+    result = create_log_query(columnar_file).query_logs_between_timestamps(datetime(year, 6, 14), datetime(year, 6, 15))
+
+    assert [json.loads(line)["timestamp"] for line in result.splitlines()] == [
+        "Jun 14 15:17:02", "Jun 14 15:18:03", "Jun 15 15:19:04"]
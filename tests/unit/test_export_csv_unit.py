@@ -2,6 +2,8 @@ import csv
 import os
 import sys
 
+import pytest
+
 # Get the directory containing the current script
 script_dir = os.path.dirname(os.path.abspath(__file__))
 # Define the project path relative to the script directory
@@ -174,3 +176,56 @@ def test_export_syslog_to_csv_empty_file(tmp_path):
     assert reader.fieldnames == expected_headers
 
 
+def test_export_syslog_to_csv_streaming_matches_default(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    default_csv_file = tmp_path / "default.csv"
+    streaming_csv_file = tmp_path / "streaming.csv"
+
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root.
+Jun 14 15:16:03 combo kernel: [UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"""
+    syslog_file.write_text(syslog_content)
+
+    CSVSyslogExporter(syslog_file).export(default_csv_file)
+    streaming_exporter = CSVSyslogExporter(syslog_file, streaming=True, chunk_size=2)
+    streaming_exporter.export(streaming_csv_file)
+
+    assert streaming_exporter.parsed_data == []
+    assert streaming_csv_file.read_text() == default_csv_file.read_text()
+
+    with streaming_csv_file.open('r') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    assert [row['process'] for row in rows] == ['sshd(pam_unix)', 'systemd', 'kernel']
+
+
+def test_export_syslog_to_csv_reports_first_invalid_row(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_csv_file = tmp_path / "syslog.csv"
+
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root.
+Jun 14 15:16:03 combo kernel: [UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"""
+    syslog_file.write_text(syslog_content)
+
+    csv_exporter = CSVSyslogExporter(syslog_file, chunk_size=2)
+    csv_exporter.parsed_data[2]['pid'] = 'abc'
+    csv_exporter.parsed_data[1]['timestamp'] = '2024-06-14 15:16:02'
+
+    # Line 1 is the header, so the second record is on line 3
+    with pytest.raises(ValueError, match="Invalid CSV data at line 3: Value 2024-06-14 15:16:02 does not satisfy"):
+        csv_exporter.export(output_csv_file)
+
+
+def test_export_syslog_to_csv_validation_off(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_csv_file = tmp_path / "syslog.csv"
+
+    syslog_file.write_text("Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure")
+
+    csv_exporter = CSVSyslogExporter(syslog_file, validate='off')
+    csv_exporter.parsed_data[0]['pid'] = 'abc'
+    csv_exporter.export(output_csv_file)
+
+    with output_csv_file.open('r') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    assert rows[0]['pid'] == 'abc'
@@ -3,6 +3,8 @@ import os
 import sys
 from unittest.mock import mock_open, patch, call
 
+import pytest
+
 # Get the directory containing the current script
 script_dir = os.path.dirname(os.path.abspath(__file__))
 # Define the project path relative to the script directory
@@ -11,7 +13,7 @@ project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
 if project_path not in sys.path:
     sys.path.append(project_path)
 
-from syslog_manager.exporter import JSONSyslogExporter
+from syslog_manager.exporter import JSONSyslogExporter, JSONLinesSyslogExporter
 
 
 def test_export_syslog_to_json_creates_json_file(tmp_path):
@@ -126,3 +128,149 @@ def test_export_syslog_to_json_with_empty_file(tmp_path):
 
     assert data == []
 
+
+
+def test_export_syslog_to_json_streaming_matches_default(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Invalid line without the correct format
+Jun 14 15:16:02 combo sshd(pam_unix)[19940]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.5
+Jun 14 15:16:03 combo kernel: [UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"""
+    syslog_file = tmp_path / "syslog.log"
+    default_json_file = tmp_path / "default.json"
+    streaming_json_file = tmp_path / "streaming.json"
+
+    syslog_file.write_text(syslog_content)
+
+    JSONSyslogExporter(syslog_file).export(default_json_file)
+    streaming_exporter = JSONSyslogExporter(syslog_file, streaming=True, chunk_size=2)
+    streaming_exporter.export(streaming_json_file)
+
+    # Nothing is loaded upfront in streaming mode
+    assert streaming_exporter.parsed_data == []
+    assert streaming_json_file.read_text() == default_json_file.read_text()
+    assert len(json.loads(streaming_json_file.read_text())) == 3
+
+
+def test_export_syslog_to_json_streaming_with_empty_file(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_json_file = tmp_path / "syslog.json"
+
+    syslog_file.write_text("")
+
+    JSONSyslogExporter(syslog_file, streaming=True).export(output_json_file)
+
+    with open(output_json_file, 'r') as f:
+        data = json.load(f)
+
+    assert data == []
+
+
+def test_export_syslog_to_json_compact(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:16:02 combo kernel: message with "quotes" and },{ braces"""
+    syslog_file = tmp_path / "syslog.log"
+    output_json_file = tmp_path / "syslog.json"
+
+    syslog_file.write_text(syslog_content)
+
+    json_exporter = JSONSyslogExporter(syslog_file, streaming=True, chunk_size=1, compact=True)
+    json_exporter.export(output_json_file)
+
+    expected_data = [
+        {
+            "timestamp": "Jun 14 15:16:01",
+            "hostname": "combo",
+            "process": "sshd(pam_unix)",
+            "pid": 19939,
+            "message": "authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4"
+        },
+        {
+            "timestamp": "Jun 14 15:16:02",
+            "hostname": "combo",
+            "process": "kernel",
+            "pid": None,
+            "message": 'message with "quotes" and },{ braces'
+        }
+    ]
+
+    # Compact output is identical to json.dump without indentation
+    assert output_json_file.read_text() == json.dumps(expected_data)
+
+
+def test_export_syslog_to_json_lines(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure
+Jun 14 15:16:02 combo kernel: message with "quotes" and },{ braces
+Jun 14 15:16:03 combo systemd[1]: Started Session 3 of user root."""
+    syslog_file = tmp_path / "syslog.log"
+    output_jsonl_file = tmp_path / "syslog.jsonl"
+
+    syslog_file.write_text(syslog_content)
+
+    jsonl_exporter = JSONLinesSyslogExporter(syslog_file, streaming=True, chunk_size=2)
+    jsonl_exporter.export(output_jsonl_file)
+
+    lines = output_jsonl_file.read_text().splitlines()
+    data = [json.loads(line) for line in lines]
+
+    assert len(lines) == 3
+    assert [entry['process'] for entry in data] == ['sshd(pam_unix)', 'kernel', 'systemd']
+    assert data[1]['message'] == 'message with "quotes" and },{ braces'
+    assert lines[2] == json.dumps(data[2])
+
+
+def test_export_syslog_to_json_lines_with_empty_file(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_jsonl_file = tmp_path / "syslog.jsonl"
+
+    syslog_file.write_text("")
+
+    JSONLinesSyslogExporter(syslog_file).export(output_jsonl_file)
+
+    assert output_jsonl_file.read_text() == ""
+
+
+def test_export_syslog_to_json_validation_modes(tmp_path):
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure
+Jun 14 15:16:02 combo sshd(pam_unix)[19940]: authentication failure"""
+    syslog_file = tmp_path / "syslog.log"
+    output_json_file = tmp_path / "syslog.json"
+
+    syslog_file.write_text(syslog_content)
+
+    json_exporter = JSONSyslogExporter(syslog_file)
+    json_exporter.parsed_data[1]['hostname'] = 42
+    with pytest.raises(ValueError, match="Invalid JSON data: 42 is not of type 'string'"):
+        json_exporter.export(output_json_file)
+
+    # Sampling checks only the first record of every sample interval
+    json_exporter = JSONSyslogExporter(syslog_file, validate='sample')
+    json_exporter.parsed_data[1]['hostname'] = 42
+    json_exporter.export(output_json_file)
+
+    json_exporter = JSONSyslogExporter(syslog_file, validate='sample')
+    json_exporter.parsed_data[0]['hostname'] = 42
+    with pytest.raises(ValueError):
+        json_exporter.export(output_json_file)
+
+    json_exporter = JSONSyslogExporter(syslog_file, validate='off')
+    json_exporter.parsed_data[0]['hostname'] = 42
+    json_exporter.export(output_json_file)
+    assert json.loads(output_json_file.read_text())[0]['hostname'] == 42
+
+
+def test_export_syslog_to_json_unsupported_validation_mode(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text("")
+
+    with pytest.raises(ValueError, match="Unsupported validation mode"):
+        JSONSyslogExporter(syslog_file, validate='partial')
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_export_syslog_to_json_invalid_chunk_size(tmp_path, streaming, chunk_size):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text("Jun 14 15:16:01 combo sshd(pam_unix)[19939]: check pass; user unknown\n")
+
+    with pytest.raises(ValueError, match="chunk size"):
+        JSONSyslogExporter(syslog_file, streaming=streaming, chunk_size=chunk_size)
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+
 # Get the directory containing the current script
 script_dir = os.path.dirname(os.path.abspath(__file__))
 # Define the project path relative to the script directory
@@ -119,4 +121,89 @@ def test_export_sql_missing_pid(tmp_path):
     expected_lines = [line.strip() for line in expected_sql_content.strip().splitlines() if line.strip()]
     actual_lines = [line.strip() for line in output_sql_file.read_text().strip().splitlines() if line.strip()]
 
-    assert expected_lines == actual_lines
\ No newline at end of file
+    assert expected_lines == actual_lines
+
+def test_export_sql_streaming_matches_default(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    default_sql_file = tmp_path / "default.sql"
+    streaming_sql_file = tmp_path / "streaming.sql"
+
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; user 'root'
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root.
+Jun 14 15:16:03 combo kernel: [UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"""
+    syslog_file.write_text(syslog_content)
+
+    SQLSyslogExporter(syslog_file).export(default_sql_file)
+    streaming_exporter = SQLSyslogExporter(syslog_file, streaming=True, chunk_size=2)
+    streaming_exporter.export(streaming_sql_file)
+
+    assert streaming_exporter.parsed_data == []
+    assert streaming_sql_file.read_text() == default_sql_file.read_text()
+    assert streaming_sql_file.read_text().count("INSERT INTO syslog") == 3
+
+
+def test_export_sql_batched_insert_with_transactions(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_sql_file = tmp_path / "syslog.sql"
+
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; user 'root'
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root.
+Jun 14 15:16:03 combo kernel: [UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"""
+    syslog_file.write_text(syslog_content)
+
+    sql_exporter = SQLSyslogExporter(syslog_file, batch_size=2, transactions=True)
+    sql_exporter.export(output_sql_file)
+
+    expected_sql_content = """\
+        CREATE TABLE IF NOT EXISTS syslog (
+            id SERIAL PRIMARY KEY,
+            timestamp VARCHAR(255) NOT NULL,
+            hostname VARCHAR(255) NOT NULL,
+            process VARCHAR(255) NOT NULL,
+            pid INTEGER,
+            message TEXT NOT NULL
+        );
+        BEGIN;
+        INSERT INTO syslog (timestamp, hostname, process, pid, message) VALUES
+        ('Jun 14 15:16:01', 'combo', 'sshd(pam_unix)', 19939, 'authentication failure; user ''root'''),
+        ('Jun 14 15:16:02', 'combo', 'systemd', 1, 'Started Session 3 of user root.');
+        INSERT INTO syslog (timestamp, hostname, process, pid, message) VALUES
+        ('Jun 14 15:16:03', 'combo', 'kernel', NULL, '[UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1');
+        COMMIT;
+        """
+
+    expected_lines = [line.strip() for line in expected_sql_content.strip().splitlines() if line.strip()]
+    actual_lines = [line.strip() for line in output_sql_file.read_text().strip().splitlines() if line.strip()]
+
+    assert actual_lines == expected_lines
+
+
+def test_export_sql_copy_dialect(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_sql_file = tmp_path / "syslog.sql"
+
+    syslog_content = "Jun 14 15:16:01 combo sshd(pam_unix)[19939]: path C:\\temp\twith tab\n" \
+                     "Jun 14 15:16:02 combo kernel: no pid"
+    syslog_file.write_text(syslog_content)
+
+    sql_exporter = SQLSyslogExporter(syslog_file, dialect='copy')
+    sql_exporter.export(output_sql_file)
+
+    actual_lines = [line.strip() for line in output_sql_file.read_text().strip().splitlines() if line.strip()]
+
+    assert actual_lines[-4:] == [
+        "COPY syslog (timestamp, hostname, process, pid, message) FROM stdin;",
+        "Jun 14 15:16:01\tcombo\tsshd(pam_unix)\t19939\tpath C:\\\\temp\\twith tab",
+        "Jun 14 15:16:02\tcombo\tkernel\t\\N\tno pid",
+        "\\."
+    ]
+
+
+def test_export_sql_invalid_options(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text("")
+
+    with pytest.raises(ValueError, match="Unsupported SQL dialect"):
+        SQLSyslogExporter(syslog_file, dialect='merge')
+    with pytest.raises(ValueError, match="batch size"):
+        SQLSyslogExporter(syslog_file, batch_size=0)
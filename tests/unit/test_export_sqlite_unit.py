@@ -0,0 +1,85 @@
+import os
+import sqlite3
+import sys
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.exporter import SQLiteSyslogExporter
+
+
+def read_rows(database_file):
+    connection = sqlite3.connect(database_file)
+    try:
+        return connection.execute("SELECT timestamp, hostname, process, pid, message FROM syslog ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+
+def test_export_sqlite_creates_database(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_db_file = tmp_path / "syslog.db"
+
+    syslog_content = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; user 'root'
+Invalid line without the correct format
+Jun 14 15:16:02 combo systemd[1]: Started Session 3 of user root.
+Jun 14 15:16:03 combo kernel: [UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1"""
+    syslog_file.write_text(syslog_content)
+
+    sqlite_exporter = SQLiteSyslogExporter(syslog_file, streaming=True, chunk_size=2)
+    sqlite_exporter.export(output_db_file)
+
+    assert read_rows(output_db_file) == [
+        ('Jun 14 15:16:01', 'combo', 'sshd(pam_unix)', 19939, "authentication failure; user 'root'"),
+        ('Jun 14 15:16:02', 'combo', 'systemd', 1, 'Started Session 3 of user root.'),
+        ('Jun 14 15:16:03', 'combo', 'kernel', None, '[UFW BLOCK] IN=eth0 OUT= SRC=192.168.0.10 DST=192.168.0.1')
+    ]
+
+
+def test_export_sqlite_creates_indexes(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_db_file = tmp_path / "syslog.db"
+
+    syslog_file.write_text("Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure")
+
+    SQLiteSyslogExporter(syslog_file).export(output_db_file)
+
+    connection = sqlite3.connect(output_db_file)
+    try:
+        indexes = {row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'syslog'")}
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM syslog WHERE process = 'sshd(pam_unix)'").fetchall()
+    finally:
+        connection.close()
+
+    assert indexes == {'idx_syslog_timestamp', 'idx_syslog_process', 'idx_syslog_hostname'}
+    assert any('idx_syslog_process' in row[-1] for row in plan)
+
+
+def test_export_sqlite_replaces_existing_database(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_db_file = tmp_path / "syslog.db"
+
+    syslog_file.write_text("Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure")
+
+    SQLiteSyslogExporter(syslog_file).export(output_db_file)
+    SQLiteSyslogExporter(syslog_file).export(output_db_file)
+
+    assert len(read_rows(output_db_file)) == 1
+
+
+def test_export_sqlite_empty_file(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    output_db_file = tmp_path / "syslog.db"
+
+    syslog_file.write_text("")
+
+    SQLiteSyslogExporter(syslog_file).export(output_db_file)
+
+    assert read_rows(output_db_file) == []
@@ -0,0 +1,150 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager import follow
+from syslog_manager.follow import FollowedFile, follow_counts, follow_query
+from syslog_manager.query_filter import QueryFilter
+
+SSHD_LINE = "Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; rhost=218.188.2.4\n"
+FTPD_LINE = "Jun 14 15:17:02 combo ftpd[24487]: connection from 24.54.76.216\n"
+
+POLL_INTERVAL = 0.01
+
+
+def append(path, text):
+    with open(path, 'a', newline='') as f:
+        f.write(text)
+
+
+def run_following(coroutine, steps, expected):
+    """Runs coroutine while each step changes the files, until expected() is true after the last one."""
+    async def run():
+        task = asyncio.ensure_future(coroutine)
+        try:
+            for step in steps:
+                await asyncio.sleep(5 * POLL_INTERVAL)
+                step()
+            for _ in range(500):
+                if task.done() or expected():
+                    break
+                await asyncio.sleep(POLL_INTERVAL)
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    asyncio.run(run())
+
+
+def test_followed_file_reads_complete_lines(tmp_path):
+    path = tmp_path / "syslog.log"
+    path.write_text(SSHD_LINE + "Jun 14 15:17:02 combo ftpd[24487]: conn", newline='')
+    followed = FollowedFile(path)
+
+    assert followed.read_lines() == [SSHD_LINE.strip()]
+    assert followed.read_lines() == []
+    append(path, "ection from 24.54.76.216\r\n")
+    assert followed.read_lines() == [FTPD_LINE.strip()]
+    followed.close()
+
+
+def test_followed_file_reads_in_chunks(monkeypatch, tmp_path):
+    monkeypatch.setattr(follow, 'READ_SIZE', 64)
+    path = tmp_path / "syslog.log"
+    path.write_text(SSHD_LINE * 10, newline='')
+    followed = FollowedFile(path)
+
+    lines = []
+    for _ in range(20):
+        lines.extend(followed.read_lines())
+    followed.close()
+
+    assert lines == [SSHD_LINE.strip()] * 10
+
+
+def test_followed_file_detects_truncation(tmp_path):
+    path = tmp_path / "syslog.log"
+    path.write_text(SSHD_LINE * 2, newline='')
+    followed = FollowedFile(path)
+    followed.read_lines()
+
+    path.write_text(FTPD_LINE, newline='')
+
+    assert followed.read_lines() == [FTPD_LINE.strip()]
+    followed.close()
+
+
+def test_followed_file_detects_rotation(tmp_path):
+    path = tmp_path / "syslog.log"
+    path.write_text(SSHD_LINE, newline='')
+    followed = FollowedFile(path)
+    followed.read_lines()
+
+    # The rest of the old file, including its unterminated last line, is read before the new file
+    append(path, SSHD_LINE + "last line of the old file")
+    os.rename(path, tmp_path / "syslog.log.1")
+    assert followed.read_lines() == [SSHD_LINE.strip()]
+    path.write_text(FTPD_LINE, newline='')
+
+    assert followed.read_lines() == ["last line of the old file", FTPD_LINE.strip()]
+    followed.close()
+
+
+def test_followed_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FollowedFile(tmp_path / "missing.log")
+
+
+def test_follow_query_emits_new_matches(tmp_path):
+    path = tmp_path / "syslog.log"
+    path.write_text(SSHD_LINE + FTPD_LINE, newline='')
+    emitted = []
+
+    run_following(
+        follow_query([path], QueryFilter(process="sshd"), emitted.extend, poll_interval=POLL_INTERVAL),
+        [lambda: append(path, FTPD_LINE + SSHD_LINE),
+         lambda: os.rename(path, tmp_path / "syslog.log.1"),
+         lambda: path.write_text(SSHD_LINE, newline='')],
+        lambda: len(emitted) == 3)
+
+    assert emitted == [SSHD_LINE.strip()] * 3
+
+
+def test_follow_query_several_files(tmp_path):
+    paths = [tmp_path / "a.log", tmp_path / "b.log"]
+    for path in paths:
+        path.write_text(FTPD_LINE, newline='')
+    emitted = []
+
+    run_following(
+        follow_query(paths, QueryFilter(keywords=["connection"]), emitted.extend, poll_interval=POLL_INTERVAL),
+        [lambda: append(paths[1], FTPD_LINE)],
+        lambda: len(emitted) == 3)
+
+    assert sorted(emitted) == sorted([f"{paths[0]}:{FTPD_LINE.strip()}"] + [f"{paths[1]}:{FTPD_LINE.strip()}"] * 2)
+
+
+def test_follow_counts_emits_updated_counts(tmp_path):
+    path = tmp_path / "syslog.log"
+    path.write_text(SSHD_LINE + FTPD_LINE + SSHD_LINE, newline='')
+    emitted = []
+
+    run_following(
+        follow_counts([path], emitted.append, poll_interval=POLL_INTERVAL),
+        [lambda: append(path, FTPD_LINE)],
+        lambda: len(emitted) == 2)
+
+    assert emitted == [{'ftpd': 1, 'sshd(pam_unix)': 2}, {'ftpd': 2}]
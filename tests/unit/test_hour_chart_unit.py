@@ -1,6 +1,14 @@
+import os
+from collections import Counter
+from datetime import date
+
 import pytest
 
-from syslog_manager.hourly_report import count_events_per_hour
+from syslog_manager.count_event_per_process import count_event_per_process
+from syslog_manager.hourly_report import (BUCKET_WIDTHS, bucket_label, count_events_per_bucket, count_events_per_hour,
+                                          parse_bucket_width)
+from syslog_manager.timestamps import epoch_day
+from syslog_manager.utility import parse_lines
 
 
 def test_count_events_per_hour_with_sample_data(tmp_path):
@@ -82,3 +90,92 @@ Jun 26 23:59:59 combo sshd(pam_unix)[10002]: another message
     # Assert that the boundary hours are correctly counted
     for hour, count in expected_counts.items():
         assert hourly_counts.get(hour, 0) == count
+
+
+def test_count_events_per_hour_with_padded_days(tmp_path):
+    syslog_content = """Jul  1 09:01:00 combo sshd(pam_unix)[10001]: some message
+Jul  1 23:15:30 combo cupsd: another message
+Jul 10 09:45:10 combo sshd(pam_unix)[10003]: yet another message
+not a syslog line 10:00:00
+Jul 10 10:00:00 missing process separator
+"""
+
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text(syslog_content)
+
+    assert count_events_per_hour(syslog_file) == {9: 2, 23: 1}
+    assert count_events_per_hour(syslog_file, per_process=True) == {
+        'sshd(pam_unix)': {9: 2},
+        'cupsd': {23: 1},
+    }
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_count_events_per_hour_matches_parsed_records(jobs):
+    sample_file = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'syslog_data.log')
+    with open(sample_file) as f:
+        expected = Counter(int(record.timestamp.split()[2][:2]) for record in parse_lines(f))
+
+    assert count_events_per_hour(sample_file, jobs=jobs) == expected
+    per_process = count_events_per_hour(sample_file, jobs=jobs, per_process=True)
+    assert {process: sum(counts.values()) for process, counts in per_process.items()} == count_event_per_process(
+        sample_file)
+
+
+def test_count_events_per_hour_per_process_with_unusual_names(tmp_path):
+    syslog_content = """Jun 15 01:00:00 combo kernel: [12.5] usb: device found
+Jun 15 01:00:01 combo named:stats[77]: queries: 10
+Jun 15 01:00:02 combo app[main][42]: started
+"""
+
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text(syslog_content)
+
+    expected = Counter(record.process for record in parse_lines(syslog_content.splitlines()))
+    per_process = count_events_per_hour(syslog_file, per_process=True)
+    assert {process: counts[1] for process, counts in per_process.items()} == expected
+
+
+def test_count_events_per_bucket(tmp_path):
+    syslog_content = """Jun 15 00:01:00 combo sshd(pam_unix)[10001]: some message
+Jun 15 00:04:59 combo cupsd: another message
+Jun 15 00:05:00 combo sshd(pam_unix)[10003]: yet another message
+Jun 16 14:35:50 combo sshd(pam_unix)[10006]: another message for 14th hour
+Feb 30 14:35:50 combo sshd(pam_unix)[10006]: invalid date
+"""
+
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text(syslog_content)
+    june_15 = epoch_day(date(2024, 6, 15))
+    june_16 = epoch_day(date(2024, 6, 16))
+
+    assert count_events_per_bucket(syslog_file, width=BUCKET_WIDTHS['day']) == {june_15: 3, june_16: 1}
+    assert count_events_per_bucket(syslog_file, width=BUCKET_WIDTHS['5min']) == {
+        june_15: 2, june_15 + 300: 1, june_16 + 14 * 3600 + 35 * 60: 1}
+    # 90 seconds buckets are counted from the exact second of every event
+    assert count_events_per_bucket(syslog_file, width=90) == {
+        june_15 + 0: 1, june_15 + 270: 2, june_16 + 52470: 1}
+    assert count_events_per_bucket(syslog_file, width=BUCKET_WIDTHS['hour'], per_process=True) == {
+        'sshd(pam_unix)': {june_15: 2, june_16 + 14 * 3600: 1},
+        'cupsd': {june_15: 1},
+    }
+
+
+def test_parse_bucket_width():
+    assert parse_bucket_width('minute') == 60
+    assert parse_bucket_width('5min') == 300
+    assert parse_bucket_width('day') == 86400
+    assert parse_bucket_width('15m') == 900
+    assert parse_bucket_width('2h') == 7200
+    assert parse_bucket_width('30s') == 30
+    for text in ('0m', '15', 'week', '1.5h'):
+        with pytest.raises(ValueError):
+            parse_bucket_width(text)
+
+
+def test_bucket_label():
+    june_15 = epoch_day(date(2024, 6, 15))
+
+    assert bucket_label(june_15, 86400) == '2024-06-15'
+    assert bucket_label(june_15 + 3600 + 300, 300) == '2024-06-15 01:05'
+    assert bucket_label(june_15 + 90, 30) == '2024-06-15 00:01:30'
@@ -0,0 +1,95 @@
+import io
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.exporter import JSONLinesSyslogExporter, JSONSyslogExporter
+from syslog_manager.json_stream import iter_json_array, iter_json_lines
+from syslog_manager.log_query import JSONLinesFileQuery, create_log_query
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+RECORDS = [
+    {"timestamp": "Jun 14 15:16:01", "process": "sshd", "pid": 19939, "message": "a \"quoted\" ] [ , {}"},
+    {"timestamp": "Jun 15 04:06:18", "process": "su(pam_unix)", "pid": None, "message": "café \\ end"},
+    12345,
+    [1, [2.5, True]],
+]
+
+
+@pytest.mark.parametrize("indent", [None, 4])
+@pytest.mark.parametrize("read_size", [1, 3, 1 << 16])
+def test_iter_json_array_matches_json_load(indent, read_size):
+    text = json.dumps(RECORDS, indent=indent)
+
+    assert list(iter_json_array(io.StringIO(text), read_size=read_size)) == RECORDS
+
+
+@pytest.mark.parametrize("text", ["[]", " [ ] \n", "[\n]"])
+def test_iter_json_array_empty(text):
+    assert list(iter_json_array(io.StringIO(text), read_size=2)) == []
+
+
+@pytest.mark.parametrize("text", ["", "[1,]", "[1 2]", "[1", "[1] x", "[{\"a\": }]", "[,1]"])
+@pytest.mark.parametrize("read_size", [1, 1 << 16])
+def test_iter_json_array_rejects_what_json_load_rejects(text, read_size):
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(text), read_size=read_size))
+
+
+def test_iter_json_array_rejects_other_values():
+    with pytest.raises(json.JSONDecodeError, match="Expecting '\\['"):
+        list(iter_json_array(io.StringIO('{"a": 1}')))
+
+
+def test_iter_json_array_is_lazy():
+    text = '[{"a": 1}, {"b": 2}, this is not json'
+
+    values = iter_json_array(io.StringIO(text), read_size=4)
+
+    assert next(values) == {"a": 1}
+    assert next(values) == {"b": 2}
+    with pytest.raises(json.JSONDecodeError):
+        next(values)
+
+
+def test_iter_json_lines():
+    text = '{"a": 1}\n\n{"b": [2]}\r\n'
+
+    assert list(iter_json_lines(io.StringIO(text))) == [{"a": 1}, {"b": [2]}]
+
+
+@pytest.fixture
+def exported_files(tmp_path):
+    json_file = tmp_path / "syslog.json"
+    jsonl_file = tmp_path / "syslog.jsonl"
+    JSONSyslogExporter(SAMPLE_FILE).export(json_file)
+    JSONLinesSyslogExporter(SAMPLE_FILE).export(jsonl_file)
+    return json_file, jsonl_file
+
+
+@pytest.mark.parametrize("query", [
+    lambda log_query: log_query.query_logs_by_process("sshd"),
+    lambda log_query: log_query.query_logs_by_words(["failure", "ftpd"]),
+    lambda log_query: log_query.query_logs_between_timestamps(datetime(2024, 6, 20), datetime(2024, 7, 1)),
+])
+def test_json_lines_queries_match_json(exported_files, query):
+    json_file, jsonl_file = exported_files
+    log_query = create_log_query(jsonl_file)
+
+    assert isinstance(log_query, JSONLinesFileQuery)
+    assert query(log_query)
+    assert query(log_query) == query(create_log_query(json_file))
@@ -0,0 +1,107 @@
+import os
+import random
+import sys
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.columnar import ColumnarLogFile
+from syslog_manager.exporter import ColumnarSyslogExporter
+from syslog_manager.keywords import KeywordMatcher, keyword_pattern, read_keywords
+from syslog_manager.log_query import create_log_query
+from syslog_manager.mapped_lines import iter_lines
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+KEYWORD_SETS = [
+    [],
+    ["failure"],
+    ["ab", "abc", "abd", "b"],
+    ["abc", "ab"],
+    ["x.y", "a+b", "(c)", "[d]", "e\\f", "g|h", "^i", "j$", "k*"],
+    ["café", "caf", "naïve"],
+    ["", "zzz"],
+]
+
+TEXTS = ["", "abc", "xxabdxx", "a", "xb", "x.y", "xzy", "a+b", "aab", "(c)", "[d]", "e\\f", "g|h", "^i", "j$",
+         "k*", "k", "un café", "cafe", "naïve", "zz", "zzz"]
+
+
+@pytest.mark.parametrize("keywords", KEYWORD_SETS)
+def test_keyword_pattern_matches_like_in(keywords):
+    search = keyword_pattern(keywords).search
+    byte_search = keyword_pattern([keyword.encode('utf-8') for keyword in keywords]).search
+    matcher = KeywordMatcher(keywords)
+
+    for text in TEXTS:
+        expected = any(keyword in text for keyword in keywords)
+        assert (search(text) is not None) == expected
+        if keywords:
+            assert (byte_search(text.encode('utf-8')) is not None) == expected
+        assert matcher(text) == expected
+
+
+def test_keyword_pattern_random_keywords():
+    rng = random.Random(7)
+    keywords = ["".join(rng.choice("abc.") for _ in range(rng.randint(1, 5))) for _ in range(200)]
+    search = keyword_pattern(keywords).search
+
+    for _ in range(500):
+        text = "".join(rng.choice("abcd.") for _ in range(rng.randint(0, 12)))
+        assert (search(text) is not None) == any(keyword in text for keyword in keywords)
+
+
+def test_read_keywords(tmp_path):
+    words_file = tmp_path / "words.txt"
+    words_file.write_text("218.188.2.4\n\n  ftpd \r\nsession opened\n", encoding='utf-8')
+
+    assert read_keywords(words_file) == ["218.188.2.4", "ftpd", "session opened"]
+
+
+@pytest.fixture
+def many_keywords():
+    # More keywords than are counted one by one, most of them absent from the data
+    return [f"10.{number}.0.{number}" for number in range(100)] + ["ftpd", "session opened", "218.188.2.4"]
+
+
+def test_iter_lines_with_many_needles(many_keywords):
+    with open(SAMPLE_FILE, 'r') as f:
+        expected = [line for line in f if any(keyword in line for keyword in many_keywords)]
+
+    assert expected
+    assert list(iter_lines(SAMPLE_FILE, needles=[keyword.encode() for keyword in many_keywords])) == expected
+
+
+def test_columnar_messages_containing_any(tmp_path, many_keywords):
+    columnar_file = tmp_path / "syslog.slc"
+    ColumnarSyslogExporter(SAMPLE_FILE).export(columnar_file)
+
+    with ColumnarLogFile(columnar_file) as log_file:
+        expected = sorted({index for keyword in many_keywords
+                           for index in log_file.indices_with_message_containing(keyword)})
+        assert list(log_file.indices_with_message_containing_any(many_keywords)) == expected
+
+
+@pytest.mark.parametrize("suffix", [".log", ".slc"])
+def test_query_many_keywords(tmp_path, many_keywords, suffix):
+    input_file = tmp_path / f"syslog{suffix}"
+    if suffix == ".log":
+        with open(SAMPLE_FILE, 'r') as f:
+            input_file.write_text(f.read())
+    else:
+        ColumnarSyslogExporter(SAMPLE_FILE).export(input_file)
+    log_query = create_log_query(input_file)
+
+    expected = []
+    for keyword in many_keywords:
+        expected.extend(log_query.iter_logs_by_words([keyword]))
+    result = list(log_query.iter_logs_by_words(many_keywords))
+
+    assert sorted(set(expected)) == sorted(result)
@@ -0,0 +1,94 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager import loaded_log
+from syslog_manager.loaded_log import LoadedLogQuery
+from syslog_manager.log_query import LogFileQuery
+from syslog_manager.query_filter import QueryFilter
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+FILTERS = [
+    QueryFilter(),
+    QueryFilter(start_timestamp=datetime(2024, 6, 20), end_timestamp=datetime(2024, 7, 1)),
+    QueryFilter(end_timestamp=datetime(2024, 6, 16)),
+    QueryFilter(process="sshd"),
+    QueryFilter(process="nonexistent"),
+    QueryFilter(hostname="relay"),
+    QueryFilter(keywords=["failure", "218.188.2.4"]),
+    QueryFilter(keywords=["combo"]),
+    QueryFilter(keywords=[]),
+    QueryFilter(process="sshd", keywords=["failure"], start_timestamp=datetime(2024, 6, 20)),
+    QueryFilter(hostname="relay", process="ftpd"),
+    QueryFilter(keywords=[r"Failed password for (root|user\d)"], regex=True),
+    QueryFilter(process="SU", keywords=["SESSION"], ignore_case=True),
+]
+
+
+@pytest.fixture
+def syslog_file(tmp_path):
+    with open(SAMPLE_FILE, 'r') as f:
+        lines = f.readlines()
+    # Out of time order, with a few lines from another host, invalid lines and CRLF line breaks
+    lines = lines[len(lines) // 2:] + lines[:len(lines) // 2]
+    lines = [line.replace(" combo ", " relay ", 1) if number % 3 == 0 else line for number, line in enumerate(lines)]
+    lines.insert(10, "not a syslog line with failure\n")
+    lines[20] = lines[20].replace("\n", "\r\n")
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_bytes("".join(lines).encode('utf-8'))
+    return temp_file
+
+
+@pytest.mark.parametrize("small_candidate_count", [0, 10 ** 6])
+@pytest.mark.parametrize("query_filter", FILTERS)
+def test_loaded_log_query_matches_file_query(monkeypatch, syslog_file, query_filter, small_candidate_count):
+    monkeypatch.setattr(loaded_log, 'SMALL_CANDIDATE_COUNT', small_candidate_count)
+
+    expected = list(LogFileQuery(syslog_file).query(query_filter))
+
+    assert list(LoadedLogQuery(syslog_file).query(query_filter)) == expected
+
+
+def test_loaded_log_reloads_changed_file(syslog_file):
+    log_query = LoadedLogQuery(syslog_file)
+    before = log_query.query_logs_by_words(["appended"])
+
+    with open(syslog_file, 'a') as f:
+        f.write("Jul 27 14:41:58 combo sshd[1]: appended line\n")
+
+    assert before == ""
+    assert log_query.query_logs_by_words(["appended"]) == "Jul 27 14:41:58 combo sshd[1]: appended line"
+
+
+def test_loaded_log_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LoadedLogQuery(tmp_path / "missing.log")
+
+
+def test_loaded_log_impossible_date(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text("Jun 14 15:16:01 combo sshd[1]: first failure\n"
+                           "Feb 30 10:00:00 combo ftpd[2]: impossible date failure\n"
+                           "Jun 15 09:00:00 combo sshd[3]: last line\n")
+
+    log_query = LoadedLogQuery(syslog_file)
+
+    for query_filter in (QueryFilter(process="ftpd"), QueryFilter(keywords=["failure"]), QueryFilter()):
+        assert list(log_query.query(query_filter)) == list(LogFileQuery(syslog_file).query(query_filter))
+    # Only the queries on time decode the timestamp, as a scan of the file does
+    query_filter = QueryFilter(start_timestamp=datetime(2024, 6, 1))
+    with pytest.raises(ValueError):
+        list(LogFileQuery(syslog_file).query(query_filter))
+    with pytest.raises(ValueError):
+        list(log_query.query(query_filter))
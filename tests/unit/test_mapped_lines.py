@@ -0,0 +1,90 @@
+import os
+import sys
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager import mapped_lines
+from syslog_manager.mapped_lines import iter_blocks, iter_lines, lines_at
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+
+@pytest.fixture
+def sample_lines():
+    with open(SAMPLE_FILE, 'r') as f:
+        return f.readlines()
+
+
+@pytest.fixture(params=[1 << 20, 300], ids=['one block', 'many blocks'])
+def block_size(request, monkeypatch):
+    monkeypatch.setattr(mapped_lines, 'BLOCK_SIZE', request.param)
+    return request.param
+
+
+def test_iter_lines_matches_text_mode(block_size, sample_lines):
+    assert list(iter_lines(SAMPLE_FILE)) == sample_lines
+
+
+def test_iter_lines_range(block_size, sample_lines):
+    start = sum(map(len, sample_lines[:10]))
+    end = sum(map(len, sample_lines[:50]))
+
+    assert list(iter_lines(SAMPLE_FILE, start, end)) == sample_lines[10:50]
+
+
+@pytest.mark.parametrize("needles", [[b'ftpd'], [b'rhost=218.188.2.4'], [b'abnormally', b'ftpd'],
+                                     [b'nonexistent'], [b'session', b'sess'], [b''], []])
+@pytest.mark.parametrize("dense_match_ratio", [0, 8, 10 ** 6])
+def test_iter_lines_with_needles(monkeypatch, block_size, sample_lines, needles, dense_match_ratio):
+    # Covers both the decoded block and the located lines paths
+    monkeypatch.setattr(mapped_lines, 'DENSE_MATCH_RATIO', dense_match_ratio)
+    text_needles = [needle.decode() for needle in needles]
+
+    expected = [line for line in sample_lines if any(needle in line for needle in text_needles)]
+
+    assert list(iter_lines(SAMPLE_FILE, needles=needles)) == expected
+
+
+def test_iter_lines_translates_newlines(tmp_path):
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_bytes(b"first\r\nsecond\rthird\x0b\n\nlast")
+
+    with open(temp_file, 'r') as f:
+        assert list(iter_lines(temp_file)) == f.readlines()
+    assert list(iter_lines(temp_file, needles=[b'first', b'last'])) == ["first\n", "last"]
+
+
+def test_iter_blocks_holds_whole_lines(block_size, sample_lines):
+    with open(SAMPLE_FILE, 'rb') as f:
+        data = f.read()
+    start = sum(map(len, sample_lines[:10]))
+
+    blocks = list(iter_blocks(SAMPLE_FILE, start))
+
+    assert b"".join(blocks) == data[start:]
+    assert all(block.endswith(b"\n") for block in blocks[:-1])
+    if block_size < len(data):
+        assert len(blocks) > 1
+
+
+def test_iter_lines_empty_file(tmp_path):
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_bytes(b"")
+
+    assert list(iter_lines(temp_file)) == []
+    assert list(iter_lines(temp_file, needles=[b'a'])) == []
+    assert list(iter_blocks(temp_file)) == []
+
+
+def test_lines_at(sample_lines):
+    offsets = [0, sum(map(len, sample_lines[:3])), sum(map(len, sample_lines[:-1]))]
+
+    assert list(lines_at(SAMPLE_FILE, offsets)) == [sample_lines[0], sample_lines[3], sample_lines[-1]]
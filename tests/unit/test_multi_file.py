@@ -0,0 +1,219 @@
+import gzip
+import json
+import os
+import sys
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.count_event_per_process import count_event_per_process
+from syslog_manager.exporter import JSONLinesSyslogExporter
+from syslog_manager.hourly_report import count_events_per_hour
+from syslog_manager import multi_file
+from syslog_manager.log_query import LogFileQuery, MergedLogFileQuery, create_merged_log_query
+from syslog_manager.multi_file import as_paths, expand_inputs, iter_merged, timed, timed_lines
+from syslog_manager.parallel import scan_files
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.split_by_day import split_syslog_by_day
+
+OLDER_SYSLOG_DATA = """\
+Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 15:16:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 15 09:00:00 combo systemd[1]: Started Session 1 of user user1.
+"""
+
+NEWER_SYSLOG_DATA = """\
+Jun 14 08:00:00 combo systemd[1]: Started Session 2 of user user2.
+Jun 14 15:16:02 combo sshd(pam_unix)[19941]: Failed password for user2 from 192.168.0.2 port 22 ssh2
+Jun 16 10:00:00 combo sshd(pam_unix)[19942]: Accepted password for user2 from 192.168.0.2 port 22 ssh2
+"""
+
+MERGED_SYSLOG_DATA = """\
+Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Jun 14 08:00:00 combo systemd[1]: Started Session 2 of user user2.
+Jun 14 15:16:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 14 15:16:02 combo sshd(pam_unix)[19941]: Failed password for user2 from 192.168.0.2 port 22 ssh2
+Jun 15 09:00:00 combo systemd[1]: Started Session 1 of user user1.
+Jun 16 10:00:00 combo sshd(pam_unix)[19942]: Accepted password for user2 from 192.168.0.2 port 22 ssh2
+"""
+
+
+@pytest.fixture
+def syslog_files(tmp_path):
+    older = tmp_path / "syslog.2.log"
+    older.write_text(OLDER_SYSLOG_DATA)
+    newer = tmp_path / "syslog.1.log.gz"
+    newer.write_bytes(gzip.compress(NEWER_SYSLOG_DATA.encode('utf-8')))
+    return [older, newer]
+
+
+def scan_numbers(path, count):
+    # (key, item) pairs of every number of the file below count
+    with open(path) as f:
+        numbers = [int(line) for line in f]
+    return ((number, f"{os.path.basename(path)}:{number}") for number in numbers if number < count)
+
+
+def count_lines(lines):
+    return sum(1 for _ in lines)
+
+
+def fail_scan(path):
+    yield 1, path
+    raise ValueError(f"Cannot scan {path}")
+
+
+def test_expand_inputs_sorts_glob_matches_and_keeps_paths(tmp_path):
+    for name in ("b.log", "a.log", "c.txt"):
+        (tmp_path / name).write_text("")
+
+    assert expand_inputs([str(tmp_path / "*.log")]) == [str(tmp_path / "a.log"), str(tmp_path / "b.log")]
+    assert expand_inputs([str(tmp_path / "c.txt"), str(tmp_path / "*.*")]) == [
+        str(tmp_path / "c.txt"), str(tmp_path / "a.log"), str(tmp_path / "b.log")]
+    # Missing plain paths are left to the readers
+    assert expand_inputs([str(tmp_path / "missing.log")]) == [str(tmp_path / "missing.log")]
+    with pytest.raises(FileNotFoundError):
+        expand_inputs([str(tmp_path / "*.gz")])
+
+
+def test_as_paths():
+    assert as_paths("syslog.log") == ["syslog.log"]
+    assert as_paths(("a.log", "b.log")) == ["a.log", "b.log"]
+
+
+def test_timed_keeps_lines_without_timestamp_after_their_predecessor():
+    lines = ["Jun 14 15:16:01 combo a: x", "continued", "Feb 30 10:00:00 combo b: y", "Jun 14 15:16:03 combo c: z"]
+
+    epochs = [epoch for epoch, _ in timed(lines, 2024)]
+
+    assert epochs[0] == epochs[1] == epochs[2]
+    assert epochs[3] == epochs[0] + 2
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_iter_merged_merges_in_key_order(tmp_path, jobs):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("".join(f"{number}\n" for number in range(0, 5000, 2)))
+    second.write_text("".join(f"{number}\n" for number in range(1, 5000, 3)))
+
+    merged = list(iter_merged([first, second], scan_numbers, (3000,), jobs=jobs))
+
+    assert [int(item.split(':')[1]) for item in merged] == sorted(
+        list(range(0, 3000, 2)) + list(range(1, 3000, 3)))
+    # Equal keys keep the order of the paths
+    assert merged.index("first.txt:4") < merged.index("second.txt:4")
+
+
+def test_iter_merged_runs_at_most_jobs_workers(tmp_path, monkeypatch):
+    paths = []
+    for number in range(5):
+        path = tmp_path / f"{number}.txt"
+        path.write_text("".join(f"{value}\n" for value in range(number, 100, 5)) + "100\n")
+        paths.append(path)
+    started = []
+    context = multi_file.multiprocessing.get_context()
+
+    class CountingProcess(context.Process):
+        def start(self):
+            started.append(self)
+            super().start()
+
+    monkeypatch.setattr(context, 'Process', CountingProcess)
+    monkeypatch.setattr(multi_file.multiprocessing, 'get_context', lambda: context)
+
+    merged = list(iter_merged(paths, scan_numbers, (1000,), jobs=2))
+
+    assert len(started) == 2
+    assert [int(item.split(':')[1]) for item in merged] == list(range(100)) + [100] * 5
+    # Equal keys keep the order of the paths, across the groups of the workers too
+    assert [item for item in merged if item.endswith(":100")] == [f"{number}.txt:100" for number in range(5)]
+
+
+def test_iter_merged_stops_early_and_raises_worker_errors(tmp_path):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("".join(f"{number}\n" for number in range(100000)))
+    second.write_text("".join(f"{number}\n" for number in range(100000)))
+
+    merged = iter_merged([first, second], scan_numbers, (100000,), jobs=2)
+    assert next(merged) == "first.txt:0"
+    merged.close()
+
+    with pytest.raises(ValueError, match="Cannot scan"):
+        list(iter_merged([str(first), str(second)], fail_scan, jobs=2))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_timed_lines_of_rotated_files_merge_in_time_order(syslog_files, jobs):
+    merged = list(iter_merged(syslog_files, timed_lines, (2024,), jobs=jobs))
+
+    assert "".join(merged) == MERGED_SYSLOG_DATA
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_scan_files_covers_every_file(syslog_files, jobs):
+    assert sum(scan_files(syslog_files, count_lines, jobs=jobs)) == 6
+    assert scan_files([], count_lines, jobs=jobs) == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_merged_log_file_query(syslog_files, jobs):
+    log_query = create_merged_log_query([str(path) for path in syslog_files], jobs=jobs)
+
+    assert isinstance(log_query, MergedLogFileQuery)
+    assert list(log_query.query(QueryFilter(keywords=["password"]))) == [
+        line for line in MERGED_SYSLOG_DATA.splitlines() if "password" in line]
+    assert list(log_query.query(QueryFilter())) == MERGED_SYSLOG_DATA.splitlines()
+
+
+def test_create_merged_log_query(syslog_files, tmp_path):
+    assert isinstance(create_merged_log_query([str(syslog_files[0])]), LogFileQuery)
+    json_file = tmp_path / "syslog.json"
+    json_file.write_text("[]")
+    with pytest.raises(ValueError):
+        create_merged_log_query([str(syslog_files[0]), str(json_file)])
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_exporter_merges_input_files(syslog_files, tmp_path, streaming):
+    output_file = tmp_path / "output.jsonl"
+
+    JSONLinesSyslogExporter(syslog_files, streaming=streaming, jobs=2).export(output_file)
+
+    with open(output_file, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert [record['pid'] for record in records] == [19939, 1, 19940, 19941, 1, 19942]
+
+
+def test_counts_of_several_files(syslog_files):
+    for jobs in (1, 2):
+        assert dict(count_event_per_process(syslog_files, jobs=jobs)) == {'sshd(pam_unix)': 4, 'systemd': 2}
+        assert dict(count_events_per_hour(syslog_files, jobs=jobs)) == {15: 3, 9: 1, 8: 1, 10: 1}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_split_several_files(syslog_files, tmp_path, jobs):
+    output_dir = tmp_path / "days"
+
+    entries = split_syslog_by_day(syslog_files, jobs=jobs, output_dir=output_dir, manifest=True)
+
+    assert (output_dir / "syslog-2024-06-14.log").read_text() == "".join(
+        line + "\n" for line in MERGED_SYSLOG_DATA.splitlines() if line.startswith("Jun 14"))
+    with open(output_dir / "syslog-manifest.json", encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert manifest['sources'] == [str(path) for path in syslog_files]
+    assert manifest['days'] == entries
+    june_14 = entries[1]
+    assert june_14['lines'] == 3
+    # In the order of the first line of the day of every source
+    newer_range, older_range = june_14['ranges']
+    assert [newer_range['source'], older_range['source']] == [str(syslog_files[1]), str(syslog_files[0])]
+    older_data = syslog_files[0].read_bytes()
+    assert older_data[older_range['first_offset']:older_range['end_offset']] == (
+        OLDER_SYSLOG_DATA.splitlines(keepends=True)[1].encode('utf-8'))
@@ -0,0 +1,106 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.count_event_per_process import count_event_per_process
+from syslog_manager.hourly_report import count_events_per_hour
+from syslog_manager.log_query import LogFileQuery
+from syslog_manager.parallel import resolve_jobs, scan_file, split_ranges
+from syslog_manager.split_by_day import split_syslog_by_day
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+
+def count_lines(lines):
+    return sum(1 for _ in lines)
+
+
+@pytest.fixture
+def syslog_file(tmp_path):
+    # Out of time order, so between queries scan the whole file
+    with open(SAMPLE_FILE, 'r') as f:
+        lines = f.readlines()
+    temp_file = tmp_path / "syslog.log"
+    temp_file.write_text("".join(lines[len(lines) // 2:] + lines[:len(lines) // 2]))
+    return temp_file
+
+
+def test_split_ranges_start_at_line_starts(syslog_file):
+    data = syslog_file.read_bytes()
+    ranges = split_ranges(syslog_file, 7)
+
+    assert len(ranges) == 7
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start - 1:start] == b'\n'
+
+
+def test_split_ranges_small_and_empty_files(tmp_path):
+    small_file = tmp_path / "small.log"
+    small_file.write_text("a\nb\n")
+    empty_file = tmp_path / "empty.log"
+    empty_file.write_text("")
+
+    assert split_ranges(small_file, 8) == [(0, 2), (2, 4)]
+    assert split_ranges(empty_file, 8) == []
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(0) == (os.cpu_count() or 1)
+    assert resolve_jobs(3) == 3
+    with pytest.raises(ValueError):
+        resolve_jobs(-4)
+
+
+def test_scan_file_covers_every_line(syslog_file):
+    with open(syslog_file, 'r') as f:
+        expected = count_lines(f)
+
+    assert sum(scan_file(syslog_file, count_lines, jobs=3)) == expected
+    assert scan_file(syslog_file, count_lines, jobs=1) == [expected]
+
+
+def test_scan_file_with_needles(syslog_file):
+    with open(syslog_file, 'r') as f:
+        expected = sum(1 for line in f if 'ftpd' in line)
+
+    assert sum(scan_file(syslog_file, count_lines, jobs=3, needles=[b'ftpd'])) == expected
+    assert scan_file(syslog_file, count_lines, needles=[b'ftpd']) == [expected]
+
+
+def test_parallel_counts_match_sequential(syslog_file):
+    assert count_event_per_process(syslog_file, jobs=3) == count_event_per_process(syslog_file)
+    assert list(count_event_per_process(syslog_file, jobs=3)) == list(count_event_per_process(syslog_file))
+    assert count_events_per_hour(syslog_file, jobs=3) == count_events_per_hour(syslog_file)
+
+
+@pytest.mark.parametrize("query", [
+    lambda log_query: log_query.query_logs_by_process("sshd"),
+    lambda log_query: log_query.query_logs_by_words(["failure", "ftpd"]),
+    lambda log_query: log_query.query_logs_between_timestamps(datetime(2024, 6, 20), datetime(2024, 7, 1)),
+])
+def test_parallel_queries_match_sequential(syslog_file, query):
+    assert query(LogFileQuery(syslog_file, jobs=3)) == query(LogFileQuery(syslog_file))
+
+
+def test_parallel_split_matches_sequential(tmp_path, syslog_file):
+    split_syslog_by_day(syslog_file)
+    sequential = {path.name: path.read_text() for path in tmp_path.glob('syslog-*.log')}
+    for path in tmp_path.glob('syslog-*.log'):
+        path.unlink()
+
+    split_syslog_by_day(syslog_file, jobs=3)
+
+    assert {path.name: path.read_text() for path in tmp_path.glob('syslog-*.log')} == sequential
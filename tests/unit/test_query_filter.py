@@ -0,0 +1,131 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager import log_query as log_query_module
+from syslog_manager.exporter import (ColumnarSyslogExporter, CSVSyslogExporter, JSONLinesSyslogExporter,
+                                     JSONSyslogExporter)
+from syslog_manager.log_query import LogFileQuery, create_log_query
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.word_index import build_word_index
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+FILTERS = [
+    QueryFilter(process="sshd", keywords=["failure"], start_timestamp=datetime(2024, 6, 20),
+                end_timestamp=datetime(2024, 7, 1)),
+    QueryFilter(hostname="relay", process="ftpd"),
+    QueryFilter(hostname="relay", keywords=["session", "connection"], end_timestamp=datetime(2024, 6, 25)),
+    QueryFilter(start_timestamp=datetime(2024, 7, 10)),
+    QueryFilter(process="su", start_timestamp=datetime(2024, 6, 16), end_timestamp=datetime(2024, 6, 16)),
+    QueryFilter(),
+]
+
+
+def write_syslog(path, lines):
+    # Every third line comes from another host
+    path.write_text("".join(line.replace(" combo ", " relay ", 1) if number % 3 == 0 else line
+                            for number, line in enumerate(lines)))
+    return path
+
+
+def expected_logs(log_query, query_filter):
+    # Intersection of the single predicate queries, in file order
+    logs = list(log_query.query(QueryFilter()))
+    if query_filter.has_time_range():
+        start = query_filter.start_timestamp or datetime(1970, 1, 1)
+        end = query_filter.end_timestamp or datetime(2999, 1, 1)
+        in_range = set(log_query.iter_logs_between_timestamps(start, end))
+        logs = [log for log in logs if log in in_range]
+    if query_filter.process is not None:
+        from_process = set(log_query.iter_logs_by_process(query_filter.process))
+        logs = [log for log in logs if log in from_process]
+    if query_filter.keywords is not None:
+        with_words = set(log_query.iter_logs_by_words(query_filter.keywords))
+        logs = [log for log in logs if log in with_words]
+    if query_filter.hostname is not None:
+        logs = [log for log in logs if f" {query_filter.hostname} " in log or f"'{query_filter.hostname}'" in log
+                or f'"{query_filter.hostname}"' in log]
+    return logs
+
+
+@pytest.fixture(params=['log', 'unordered log', 'json', 'jsonl', 'csv', 'slc'])
+def input_file(request, tmp_path):
+    with open(SAMPLE_FILE, 'r') as f:
+        lines = f.readlines()
+    if request.param == 'unordered log':
+        lines = lines[len(lines) // 2:] + lines[:len(lines) // 2]
+    syslog_file = write_syslog(tmp_path / "syslog.log", lines)
+    exporters = {'json': JSONSyslogExporter, 'jsonl': JSONLinesSyslogExporter, 'csv': CSVSyslogExporter,
+                 'slc': ColumnarSyslogExporter}
+    if request.param not in exporters:
+        return syslog_file
+    output_file = tmp_path / f"syslog.{request.param}"
+    exporters[request.param](syslog_file).export(output_file)
+    return output_file
+
+
+@pytest.mark.parametrize("query_filter", FILTERS)
+def test_query_matches_every_predicate(input_file, query_filter):
+    log_query = create_log_query(input_file)
+
+    assert list(log_query.query(query_filter)) == expected_logs(log_query, query_filter)
+
+
+@pytest.mark.parametrize("query_filter", FILTERS[:3])
+def test_query_with_word_index(tmp_path, query_filter):
+    with open(SAMPLE_FILE, 'r') as f:
+        syslog_file = write_syslog(tmp_path / "syslog.log", f.readlines())
+    expected = list(create_log_query(syslog_file).query(query_filter))
+
+    build_word_index(syslog_file)
+
+    assert expected
+    assert list(create_log_query(syslog_file).query(query_filter)) == expected
+
+
+def test_query_parallel_matches_sequential(tmp_path):
+    with open(SAMPLE_FILE, 'r') as f:
+        lines = f.readlines()
+    syslog_file = write_syslog(tmp_path / "syslog.log", lines[len(lines) // 2:] + lines[:len(lines) // 2])
+
+    for query_filter in FILTERS:
+        assert (list(LogFileQuery(syslog_file, jobs=3).query(query_filter))
+                == list(LogFileQuery(syslog_file).query(query_filter)))
+
+
+def test_query_reads_most_selective_literals(monkeypatch, tmp_path):
+    with open(SAMPLE_FILE, 'r') as f:
+        syslog_file = write_syslog(tmp_path / "syslog.log", f.readlines())
+    used_needles = []
+    original_iter_lines = log_query_module.iter_lines
+
+    def iter_lines(path, start=0, end=None, needles=None):
+        used_needles.append(needles)
+        return original_iter_lines(path, start, end, needles)
+
+    monkeypatch.setattr(log_query_module, 'iter_lines', iter_lines)
+    query_filter = QueryFilter(hostname="combo", process="sshd", keywords=["218.188.2.4"],
+                               start_timestamp=datetime(2024, 6, 1))
+
+    list(create_log_query(syslog_file).query(query_filter))
+
+    assert used_needles == [[b"218.188.2.4"]]
+
+
+def test_empty_filters_read_nothing(tmp_path):
+    missing_file = tmp_path / "missing.log"
+
+    assert list(create_log_query(missing_file).query(QueryFilter(keywords=[]))) == []
+    assert list(create_log_query(missing_file).query(
+        QueryFilter(start_timestamp=datetime(2024, 6, 2), end_timestamp=datetime(2024, 6, 1)))) == []
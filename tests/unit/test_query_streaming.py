@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager import parallel
+from syslog_manager.exporter import JSONSyslogExporter
+from syslog_manager.log_query import create_log_query
+from syslog_manager.parallel import iter_scan_file
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+
+def lines_with(lines, needle):
+    return (line for line in lines if needle in line)
+
+
+@pytest.fixture
+def syslog_file(tmp_path):
+    temp_file = tmp_path / "syslog.log"
+    with open(SAMPLE_FILE, 'r') as f:
+        temp_file.write_text(f.read())
+    return temp_file
+
+
+@pytest.fixture
+def json_file(tmp_path, syslog_file):
+    output_file = tmp_path / "syslog.json"
+    JSONSyslogExporter(syslog_file).export(output_file)
+    return output_file
+
+
+@pytest.mark.parametrize("query", [
+    lambda log_query: log_query.query_logs_by_process("sshd"),
+    lambda log_query: log_query.query_logs_by_words(["failure"]),
+    lambda log_query: log_query.query_logs_between_timestamps(datetime(2024, 6, 20), datetime(2024, 7, 1)),
+])
+@pytest.mark.parametrize("input_file", ["syslog_file", "json_file"])
+def test_reused_query_does_not_accumulate(request, input_file, query):
+    log_query = create_log_query(request.getfixturevalue(input_file))
+
+    first = query(log_query)
+
+    assert first
+    assert query(log_query) == first
+
+
+def test_iter_logs_yields_lazily(syslog_file):
+    logs = create_log_query(syslog_file).iter_logs_by_process("sshd")
+
+    assert next(logs).startswith("Jun")
+    logs.close()
+
+
+def test_iter_logs_matches_query_logs(json_file):
+    log_query = create_log_query(json_file)
+
+    logs = list(log_query.iter_logs_by_words(["failure"]))
+
+    assert "\n".join(logs) == log_query.query_logs_by_words(["failure"])
+    assert all("failure" in json.loads(log)['message'] for log in logs)
+
+
+def test_iter_logs_missing_file_raises_on_iteration(tmp_path):
+    logs = create_log_query(tmp_path / "missing.log").iter_logs_by_process("sshd")
+
+    with pytest.raises(FileNotFoundError):
+        next(logs)
+
+
+def test_iter_scan_file_streams_ranges_in_order(monkeypatch, syslog_file):
+    monkeypatch.setattr(parallel, 'STREAM_RANGE_SIZE', 4096)
+    with open(syslog_file, 'r') as f:
+        expected = [line for line in f if 'ftpd' in line]
+
+    assert list(iter_scan_file(syslog_file, lines_with, ('ftpd',), jobs=2)) == expected
+    assert list(iter_scan_file(syslog_file, lines_with, ('ftpd',), needles=[b'ftpd'])) == expected
+
+
+def test_iter_scan_file_stops_early(monkeypatch, syslog_file):
+    monkeypatch.setattr(parallel, 'STREAM_RANGE_SIZE', 4096)
+    lines = iter_scan_file(syslog_file, lines_with, ('',), jobs=2)
+
+    with open(syslog_file, 'r') as f:
+        assert next(lines) == f.readline()
+    lines.close()
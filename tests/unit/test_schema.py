@@ -0,0 +1,111 @@
+import csv
+import os
+import sys
+
+import pytest
+from jsonschema import ValidationError, validate
+from pycsvschema.checker import Validator
+from pycsvschema.exceptions import ValidationError as CSVValidationError
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.exporter import CSVSyslogExporter, JSONSyslogExporter
+from syslog_manager.schema import compile_csv_schema, compile_json_schema
+
+SCHEMA = JSONSyslogExporter._create_schema(None)
+
+VALID_RECORD = {
+    "timestamp": "Jun 14 15:16:01",
+    "hostname": "combo",
+    "process": "sshd(pam_unix)",
+    "pid": 19939,
+    "message": "authentication failure"
+}
+
+
+def jsonschema_error(record, schema=SCHEMA):
+    try:
+        validate(instance=record, schema=schema)
+    except ValidationError as e:
+        return e.message
+    return None
+
+
+@pytest.mark.parametrize("record", [
+    VALID_RECORD,
+    dict(VALID_RECORD, pid=None),
+    dict(VALID_RECORD, pid=1.0),
+    {k: v for k, v in VALID_RECORD.items() if k != 'pid'},
+    dict(VALID_RECORD, pid="19939"),
+    dict(VALID_RECORD, pid=True),
+    dict(VALID_RECORD, hostname=1),
+    dict(VALID_RECORD, timestamp="2024-06-14 15:16:01"),
+    {k: v for k, v in VALID_RECORD.items() if k != 'message'},
+    ["not", "an", "object"]
+])
+def test_compiled_checker_agrees_with_jsonschema(record):
+    check_record = compile_json_schema(SCHEMA)
+    assert check_record(record) == jsonschema_error(record)
+
+
+def test_compiled_checker_falls_back_to_jsonschema_for_other_keywords():
+    schema = {"type": "object", "properties": {"pid": {"type": "integer", "minimum": 1}}}
+    check_record = compile_json_schema(schema)
+
+    assert check_record({"pid": 1}) is None
+    assert check_record({"pid": 0}) == jsonschema_error({"pid": 0}, schema)
+
+
+def test_compile_json_schema_rejects_invalid_schema():
+    with pytest.raises(Exception):
+        compile_json_schema({"type": "not-a-type"})
+
+
+CSV_HEADER = ['timestamp', 'hostname', 'process', 'pid', 'message']
+CSV_SCHEMA = CSVSyslogExporter._create_schema(None)
+
+
+def pycsvschema_error(row, tmp_path, schema=CSV_SCHEMA):
+    csv_file = tmp_path / "rows.csv"
+    with open(csv_file, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_HEADER)
+        writer.writeheader()
+        writer.writerow(row)
+    try:
+        Validator(csvfile=str(csv_file), schema=schema).validate()
+    except CSVValidationError as e:
+        return e.message
+    return None
+
+
+@pytest.mark.parametrize("row", [
+    VALID_RECORD,
+    dict(VALID_RECORD, pid=None),
+    dict(VALID_RECORD, pid="abc"),
+    dict(VALID_RECORD, message=""),
+    dict(VALID_RECORD, timestamp="2024-06-14 15:16:01"),
+    dict(VALID_RECORD, timestamp="")
+])
+def test_compiled_csv_checker_agrees_with_pycsvschema(row, tmp_path):
+    check_row = compile_csv_schema(CSV_SCHEMA, CSV_HEADER)
+    assert check_row(row) == pycsvschema_error(row, tmp_path)
+
+
+def test_compiled_csv_checker_falls_back_to_pycsvschema_for_other_options(tmp_path):
+    schema = {'fields': [{'name': 'pid', 'type': 'number', 'minimum': 10}]}
+    check_row = compile_csv_schema(schema, CSV_HEADER)
+
+    assert check_row(dict(VALID_RECORD, pid=19939)) is None
+    assert check_row(dict(VALID_RECORD, pid=1)) == pycsvschema_error(dict(VALID_RECORD, pid=1), tmp_path, schema)
+
+
+def test_compile_csv_schema_rejects_missing_required_field():
+    schema = {'fields': [{'name': 'facility', 'type': 'string', 'required': True}]}
+    with pytest.raises(ValueError, match="facility is a required field"):
+        compile_csv_schema(schema, CSV_HEADER)
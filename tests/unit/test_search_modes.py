@@ -0,0 +1,150 @@
+import json
+import os
+import re
+import sys
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager import log_query as log_query_module
+from syslog_manager.exporter import ColumnarSyslogExporter, CSVSyslogExporter, JSONSyslogExporter
+from syslog_manager.keywords import PATTERN_CACHE_SIZE, KeywordMatcher, compile_pattern, literal_prefix
+from syslog_manager.log_query import create_log_query
+from syslog_manager.query_filter import QueryFilter
+from syslog_manager.utility import parse_lines
+from syslog_manager.word_index import build_word_index
+
+SAMPLE_FILE = os.path.join(project_path, 'data', 'syslog_data.log')
+
+
+@pytest.mark.parametrize("pattern, prefix", [
+    (r"Failed password for (\w+)", "Failed password for "),
+    ("^session opened", "session opened"),
+    ("abc*", "ab"),
+    ("ab+c", "ab"),
+    (r"a\.b\d", "a.b"),
+    (r"\(x\)", "(x)"),
+    ("ab?", "a"),
+    ("a[b|c]", "a"),
+    ("x|y", ""),
+    ("abc|d", ""),
+    ("(a|b)c", ""),
+    ("[|]ab", ""),
+    ("(?i)abc", ""),
+    ("a{2}", ""),
+    ("", ""),
+])
+def test_literal_prefix(pattern, prefix):
+    assert literal_prefix(pattern) == prefix
+
+
+def test_compile_pattern_is_cached():
+    assert compile_pattern(r"ftpd\[\d+\]", re.IGNORECASE) is compile_pattern(r"ftpd\[\d+\]", re.IGNORECASE)
+    assert compile_pattern.cache_info().maxsize == PATTERN_CACHE_SIZE
+
+
+def test_keyword_matcher_modes():
+    assert KeywordMatcher([r"user\d"], regex=True)("Accepted password for user1")
+    assert not KeywordMatcher([r"user\d"], regex=True)("Accepted password for userX")
+    assert KeywordMatcher(["FAILURE"], ignore_case=True)("authentication failure;")
+    assert KeywordMatcher(["nope", "FAILURE"], ignore_case=True)("authentication failure;")
+    assert KeywordMatcher([r"^AUTH\w+"], regex=True, ignore_case=True)("authentication failure;")
+    assert not KeywordMatcher([], regex=True)("anything")
+
+
+def expected_lines(process=None, keywords=None, regex=False, ignore_case=False):
+    flags = re.IGNORECASE if ignore_case else 0
+    with open(SAMPLE_FILE, 'r') as f:
+        records = list(parse_lines(f))
+    if process is not None:
+        pattern = re.compile(process if regex else re.escape(process), flags)
+        records = [record for record in records if pattern.match(record.process)]
+    if keywords is not None:
+        patterns = [re.compile(keyword if regex else re.escape(keyword), flags) for keyword in keywords]
+        records = [record for record in records if any(pattern.search(record.message) for pattern in patterns)]
+    return records
+
+
+SEARCHES = [
+    dict(process=r"su\(pam_\w+\)", regex=True),
+    dict(process="SSHD", ignore_case=True),
+    dict(process=r"s\w+d", regex=True, ignore_case=True),
+    dict(keywords=[r"Failed password for (root|user\d)", r"rhost=218\.188\.\d+\.\d+"], regex=True),
+    dict(keywords=["AUTHENTICATION FAILURE", "Session Opened"], ignore_case=True),
+    dict(keywords=[r"session (opened|closed) for user \w+"], regex=True, ignore_case=True),
+    dict(keywords=[r"(ftpd|sshd)"], regex=True),
+    dict(process="ftpd", keywords=[r"connection from \d+"], regex=True),
+]
+
+
+@pytest.fixture(params=['log', 'indexed log', 'json', 'csv', 'slc'])
+def input_file(request, tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    with open(SAMPLE_FILE, 'r') as f:
+        syslog_file.write_text(f.read())
+    if request.param == 'indexed log':
+        build_word_index(syslog_file)
+    exporters = {'json': JSONSyslogExporter, 'csv': CSVSyslogExporter, 'slc': ColumnarSyslogExporter}
+    if request.param not in exporters:
+        return syslog_file
+    output_file = tmp_path / f"syslog.{request.param}"
+    exporters[request.param](syslog_file).export(output_file)
+    return output_file
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_search_modes(input_file, search):
+    expected = expected_lines(**search)
+
+    logs = list(create_log_query(input_file).query(QueryFilter(**search)))
+
+    assert expected
+    assert len(logs) == len(expected)
+    if input_file.suffix == '.log':
+        assert logs == [record.line.strip() for record in expected]
+    elif input_file.suffix != '.csv':
+        assert [json.loads(log)['message'].strip() for log in logs] == [record.message.strip() for record in expected]
+
+
+@pytest.mark.parametrize("search, needles", [
+    (dict(keywords=[r"Failed password for (root|user\d)"], regex=True), [b"Failed password for "]),
+    (dict(keywords=[r"Failed", r"(root|user\d)"], regex=True), None),
+    (dict(keywords=["failed"], ignore_case=True), None),
+    (dict(process=r"su\(pam", regex=True), [b"su(pam"]),
+])
+def test_regex_literal_prefix_prefilter(monkeypatch, tmp_path, search, needles):
+    syslog_file = tmp_path / "syslog.log"
+    with open(SAMPLE_FILE, 'r') as f:
+        syslog_file.write_text(f.read())
+    used_needles = []
+    original_scan = log_query_module.LogFileQuery._scan
+
+    def scan(self, scan_lines, *args, needles=None):
+        used_needles.append(needles)
+        return original_scan(self, scan_lines, *args, needles=needles)
+
+    monkeypatch.setattr(log_query_module.LogFileQuery, '_scan', scan)
+
+    list(create_log_query(syslog_file).query(QueryFilter(**search)))
+
+    assert used_needles == [needles]
+
+
+def test_query_logs_by_words_regex(tmp_path):
+    syslog_file = tmp_path / "syslog.log"
+    syslog_file.write_text("Jun 14 15:16:01 combo sshd[1]: Failed password for user1\n"
+                           "Jun 14 15:16:02 combo sshd[2]: failed PASSWORD for user2\n")
+
+    log_query = create_log_query(syslog_file)
+
+    assert log_query.query_logs_by_words([r"user\d"], regex=True).count("\n") == 1
+    assert log_query.query_logs_by_words(["FAILED PASSWORD"], ignore_case=True).count("\n") == 1
+    assert log_query.query_logs_by_words(["user."]) == ""
+    assert log_query.query_logs_by_process("SSH", ignore_case=True).count("\n") == 1
@@ -1,6 +1,10 @@
+import gzip
+import json
 import os
 import sys
 
+import pytest
+
 # Get the directory containing the current script
 script_dir = os.path.dirname(os.path.abspath(__file__))
 # Define the project path relative to the script directory
@@ -9,7 +13,8 @@ project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
 if project_path not in sys.path:
     sys.path.append(project_path)
 
-from syslog_manager.split_by_day import split_syslog_by_day
+from syslog_manager import split_by_day
+from syslog_manager.split_by_day import DayFilePool, split_syslog_by_day
 
 
 def write_syslog_to_temp_file(tmp_path, syslog_data):
@@ -152,3 +157,118 @@ Jan 01 00:00:01 combo sshd(pam_unix)[10001]: Log entry at the start of January
         lines = f.readlines()
         assert len(lines) == 1  # One log entry for January 1st
         assert lines[0] == "Jan 01 00:00:01 combo sshd(pam_unix)[10001]: Log entry at the start of January\n"
+
+
+INTERLEAVED_SYSLOG_DATA = """\
+Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1
+Jun 13 16:00:00 combo systemd[1]: Started Session 2 of user user2.
+not a syslog line
+Jun 15 16:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 14 17:00:00 combo systemd[1]: Started Session 3 of user user3.
+Jun 13 18:00:00 combo ftpd[1]: connection from 24.54.76.216"""
+
+
+@pytest.mark.parametrize("max_open_files", [1, 2, 64])
+def test_split_syslog_bounded_open_files(tmp_path, max_open_files):
+    temp_file = write_syslog_to_temp_file(tmp_path, INTERLEAVED_SYSLOG_DATA)
+    output_dir = tmp_path / "days"
+
+    split_syslog_by_day(temp_file, output_dir=output_dir, max_open_files=max_open_files)
+
+    lines = INTERLEAVED_SYSLOG_DATA.splitlines()
+    assert sorted(os.listdir(output_dir)) == ['syslog-2024-06-13.log', 'syslog-2024-06-14.log',
+                                              'syslog-2024-06-15.log']
+    for day in ('13', '14', '15'):
+        expected = "".join(line + "\n" for line in lines if line.startswith(f"Jun {day}"))
+        assert (output_dir / f'syslog-2024-06-{day}.log').read_text(encoding='utf-8') == expected
+    assert not list(tmp_path.glob('syslog-*.log'))
+
+
+def test_split_syslog_overwrites_previous_split(tmp_path):
+    temp_file = write_syslog_to_temp_file(tmp_path, INTERLEAVED_SYSLOG_DATA)
+    (tmp_path / 'syslog-2024-06-13.log').write_text("left from a previous split\n", encoding='utf-8')
+
+    split_syslog_by_day(temp_file, max_open_files=1)
+
+    assert "previous" not in (tmp_path / 'syslog-2024-06-13.log').read_text(encoding='utf-8')
+
+
+def test_day_file_pool_limits_open_files(tmp_path):
+    with DayFilePool(tmp_path, max_open_files=2) as pool:
+        for day in (0, 86400, 2 * 86400, 0):
+            pool.file(day).write(f"{day}\n")
+            assert len(pool._open_files) <= 2
+
+    assert (tmp_path / 'syslog-1970-01-01.log').read_text(encoding='utf-8') == "0\n0\n"
+    assert (tmp_path / 'syslog-1970-01-03.log').read_text(encoding='utf-8') == "172800\n"
+
+
+def test_day_file_pool_rejects_no_open_files(tmp_path):
+    with pytest.raises(ValueError):
+        DayFilePool(tmp_path, max_open_files=0)
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_split_syslog_manifest(tmp_path, jobs):
+    temp_file = write_syslog_to_temp_file(tmp_path, INTERLEAVED_SYSLOG_DATA)
+    output_dir = tmp_path / "days"
+
+    entries = split_syslog_by_day(temp_file, jobs=jobs, output_dir=output_dir, manifest=True)
+
+    with open(output_dir / 'syslog-manifest.json', encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert manifest['sources'] == [str(temp_file)]
+    assert manifest['days'] == entries
+    data = temp_file.read_bytes()
+    for entry in entries:
+        day_lines = (output_dir / entry['file']).read_bytes().splitlines(keepends=True)
+        assert entry['lines'] == len(day_lines)
+        assert entry['file_bytes'] == (output_dir / entry['file']).stat().st_size
+        # The first and last lines of the day start and end the range of input offsets
+        [source_range] = entry['ranges']
+        assert source_range['source'] == str(temp_file)
+        assert data[source_range['first_offset']:].startswith(day_lines[0])
+        # The last input line has no newline, the day file adds one
+        assert data[:source_range['end_offset']].rstrip(b'\n').endswith(day_lines[-1].rstrip(b'\n'))
+    assert [entry['date'] for entry in entries] == ['2024-06-13', '2024-06-14', '2024-06-15']
+    assert sum(entry['lines'] for entry in entries) == 7
+
+
+def test_split_syslog_gzip(tmp_path):
+    temp_file = write_syslog_to_temp_file(tmp_path, INTERLEAVED_SYSLOG_DATA)
+    plain_dir, gzip_dir = tmp_path / "plain", tmp_path / "gzip"
+
+    split_syslog_by_day(temp_file, output_dir=plain_dir)
+    entries = split_syslog_by_day(temp_file, output_dir=gzip_dir, compression='gzip', max_open_files=1)
+
+    assert sorted(os.listdir(gzip_dir)) == ['syslog-2024-06-13.log.gz', 'syslog-2024-06-14.log.gz',
+                                            'syslog-2024-06-15.log.gz']
+    for entry in entries:
+        with gzip.open(gzip_dir / entry['file'], 'rt', encoding='utf-8') as f:
+            assert f.read() == (plain_dir / entry['file'][:-len('.gz')]).read_text(encoding='utf-8')
+
+
+def test_compressed_day_writer_keeps_chunk_order(tmp_path):
+    lines = [(day, f"line {number} of day {day}\n") for number in range(50) for day in (0, 86400, 2 * 86400)]
+
+    with DayFilePool(tmp_path, max_open_files=2, compression='gzip') as pool:
+        # Every line is compressed on its own, and the buffer of a day is compressed once two others are written
+        with split_by_day.CompressedDayWriter(pool, threads=3, chunk_size=1) as writer:
+            for day, line in lines[:30]:
+                writer.write(day, line)
+        with split_by_day.CompressedDayWriter(pool, threads=2, chunk_size=1 << 20) as writer:
+            for day, line in lines[30:]:
+                writer.write(day, line)
+
+    for day, name in ((0, 'syslog-1970-01-01.log.gz'), (2 * 86400, 'syslog-1970-01-03.log.gz')):
+        with gzip.open(tmp_path / name, 'rt', encoding='utf-8') as f:
+            assert f.read() == "".join(line for line_day, line in lines if line_day == day)
+
+
+def test_split_syslog_unknown_compression(tmp_path):
+    temp_file = write_syslog_to_temp_file(tmp_path, INTERLEAVED_SYSLOG_DATA)
+
+    with pytest.raises(ValueError):
+        split_syslog_by_day(temp_file, compression='zip')
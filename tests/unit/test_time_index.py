@@ -0,0 +1,122 @@
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.log_query import create_log_query
+from syslog_manager.time_index import build_time_index, open_time_index, time_index_path
+from syslog_manager.timestamps import TimestampDecoder, epoch_day
+
+
+@pytest.fixture
+def ordered_syslog_file(tmp_path):
+    syslog_data = """Jun 13 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Invalid line without the correct format
+Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2
+Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.
+Jun 15 15:19:04 combo sshd(pam_unix)[19941]: Failed password for user1 from 192.168.0.2 port 22 ssh2
+Jun 16 10:00:00 combo systemd[1]: Started Session 2 of user user2.
+Jul  1 10:00:00 combo systemd[1]: Started Session 3 of user user2.
+"""
+    temp_file = tmp_path / "syslog_data.log"
+    temp_file.write_text(syslog_data)
+    return temp_file
+
+
+def test_build_time_index(ordered_syslog_file):
+    year = datetime.now().year
+    time_index = build_time_index(ordered_syslog_file, TimestampDecoder(year), interval=2)
+
+    lines = ordered_syslog_file.read_bytes().splitlines(keepends=True)
+    assert time_index.ordered
+    assert time_index.year == year
+    assert time_index.days == [epoch_day(date(year, 6, 13)), epoch_day(date(year, 6, 14)),
+                               epoch_day(date(year, 6, 16))]
+    assert time_index.offsets == [0, sum(map(len, lines[:3])), sum(map(len, lines[:5]))]
+    assert time_index.start_offset(epoch_day(date(year, 6, 15))) == sum(map(len, lines[:3]))
+    assert time_index.start_offset(epoch_day(date(year, 1, 1))) == 0
+
+
+def test_unordered_file_is_not_indexed(tmp_path):
+    temp_file = tmp_path / "syslog_data.log"
+    temp_file.write_text("""Jun 14 15:17:02 combo systemd[1]: Started Session 1 of user user1.
+Jun 13 15:16:01 combo systemd[1]: Started Session 2 of user user1.
+Jun 15 15:16:01 combo systemd[1]: Started Session 3 of user user1.
+""")
+
+    time_index = build_time_index(temp_file)
+
+    assert not time_index.ordered
+    result = create_log_query(temp_file).query_logs_between_timestamps(datetime(2024, 6, 13), datetime(2024, 6, 13))
+    assert result == "Jun 13 15:16:01 combo systemd[1]: Started Session 2 of user user1."
+
+
+@pytest.mark.parametrize("start_date, end_date", [
+    (datetime(2024, 6, 14), datetime(2024, 6, 15)),
+    (datetime(2024, 6, 16), datetime(2024, 7, 31)),
+    (datetime(2023, 1, 1), datetime(2024, 6, 13)),
+    (datetime(2024, 6, 17), datetime(2024, 6, 30)),
+    (datetime(2024, 7, 1), datetime(2024, 6, 1)),
+    (datetime(2025, 6, 14), datetime(2025, 6, 15)),
+])
+def test_indexed_query_matches_scan(ordered_syslog_file, start_date, end_date):
+    # Expected results of a full scan, written out with the date filter applied line by line
+    year = datetime.now().year
+    expected = [line for line in ordered_syslog_file.read_text().splitlines()
+                if line[:3] in ('Jun', 'Jul')
+                and start_date.date() <= datetime.strptime(f"{line[:6]} {year}", "%b %d %Y").date() <= end_date.date()]
+
+    result = create_log_query(ordered_syslog_file).query_logs_between_timestamps(start_date, end_date)
+
+    assert result == "\n".join(expected)
+
+
+def test_time_index_is_saved_on_first_use(ordered_syslog_file):
+    assert open_time_index(ordered_syslog_file, datetime.now().year) is None
+
+    create_log_query(ordered_syslog_file).query_logs_between_timestamps(datetime(2024, 6, 14), datetime(2024, 6, 14))
+
+    assert os.path.exists(time_index_path(ordered_syslog_file))
+    assert open_time_index(ordered_syslog_file, datetime.now().year).ordered
+
+
+def test_stale_time_index_is_rebuilt(ordered_syslog_file):
+    create_log_query(ordered_syslog_file).query_logs_between_timestamps(datetime(2024, 6, 14), datetime(2024, 6, 14))
+
+    with open(ordered_syslog_file, 'a') as f:
+        f.write("Jul  2 10:00:00 combo systemd[1]: Started Session 4 of user user2.\n")
+
+    assert open_time_index(ordered_syslog_file, datetime.now().year) is None
+    result = create_log_query(ordered_syslog_file).query_logs_between_timestamps(datetime(2024, 7, 2), datetime(2024, 7, 2))
+    assert result == "Jul  2 10:00:00 combo systemd[1]: Started Session 4 of user user2."
+
+
+@pytest.mark.parametrize("content", ["", '{"version": 2, "sour', "not json", "[]", '{"version": 2}'])
+def test_corrupt_time_index_is_rebuilt(ordered_syslog_file, content):
+    with open(time_index_path(ordered_syslog_file), 'w') as f:
+        f.write(content)
+
+    assert open_time_index(ordered_syslog_file, datetime.now().year) is None
+    result = create_log_query(ordered_syslog_file).query_logs_between_timestamps(datetime(2024, 6, 14), datetime(2024, 6, 14))
+    assert result == ("Jun 14 15:17:02 combo sshd(pam_unix)[19940]: Accepted password for user1 from 192.168.0.1 port 22 ssh2\n"
+                      "Jun 14 15:18:03 combo systemd[1]: Started Session 1 of user user1.")
+    assert open_time_index(ordered_syslog_file, datetime.now().year).ordered
+
+
+def test_time_index_save_leaves_no_temporary_file(ordered_syslog_file, tmp_path):
+    time_index = build_time_index(ordered_syslog_file)
+
+    time_index.save(time_index_path(ordered_syslog_file))
+    time_index.save(time_index_path(ordered_syslog_file))
+
+    assert sorted(os.listdir(tmp_path)) == ["syslog_data.log", "syslog_data.log.time.idx"]
+    assert open_time_index(ordered_syslog_file, time_index.year).offsets == time_index.offsets
@@ -0,0 +1,46 @@
+import os
+import sys
+from datetime import date, datetime, timezone
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.timestamps import TimestampDecoder, epoch_day, epoch_to_date
+
+
+@pytest.mark.parametrize("timestamp", ["Jun 14 15:16:01", "Jan  1 00:00:00", "Dec 31 23:59:59", "feb 29 12:30:45"])
+def test_decoder_matches_strptime(timestamp):
+    expected = datetime.strptime(f"{timestamp} 2024", "%b %d %H:%M:%S %Y").replace(tzinfo=timezone.utc)
+
+    assert TimestampDecoder(2024)(timestamp) == int(expected.timestamp())
+
+
+@pytest.mark.parametrize("timestamp", ["Feb 29 10:00:00", "Jun 31 10:00:00", "Foo 12 10:00:00",
+                                       "Jun 14 24:00:00", "Jun 14 10:60:00", "Jun 14 10:00:60"])
+def test_decoder_rejects_what_strptime_rejects(timestamp):
+    with pytest.raises(ValueError):
+        datetime.strptime(f"{timestamp} 2023", "%b %d %H:%M:%S %Y")
+    with pytest.raises(ValueError):
+        TimestampDecoder(2023)(timestamp)
+
+
+def test_decoder_resolves_the_current_year_once():
+    decoder = TimestampDecoder()
+
+    assert decoder.year == datetime.now().year
+    assert epoch_to_date(decoder.day_start("Jun 14 15:16:01")) == date(decoder.year, 6, 14)
+
+
+def test_day_start():
+    decoder = TimestampDecoder(2024)
+
+    assert decoder.day_start("Jun 14 15:16:01") == epoch_day(date(2024, 6, 14))
+    assert decoder.day_start("Jun 14 00:00:00") == decoder("Jun 14 00:00:00")
+    assert decoder("Jun 14 15:16:01") - decoder.day_start("Jun 14 15:16:01") == 15 * 3600 + 16 * 60 + 1
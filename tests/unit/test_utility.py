@@ -11,7 +11,7 @@ project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
 if project_path not in sys.path:
     sys.path.append(project_path)
 
-from syslog_manager.utility import parse_syslog_line
+from syslog_manager.utility import parse_syslog_line, parse_lines
 
 
 def test_valid_syslog_line_with_pid():
@@ -78,3 +78,40 @@ def test_empty_line():
 ])
 def test_various_cases(line, expected):
     assert parse_syslog_line(line) == expected
+
+
+def test_parse_lines_returns_records():
+    lines = [
+        "Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure\n",
+        "This is not a syslog line\n",
+        "Jun 14 15:16:02 combo kernel: message without pid\n"
+    ]
+    records = list(parse_lines(lines))
+
+    assert len(records) == 2
+    assert records[0].to_dict() == {
+        'timestamp': 'Jun 14 15:16:01',
+        'hostname': 'combo',
+        'process': 'sshd(pam_unix)',
+        'pid': '19939',
+        'message': 'authentication failure'
+    }
+    assert records[0].line == lines[0]
+    assert records[1].process == 'kernel'
+    assert records[1].pid is None
+    assert records[1].message == 'message without pid'
+
+
+def test_parse_lines_matches_parse_syslog_line():
+    lines = [
+        "Jul 20 12:00:00 myhost myproc[12345]: test message",
+        "Aug 30 08:59:59 yourhost yourproc: another test message",
+        "2024-09-04 12:34:56 combo sshd: authentication failure",
+        ""
+    ]
+    expected = [parse_syslog_line(line) for line in lines if parse_syslog_line(line)]
+    assert [record.to_dict() for record in parse_lines(lines)] == expected
+
+
+def test_parse_lines_empty_input():
+    assert list(parse_lines([])) == []
@@ -0,0 +1,93 @@
+import os
+import sys
+
+import pytest
+
+# Get the directory containing the current script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Define the project path relative to the script directory
+project_path = os.path.abspath(os.path.join(script_dir, '..', '..'))
+# Add the project path to sys.path
+if project_path not in sys.path:
+    sys.path.append(project_path)
+
+from syslog_manager.log_query import create_log_query
+from syslog_manager.word_index import build_word_index, open_word_index, word_index_path
+
+
+@pytest.fixture
+def syslog_file(tmp_path):
+    syslog_data = """Jun 14 15:16:01 combo sshd(pam_unix)[19939]: authentication failure; logname= uid=0 euid=0 tty=NODEVssh ruser= rhost=218.188.2.4
+Invalid line without the correct format failure
+Jun 14 15:16:02 combo sshd(pam_unix)[19940]: Accepted password for root from 218.188.2.4 port 22 ssh2
+Jun 14 15:16:03 combo sshd(pam_unix)[19941]: Failed password for invalid user admin from 218.188.2.4 port 22 ssh2
+"""
+    temp_file = tmp_path / "syslog_data.log"
+    temp_file.write_text(syslog_data)
+    return temp_file
+
+
+def test_build_word_index_offsets(syslog_file):
+    build_word_index(syslog_file)
+
+    lines = syslog_file.read_bytes().splitlines(keepends=True)
+    with open_word_index(syslog_file) as word_index:
+        offsets = word_index.candidate_offsets(["password"])
+
+    assert offsets == [len(lines[0]) + len(lines[1]), len(lines[0]) + len(lines[1]) + len(lines[2])]
+
+
+def test_candidates_for_partial_words(syslog_file):
+    build_word_index(syslog_file)
+
+    with open_word_index(syslog_file) as word_index:
+        assert len(word_index.candidate_offsets(["ail"])) == 2
+        assert len(word_index.candidate_offsets(["rhost=218.188"])) == 1
+        assert word_index.candidate_offsets(["nonexistent"]) == []
+        # Keywords without word characters cannot be looked up
+        assert word_index.candidate_offsets([";"]) is None
+
+
+@pytest.mark.parametrize("keywords", [["failure"], ["ail"], ["password for r"], ["d for"], [";"], ["nonexistent"], []])
+def test_indexed_query_matches_scan(syslog_file, keywords):
+    expected = create_log_query(syslog_file).query_logs_by_words(keywords)
+
+    build_word_index(syslog_file)
+
+    assert create_log_query(syslog_file).query_logs_by_words(keywords) == expected
+
+
+def test_stale_word_index_is_ignored(syslog_file):
+    build_word_index(syslog_file)
+
+    with open(syslog_file, 'a') as f:
+        f.write("Jun 14 15:16:04 combo sshd(pam_unix)[19942]: session failure for user admin\n")
+
+    assert open_word_index(syslog_file) is None
+    result = create_log_query(syslog_file).query_logs_by_words(["failure"])
+    assert "session failure" in result
+
+
+def test_missing_word_index(syslog_file):
+    assert not os.path.exists(word_index_path(syslog_file))
+    assert open_word_index(syslog_file) is None
+
+
+@pytest.mark.parametrize("size", [0, 10, -1])
+def test_unreadable_word_index_is_ignored(syslog_file, size):
+    expected = create_log_query(syslog_file).query_logs_by_words(["failure"])
+    build_word_index(syslog_file)
+    with open(word_index_path(syslog_file), 'r+b') as f:
+        f.truncate(len(f.read()[:size]))
+
+    assert open_word_index(syslog_file) is None
+    assert create_log_query(syslog_file).query_logs_by_words(["failure"]) == expected
+
+
+def test_build_word_index_leaves_no_temporary_file(syslog_file, tmp_path):
+    build_word_index(syslog_file)
+    build_word_index(syslog_file)
+
+    assert sorted(os.listdir(tmp_path)) == sorted([syslog_file.name, os.path.basename(word_index_path(syslog_file))])
+    with open_word_index(syslog_file) as word_index:
+        assert len(word_index.candidate_offsets(["password"])) == 2